@@ -4,41 +4,115 @@ Loads environment variables and provides configuration access
 """
 
 import os
+import functools
+from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Tuple
 
-# Load environment variables from .env file
-env_path = Path(__file__).parent / '.env'
-if env_path.exists():
-    load_dotenv(env_path)
-    print(f"✓ Loaded configuration from {env_path}")
-else:
-    print(f"⚠ No .env file found at {env_path}")
-    print(f"  Create one by copying .env.example and adding your API key")
+
+@dataclass(frozen=True)
+class Config:
+    """Parsed configuration values, computed once per process."""
+    gemini_api_key: str
+    gemini_model: str
+    gemini_temperature: float
+    gemini_max_tokens: int
+    server_port: int
+    debug_mode: bool
+    access_log: bool
+    issues: Tuple[str, ...]
+
+
+# (environment variable, Config field, type, default)
+CONFIG_SCHEMA = (
+    ('GEMINI_API_KEY', 'gemini_api_key', str, ''),
+    ('GEMINI_MODEL', 'gemini_model', str, 'gemini-1.5-flash'),
+    ('GEMINI_TEMPERATURE', 'gemini_temperature', float, '0.7'),
+    ('GEMINI_MAX_TOKENS', 'gemini_max_tokens', int, '2048'),
+    ('SERVER_PORT', 'server_port', int, '8000'),
+    ('DEBUG_MODE', 'debug_mode', bool, 'true'),
+    ('ACCESS_LOG', 'access_log', bool, 'true'),
+)
+
+_BOOL_VALUES = {'true': True, '1': True, 'yes': True, 'false': False, '0': False, 'no': False}
+
+
+def _coerce(name: str, raw: str, value_type: type):
+    """Convert a raw environment string to value_type, raising ValueError if it is malformed."""
+    if value_type is bool:
+        try:
+            return _BOOL_VALUES[raw.strip().lower()]
+        except KeyError:
+            raise ValueError(f"Invalid {name}={raw!r}: expected true or false")
+    try:
+        value = value_type(raw)
+    except ValueError:
+        raise ValueError(f"Invalid {name}={raw!r}: expected {value_type.__name__}")
+    if name == 'SERVER_PORT' and not 0 < value < 65536:
+        raise ValueError(f"Invalid {name}={raw!r}: expected a port between 1 and 65535")
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def load_config() -> Config:
+    """
+    Load the .env file and environment variables into a Config.
+    
+    Malformed values abort the process with SystemExit. Set CONFIG_STRICT=0
+    to fall back to the defaults and report them as issues instead.
+    """
+    # Load environment variables from .env file
+    env_path = Path(__file__).parent / '.env'
+    if env_path.exists():
+        # Imported here so runs without a .env file never load python-dotenv
+        from dotenv import load_dotenv
+        load_dotenv(env_path)
+        print(f"✓ Loaded configuration from {env_path}")
+    else:
+        print(f"⚠ No .env file found at {env_path}")
+        print(f"  Create one by copying .env.example and adding your API key")
+    
+    strict = os.getenv('CONFIG_STRICT', '1') == '1'
+    values = {}
+    issues = []
+    
+    for name, field, value_type, default in CONFIG_SCHEMA:
+        raw = os.getenv(name, default)
+        try:
+            values[field] = _coerce(name, raw, value_type)
+        except ValueError as e:
+            if strict:
+                raise SystemExit(f"✗ Configuration error: {e}")
+            issues.append(f"{e} (using default {default!r})")
+            values[field] = _coerce(name, default, value_type)
+    
+    if not values['gemini_api_key']:
+        issues.append("GEMINI_API_KEY is not set")
+    
+    return Config(issues=tuple(issues), **values)
+
+
+CFG = load_config()
 
 # Gemini API Configuration
-GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
-GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
-GEMINI_TEMPERATURE = float(os.getenv('GEMINI_TEMPERATURE', '0.7'))
-GEMINI_MAX_TOKENS = int(os.getenv('GEMINI_MAX_TOKENS', '2048'))
+GEMINI_API_KEY = CFG.gemini_api_key
+GEMINI_MODEL = CFG.gemini_model
+GEMINI_TEMPERATURE = CFG.gemini_temperature
+GEMINI_MAX_TOKENS = CFG.gemini_max_tokens
 
 # Server Configuration
-SERVER_PORT = int(os.getenv('SERVER_PORT', '8000'))
-DEBUG_MODE = os.getenv('DEBUG_MODE', 'true').lower() == 'true'
+SERVER_PORT = CFG.server_port
+DEBUG_MODE = CFG.debug_mode
+ACCESS_LOG = CFG.access_log
 
 # Validation
 def validate_config():
     """Validate that required configuration is present."""
-    issues = []
-    
-    if not GEMINI_API_KEY:
-        issues.append("GEMINI_API_KEY is not set")
-    
-    if issues:
+    if CFG.issues:
         print("\n" + "="*80)
         print("⚠ CONFIGURATION ISSUES")
         print("="*80)
-        for issue in issues:
+        for issue in CFG.issues:
             print(f"  • {issue}")
         print("\nTo fix:")
         print("  1. Copy .env.example to .env")
@@ -51,7 +125,7 @@ def validate_config():
 
 def is_gemini_enabled():
     """Check if Gemini API is configured and available."""
-    return bool(GEMINI_API_KEY)
+    return bool(CFG.gemini_api_key)
 
 if __name__ == "__main__":
     print("\n" + "="*80)
@@ -3,10 +3,52 @@ Gemini API Integration for Intelligent Task Generation
 Uses Google's Gemini API to enhance task proposals with AI
 """
 
+import asyncio
 import json
+import math
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 import config
+from incident_task import Task
+
+
+try:
+    # orjson parses str or bytes; its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Number of Gemini task responses kept in memory, keyed by prompt
+RESPONSE_CACHE_SIZE = 256
+
+# Kept-alive connections to the Gemini API; every team may call it at once
+CONNECTION_POOL_SIZE = 32
+
+
+def _as_number(value: Any, default: float) -> float:
+    """
+    Coerce a number from a Gemini response, which may arrive as a string.
+    
+    Args:
+        value: Value from the parsed response
+        default: Value to use when it is missing, not numeric or not finite
+        
+    Returns:
+        The number, as an int when it is whole
+    """
+    if value is None or isinstance(value, bool):
+        return default
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return default
+    if not math.isfinite(number):
+        return default
+    return int(number) if number.is_integer() else number
 
 
 class GeminiTaskEnhancer:
@@ -20,6 +62,12 @@ class GeminiTaskEnhancer:
         self.model = config.GEMINI_MODEL
         self.api_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
         self.enabled = config.is_gemini_enabled()
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        
+        # One session reuses TLS connections across calls instead of a handshake per request
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(pool_maxsize=CONNECTION_POOL_SIZE))
         
         print(f"\n{'='*80}")
         print("GEMINI API INTEGRATION")
@@ -35,7 +83,7 @@ class GeminiTaskEnhancer:
     
     def enhance_task_proposals(self, team_name: str, team_expertise: List[str], 
                                incident_description: str, 
-                               base_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                               base_tasks: List[Task]) -> List[Task]:
         """
         Use Gemini to enhance or generate additional task proposals.
         
@@ -77,9 +125,33 @@ class GeminiTaskEnhancer:
             print(f"  → Falling back to base tasks")
             return base_tasks
     
+    async def enhance_task_proposals_async(self, team_name: str, team_expertise: List[str],
+                                           incident_description: str,
+                                           base_tasks: List[Task]) -> List[Task]:
+        """
+        Enhance task proposals without blocking the event loop.
+        
+        The HTTP client is synchronous, so the request runs in the loop's
+        default executor and several teams can wait on Gemini at once.
+        
+        Args:
+            team_name: Name of the team
+            team_expertise: List of team's expertise areas
+            incident_description: Description of the incident
+            base_tasks: Tasks already generated by rule-based system
+            
+        Returns:
+            Enhanced or additional tasks
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, self.enhance_task_proposals,
+            team_name, team_expertise, incident_description, base_tasks
+        )
+    
     def _generate_additional_tasks(self, team_name: str, team_expertise: List[str],
                                    incident_description: str,
-                                   base_tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+                                   base_tasks: List[Task]) -> List[Task]:
         """Generate additional tasks using Gemini API."""
         
         # Create prompt for Gemini
@@ -87,13 +159,17 @@ class GeminiTaskEnhancer:
             team_name, team_expertise, incident_description, base_tasks
         )
         
-        print(f"  [Gemini] Sending request to API...")
-        
-        # Call Gemini API
-        response = self._call_gemini_api(prompt)
-        
-        if not response:
-            return []
+        # Call Gemini API, unless the same prompt was answered recently
+        response = self._get_cached_response(prompt)
+        if response is None:
+            print(f"  [Gemini] Sending request to API...")
+            response = self._call_gemini_api(prompt)
+            
+            if not response:
+                return []
+            self._cache_response(prompt, response)
+        else:
+            print(f"  [Gemini] Using cached response")
         
         print(f"  [Gemini] Received response, parsing tasks...")
         
@@ -102,12 +178,28 @@ class GeminiTaskEnhancer:
         
         return additional_tasks
     
+    def _get_cached_response(self, prompt: str) -> Optional[str]:
+        """Return the cached response text for a prompt, marking it recently used."""
+        with self._cache_lock:
+            response = self._response_cache.get(prompt)
+            if response is not None:
+                self._response_cache.move_to_end(prompt)
+            return response
+    
+    def _cache_response(self, prompt: str, response: str):
+        """Remember a response, evicting the least recently used one when full."""
+        with self._cache_lock:
+            self._response_cache[prompt] = response
+            self._response_cache.move_to_end(prompt)
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
     def _create_task_generation_prompt(self, team_name: str, team_expertise: List[str],
                                        incident_description: str,
-                                       base_tasks: List[Dict[str, Any]]) -> str:
+                                       base_tasks: List[Task]) -> str:
         """Create a prompt for Gemini to generate tasks."""
         
-        base_task_descriptions = [f"- {task['description']}" for task in base_tasks]
+        base_task_descriptions = [f"- {task.description}" for task in base_tasks]
         base_tasks_text = "\n".join(base_task_descriptions) if base_tasks else "None yet"
         
         prompt = f"""You are an expert incident response coordinator. 
@@ -170,12 +262,12 @@ If no additional tasks are needed, return an empty array: []
         
         try:
             url = f"{self.api_url}?key={self.api_key}"
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self._session.post(url, headers=headers, json=payload, timeout=30)
             
             print(f"  [Gemini] API Status: {response.status_code}")
             
             if response.status_code == 200:
-                data = response.json()
+                data = _json_loads(response.content)
                 
                 if 'candidates' in data and len(data['candidates']) > 0:
                     text = data['candidates'][0]['content']['parts'][0]['text']
@@ -195,7 +287,7 @@ If no additional tasks are needed, return an empty array: []
             print(f"  [Gemini] Exception: {str(e)}")
             return None
     
-    def _parse_gemini_response(self, response_text: str, team_name: str) -> List[Dict[str, Any]]:
+    def _parse_gemini_response(self, response_text: str, team_name: str) -> List[Task]:
         """Parse Gemini's response into task objects."""
         
         print(f"  [Gemini] Parsing response...")
@@ -210,7 +302,7 @@ If no additional tasks are needed, return an empty array: []
                 json_text = '\n'.join(lines[1:-1])
             
             # Parse JSON
-            gemini_tasks = json.loads(json_text)
+            gemini_tasks = _json_loads(json_text)
             
             if not isinstance(gemini_tasks, list):
                 print(f"  [Gemini] Response is not a list, skipping")
@@ -221,20 +313,24 @@ If no additional tasks are needed, return an empty array: []
             # Convert to our task format
             tasks = []
             for i, gemini_task in enumerate(gemini_tasks, 1):
-                task = {
-                    'task_id': f"{team_name.replace(' ', '_')}_GEMINI_{i:02d}",
-                    'description': gemini_task.get('description', 'AI-suggested task'),
-                    'importance': gemini_task.get('importance', 5),
-                    'estimated_hours': gemini_task.get('estimated_hours', 2),
-                    'tentative_deadline': None,  # Will be set by caller
-                    'assigned_to': 'TBD',
-                    'dependencies': [],
-                    'source': 'gemini',
-                    'justification': gemini_task.get('justification', '')
-                }
+                if not isinstance(gemini_task, dict):
+                    print(f"    • Task {i}: not an object, skipping")
+                    continue
+                
+                # Coerce fields to Task types so sorting and hour totals never mix str and int
+                task = Task(
+                    task_id=f"{team_name.replace(' ', '_')}_GEMINI_{i:02d}",
+                    description=str(gemini_task.get('description') or 'AI-suggested task'),
+                    importance=int(_as_number(gemini_task.get('importance'), 5)),
+                    estimated_hours=_as_number(gemini_task.get('estimated_hours'), 2),
+                    tentative_deadline=None,  # Will be set by caller
+                    assigned_to='TBD',
+                    source='gemini',
+                    justification=str(gemini_task.get('justification') or '')
+                )
                 tasks.append(task)
                 
-                print(f"    • Task {i}: {task['description'][:50]}... (Priority: {task['importance']})")
+                print(f"    • Task {i}: {task.description[:50]}... (Priority: {task.importance})")
             
             return tasks
             
@@ -292,7 +388,7 @@ Respond in JSON format:
                     lines = json_text.split('\n')
                     json_text = '\n'.join(lines[1:-1])
                 
-                analysis = json.loads(json_text)
+                analysis = _json_loads(json_text)
                 print(f"  ✓ Severity: {analysis.get('severity', 'unknown')}")
                 print(f"  ✓ Impact: {', '.join(analysis.get('impact_areas', []))}")
                 return analysis
@@ -95,7 +95,7 @@ def run_demo():
             print(f"      {task['description']}")
             print(f"      Assigned: {task['assigned_to']} | "
                   f"Est: {task['estimated_hours']}h | "
-                  f"Due: {task['tentative_deadline'].strftime('%Y-%m-%d %H:%M')}")
+                  f"Due: {task['tentative_deadline'][:16].replace('T', ' ')}")
             
             if task.get('dependencies'):
                 print(f"      Dependencies: {', '.join(task['dependencies'])}")
@@ -110,9 +110,10 @@ def run_demo():
     print(f"Edges: {len(graph['edges'])}")
     
     print("\nTask → Incident Connections (showing importance weights):")
+    node_by_id = {node['id']: node for node in graph['nodes']}
     for edge in graph['edges']:
         if edge['to'] == 'INCIDENT' and edge.get('type') != 'dependency':
-            task_node = next((n for n in graph['nodes'] if n['id'] == edge['from']), None)
+            task_node = node_by_id.get(edge['from'])
             if task_node:
                 print(f"  • {task_node['label'][:50]}... → Weight: {edge['weight']}")
     
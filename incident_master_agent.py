@@ -3,11 +3,342 @@ Incident Response Master Agent
 Coordinates teams to respond to incidents, creates task assignments and visualizations
 """
 
+import asyncio
 import os
 import json
-from typing import List, Dict, Any, Tuple
+import hashlib
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from html import escape
+from operator import itemgetter
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from datetime import datetime
+import config
 from incident_slave_agent import IncidentSlaveAgent
+from incident_task import Task
+
+try:
+    import orjson
+    
+    def _dumps(obj: Any) -> str:
+        """Serialize to JSON with orjson; non-string keys are stringified like json does."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _dumps = json.dumps
+
+
+# Parsed slave agents shared by every master agent, keyed by (file path, mtime).
+# Safe to share because an IncidentSlaveAgent is never modified after construction;
+# older versions of a file are evicted when a newer one is parsed.
+_AGENT_CACHE: Dict[Tuple[str, int], IncidentSlaveAgent] = {}
+_AGENT_CACHE_LOCK = threading.Lock()
+
+# Minimum seconds between checks of a team directory for added, removed or edited files
+TEAM_RESCAN_INTERVAL = 2.0
+
+# Root of the on-disk caches
+TASK_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'incident_response')
+
+# On-disk memo of Gemini task proposals, keyed by team file version and incident text.
+# Incident text is free-form user input, so entries expire after TASK_CACHE_TTL seconds
+# and only the newest TASK_CACHE_MAX_FILES are kept.
+TASK_FILES_DIR = os.path.join(TASK_CACHE_DIR, 'tasks')
+TASK_CACHE_TTL = 7 * 24 * 3600
+TASK_CACHE_MAX_FILES = 512
+
+# Errors reading a missing, corrupt or outdated cache file. The caches are plain JSON,
+# so a file planted in the cache directory can at worst give wrong data, never run code
+_CACHE_LOAD_ERRORS = (OSError, ValueError, TypeError, KeyError, IndexError)
+
+# On-disk memo of parsed team info, so unchanged team files are not re-parsed at startup
+AGENT_CACHE_PATH = os.path.join(TASK_CACHE_DIR, 'agents.json')
+
+# Bump when team file parsing, expertise detection or the agent's attributes change
+_AGENT_CACHE_FORMAT = "agent-v1"
+
+# Priority level for each importance score 0-10; scores are clamped into range.
+# The badge colour and upper-case label come from CSS keyed on data-priority.
+_PRIORITY_LEVELS = ("low",) * 5 + ("medium",) * 3 + ("high",) * 3
+
+# Static markup for the graph view; only the node/edge JSON changes per incident
+_GRAPH_HTML_TEMPLATE = string.Template("""
+        <div id="graph-container" style="width: 100%; height: 600px; border: 1px solid #ddd; border-radius: 8px;"></div>
+        
+        <script type="text/javascript">
+            var nodes = new vis.DataSet($nodes_json);
+            var edges = new vis.DataSet($edges_json);
+            
+            var container = document.getElementById('graph-container');
+            var data = {
+                nodes: nodes,
+                edges: edges
+            };
+            
+            var options = {
+                nodes: {
+                    shape: 'box',
+                    margin: 10,
+                    widthConstraint: {
+                        maximum: 200
+                    },
+                    font: {
+                        size: 14
+                    },
+                    color: {
+                        border: '#2B7CE9',
+                        background: '#D2E5FF',
+                        highlight: {
+                            border: '#2B7CE9',
+                            background: '#FFC107'
+                        }
+                    }
+                },
+                edges: {
+                    arrows: {
+                        to: {
+                            enabled: true,
+                            scaleFactor: 0.5
+                        }
+                    },
+                    smooth: {
+                        type: 'cubicBezier',
+                        forceDirection: 'vertical'
+                    },
+                    color: {
+                        color: '#848484',
+                        highlight: '#FFC107'
+                    },
+                    font: {
+                        size: 11,
+                        align: 'middle'
+                    }
+                },
+                layout: {
+                    hierarchical: {
+                        direction: 'UD',
+                        sortMethod: 'directed',
+                        nodeSpacing: 150,
+                        levelSeparation: 200
+                    }
+                },
+                physics: {
+                    enabled: false
+                }
+            };
+            
+            // Customize node appearance based on type
+            nodes.forEach(function(node) {
+                if (node.type === 'incident') {
+                    node.color = {
+                        border: '#D32F2F',
+                        background: '#FFCDD2'
+                    };
+                    node.font = {size: 16, bold: true};
+                    node.shape = 'ellipse';
+                } else {
+                    var importance = node.importance || 1;
+                    var intensity = Math.min(255, 150 + importance * 10);
+                    node.color = {
+                        border: '#2B7CE9',
+                        background: 'rgb(' + (255 - importance * 10) + ', ' + (255 - importance * 5) + ', 255)'
+                    };
+                }
+            });
+            
+            // Customize edge appearance based on weight
+            edges.forEach(function(edge) {
+                if (edge.type === 'dependency') {
+                    edge.color = {color: '#4CAF50'};
+                    edge.dashes = true;
+                } else {
+                    var weight = edge.weight || 1;
+                    edge.width = Math.max(1, weight / 2);
+                }
+            });
+            
+            var network = new vis.Network(container, data, options);
+        </script>
+        """)
+
+# Opening container and stylesheet shared by every assignments table
+_ASSIGNMENTS_HEADER_HTML = """
+        <div class="assignments-container">
+            <style>
+                .assignments-container {
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+                }
+                .team-section {
+                    margin-bottom: 30px;
+                    border: 1px solid #ddd;
+                    border-radius: 8px;
+                    overflow: hidden;
+                }
+                .team-header {
+                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+                    color: white;
+                    padding: 20px;
+                }
+                .team-name {
+                    font-size: 24px;
+                    font-weight: bold;
+                    margin-bottom: 10px;
+                }
+                .team-stats {
+                    display: flex;
+                    gap: 30px;
+                    font-size: 14px;
+                    opacity: 0.9;
+                }
+                .stat-item {
+                    display: flex;
+                    align-items: center;
+                    gap: 5px;
+                }
+                .tasks-table {
+                    width: 100%;
+                    border-collapse: collapse;
+                }
+                .tasks-table th {
+                    background: #f5f5f5;
+                    padding: 12px;
+                    text-align: left;
+                    font-weight: 600;
+                    border-bottom: 2px solid #ddd;
+                }
+                .tasks-table td {
+                    padding: 12px;
+                    border-bottom: 1px solid #eee;
+                }
+                .tasks-table tr:hover {
+                    background: #f9f9f9;
+                }
+                .priority-badge {
+                    display: inline-block;
+                    padding: 4px 12px;
+                    border-radius: 12px;
+                    font-size: 12px;
+                    font-weight: bold;
+                    text-transform: uppercase;
+                }
+                .priority-badge[data-priority="high"] {
+                    background: #ffebee;
+                    color: #c62828;
+                }
+                .priority-badge[data-priority="medium"] {
+                    background: #fff3e0;
+                    color: #e65100;
+                }
+                .priority-badge[data-priority="low"] {
+                    background: #e8f5e9;
+                    color: #2e7d32;
+                }
+                .task-id {
+                    font-family: 'Courier New', monospace;
+                    font-size: 12px;
+                    color: #666;
+                }
+            </style>
+        """
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, adding an ellipsis when cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _task_cache_path(team_file_path: str, incident_description: str) -> str:
+    """Return the cache file for a team's proposals, invalidated when the team file changes."""
+    mtime_ns = os.stat(team_file_path).st_mtime_ns
+    key = f"{os.path.abspath(team_file_path)}|{mtime_ns}|{config.is_gemini_enabled()}|{incident_description}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    team = os.path.splitext(os.path.basename(team_file_path))[0]
+    return os.path.join(TASK_FILES_DIR, f"{team}_{digest}.json")
+
+
+def _load_cached_tasks(cache_path: str, deadline: datetime) -> Optional[List[Task]]:
+    """Load cached tasks, rebasing their deadlines onto the new incident deadline."""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = json.loads(f.read())
+        cached_deadline = datetime.fromisoformat(cached["deadline"])
+        tasks = [Task.from_dict(task) for task in cached["tasks"]]
+    except _CACHE_LOAD_ERRORS:
+        return None
+    
+    shift = deadline - cached_deadline
+    for task in tasks:
+        if task.tentative_deadline is not None:
+            task.tentative_deadline += shift
+    return tasks
+
+
+def _store_cached_tasks(cache_path: str, tasks: List[Task], deadline: datetime):
+    """Persist tasks together with the incident deadline they were proposed for."""
+    try:
+        _write_json(cache_path, {"deadline": deadline.isoformat(), "tasks": [task.to_dict() for task in tasks]})
+    except OSError as e:
+        print(f"  ⚠ Could not write task cache {cache_path}: {str(e)}")
+        return
+    _prune_task_cache()
+
+
+def _prune_task_cache():
+    """Delete cached proposals older than TASK_CACHE_TTL, then the oldest beyond TASK_CACHE_MAX_FILES."""
+    entries = []
+    try:
+        with os.scandir(TASK_FILES_DIR) as scan:
+            for entry in scan:
+                if entry.name.endswith('.json'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        pass
+    except OSError:
+        return
+    
+    expired_before = time.time() - TASK_CACHE_TTL
+    entries.sort(reverse=True)
+    for index, (mtime, path) in enumerate(entries):
+        if index >= TASK_CACHE_MAX_FILES or mtime < expired_before:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _load_agent_cache() -> Dict[Tuple[str, int, int], Dict[str, Any]]:
+    """Load the parsed team info cache, or an empty one if missing or outdated."""
+    try:
+        with open(AGENT_CACHE_PATH, 'rb') as f:
+            cached = json.loads(f.read())
+        if cached["format"] != _AGENT_CACHE_FORMAT:
+            return {}
+        # JSON has no tuple keys, so entries are stored as [path, mtime, size, state]
+        return {(path, mtime, size): state for path, mtime, size, state in cached["entries"]}
+    except _CACHE_LOAD_ERRORS:
+        return {}
+
+
+def _store_agent_cache(entries: Dict[Tuple[str, int, int], Dict[str, Any]]):
+    """Persist the parsed team info cache."""
+    try:
+        _write_json(AGENT_CACHE_PATH, {
+            "format": _AGENT_CACHE_FORMAT,
+            "entries": [[*key, state] for key, state in entries.items()]
+        })
+    except OSError as e:
+        print(f"  ⚠ Could not write agent cache {AGENT_CACHE_PATH}: {str(e)}")
+
+
+def _write_json(path: str, obj: Any):
+    """Write obj to path as JSON atomically, so concurrent readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(_dumps(obj))
+    os.replace(tmp_path, path)
 
 
 class IncidentMasterAgent:
@@ -20,29 +351,119 @@ class IncidentMasterAgent:
         """
         Initialize the incident master agent.
         
+        Team files are discovered here, but the slave agents themselves are
+        only created the first time they are needed. A team file that is later
+        added, removed or modified is picked up by the next access to
+        slave_agents after TEAM_RESCAN_INTERVAL seconds.
+        
         Args:
             team_info_directory: Directory containing team information files
         """
         self.team_info_directory = team_info_directory
-        self.slave_agents: List[IncidentSlaveAgent] = []
+        self._team_files: List[str] = []
+        self._team_versions: Tuple[Tuple[str, int], ...] = ()
+        self._last_scan = 0.0
+        self._slave_agents: Optional[List[IncidentSlaveAgent]] = None
+        self._agents_lock = threading.Lock()
         self._initialize_slave_agents()
     
-    def _initialize_slave_agents(self):
-        """Create a slave agent for each team info file."""
-        if not os.path.exists(self.team_info_directory):
+    def _scan_team_files(self) -> Tuple[Tuple[str, int], ...]:
+        """Return (path, mtime) for every team info file in the directory."""
+        try:
+            with os.scandir(self.team_info_directory) as entries:
+                return tuple(
+                    (entry.path, entry.stat().st_mtime_ns) for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file()
+                )
+        except FileNotFoundError:
             raise FileNotFoundError(f"Team info directory not found: {self.team_info_directory}")
+    
+    def _initialize_slave_agents(self):
+        """Discover the team info files that slave agents will be created from."""
+        self._team_versions = self._scan_team_files()
+        self._team_files = [file_path for file_path, _ in self._team_versions]
+        print(f"Discovered {len(self._team_files)} team info files")
+    
+    @property
+    def slave_agents(self) -> List[IncidentSlaveAgent]:
+        """
+        Slave agents for every team file, created on first access.
+        
+        The team directory is rescanned at most once every TEAM_RESCAN_INTERVAL
+        seconds; if any file changed, a new list of agents is built. Agents are
+        never modified after construction, so a list already handed out stays valid.
+        If a rescan fails, the agents already loaded keep being served.
+        """
+        if self._slave_agents is not None and time.monotonic() - self._last_scan < TEAM_RESCAN_INTERVAL:
+            return self._slave_agents
         
-        for filename in os.listdir(self.team_info_directory):
-            if filename.endswith('.txt'):
-                file_path = os.path.join(self.team_info_directory, filename)
-                try:
-                    agent = IncidentSlaveAgent(file_path)
-                    self.slave_agents.append(agent)
-                    print(f"✓ Initialized incident agent for: {agent.team_name}")
-                except Exception as e:
-                    print(f"✗ Failed to initialize agent for {filename}: {str(e)}")
-        
-        print(f"\nTotal incident response agents: {len(self.slave_agents)}")
+        with self._agents_lock:
+            if self._slave_agents is not None and time.monotonic() - self._last_scan < TEAM_RESCAN_INTERVAL:
+                return self._slave_agents
+            
+            try:
+                team_versions = self._scan_team_files()
+            except OSError as e:
+                if self._slave_agents is None:
+                    raise
+                print(f"⚠ Could not rescan team info files, keeping the loaded agents: {str(e)}")
+                team_versions = self._team_versions
+            self._last_scan = time.monotonic()
+            
+            if self._slave_agents is None or team_versions != self._team_versions:
+                if self._slave_agents is not None:
+                    print("Team info files changed, reloading agents")
+                self._team_files = [file_path for file_path, _ in team_versions]
+                self._slave_agents = self._load_slave_agents(team_versions)
+                self._team_versions = team_versions
+        return self._slave_agents
+    
+    def _load_slave_agents(self, team_versions: Tuple[Tuple[str, int], ...]) -> List[IncidentSlaveAgent]:
+        """Create a slave agent for each team info file version, reading the files in parallel."""
+        disk_cache = _load_agent_cache()
+        known_keys = set(disk_cache)
+        
+        # Each file is parsed against its own slice of the disk cache, so the workers
+        # never modify a shared dict; the slices are merged back once all are done
+        file_caches = {os.path.abspath(file_path): {} for file_path, _ in team_versions}
+        for key, state in disk_cache.items():
+            if key[0] in file_caches:
+                file_caches[key[0]][key] = state
+        
+        def load(team_version):
+            file_path, mtime = team_version
+            try:
+                key = (os.path.abspath(file_path), mtime)
+                agent = _AGENT_CACHE.get(key)
+                if agent is None:
+                    agent = IncidentSlaveAgent.from_cache(file_path, file_caches[key[0]])
+                    with _AGENT_CACHE_LOCK:
+                        for stale in [k for k in _AGENT_CACHE if k[0] == key[0] and k[1] != mtime]:
+                            del _AGENT_CACHE[stale]
+                        agent = _AGENT_CACHE.setdefault(key, agent)
+                return agent
+            except Exception as e:
+                return e
+        
+        agents = []
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(team_versions)))) as executor:
+            for (file_path, _), result in zip(team_versions, executor.map(load, team_versions)):
+                if isinstance(result, Exception):
+                    print(f"✗ Failed to initialize agent for {os.path.basename(file_path)}: {str(result)}")
+                else:
+                    agents.append(result)
+                    print(f"✓ Initialized incident agent for: {result.team_name}")
+        
+        for key in [key for key in disk_cache if key[0] in file_caches]:
+            del disk_cache[key]
+        for file_cache in file_caches.values():
+            disk_cache.update(file_cache)
+        
+        if set(disk_cache) != known_keys:
+            _store_agent_cache(disk_cache)
+        
+        print(f"\nTotal incident response agents: {len(agents)}")
+        return agents
     
     def handle_incident(self, incident_description: str, deadline: datetime) -> Dict[str, Any]:
         """
@@ -55,24 +476,148 @@ class IncidentMasterAgent:
         Returns:
             Dictionary containing task graph and assignments
         """
+        self._print_incident_header(incident_description, deadline)
+        agents = self.slave_agents
+        tasks_by_agent = dict(self._collect_proposals(agents, incident_description, deadline))
+        return self._summarize_incident(incident_description, deadline, agents, tasks_by_agent)
+    
+    def stream_incident(self, incident_description: str, deadline: datetime) -> Iterator[Dict[str, Any]]:
+        """
+        Handle an incident, reporting each team's proposals as soon as they arrive.
+        
+        Args:
+            incident_description: Description of the incident
+            deadline: Deadline to resolve the incident
+            
+        Yields:
+            A {"type": "team_done", "team", "tasks"} event per team as it finishes,
+            then a final {"type": "summary", "result"} event whose result is the
+            same dictionary handle_incident returns
+        """
+        self._print_incident_header(incident_description, deadline)
+        agents = self.slave_agents
+        tasks_by_agent = {}
+        
+        for agent, tasks in self._collect_proposals(agents, incident_description, deadline):
+            tasks_by_agent[agent] = tasks
+            yield {
+                "type": "team_done",
+                "team": agent.team_name,
+                "tasks": [task.to_dict() for task in tasks]
+            }
+        
+        yield {
+            "type": "summary",
+            "result": self._summarize_incident(incident_description, deadline, agents, tasks_by_agent)
+        }
+    
+    def _collect_proposals(self, agents: List[IncidentSlaveAgent], incident_description: str,
+                           deadline: datetime) -> Iterator[Tuple[IncidentSlaveAgent, List[Task]]]:
+        """Ask every team for task proposals, yielding (agent, tasks) as each team finishes."""
+        print("Step 1: Collecting task proposals from teams...")
+        
+        # Each proposal may block on a Gemini round-trip, so ask all teams at once
+        with ThreadPoolExecutor(max_workers=max(1, len(agents))) as executor:
+            futures = {}
+            for agent in agents:
+                print(f"  • Requesting tasks from {agent.team_name}...")
+                futures[executor.submit(self._propose_tasks_cached, agent, incident_description, deadline)] = agent
+            
+            for future in as_completed(futures):
+                agent = futures[future]
+                tasks = future.result()
+                print(f"    → {agent.team_name} proposed {len(tasks)} tasks")
+                yield agent, tasks
+    
+    def handle_batch(self, incidents: List[Tuple[str, datetime]]) -> List[Dict[str, Any]]:
+        """
+        Handle several incidents at once, sharing one pool of team requests.
+        
+        Agents are loaded once and every (incident, team) proposal runs in the same
+        executor, so a slow team on one incident does not hold up the others.
+        
+        Args:
+            incidents: (incident_description, deadline) pairs
+            
+        Returns:
+            One handle_incident result per incident, in the same order
+        """
+        agents = self.slave_agents
+        for incident_description, deadline in incidents:
+            self._print_incident_header(incident_description, deadline)
+        
+        print(f"Step 1: Collecting task proposals from teams for {len(incidents)} incidents...")
+        tasks_by_incident = [{} for _ in incidents]
+        workers = max(1, min(32, len(agents) * len(incidents)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for index, (incident_description, deadline) in enumerate(incidents):
+                for agent in agents:
+                    future = executor.submit(self._propose_tasks_cached, agent, incident_description, deadline)
+                    futures[future] = (index, agent)
+            
+            for future in as_completed(futures):
+                index, agent = futures[future]
+                tasks_by_incident[index][agent] = future.result()
+        
+        return [
+            self._summarize_incident(incident_description, deadline, agents, tasks_by_agent)
+            for (incident_description, deadline), tasks_by_agent in zip(incidents, tasks_by_incident)
+        ]
+    
+    async def handle_incident_async(self, incident_description: str, deadline: datetime) -> Dict[str, Any]:
+        """
+        Handle an incident like handle_incident, from inside an asyncio event loop.
+        
+        All teams propose tasks concurrently, so their Gemini round-trips overlap.
+        
+        Args:
+            incident_description: Description of the incident
+            deadline: Deadline to resolve the incident
+            
+        Returns:
+            Dictionary containing task graph and assignments
+        """
+        self._print_incident_header(incident_description, deadline)
+        
+        # Step 1: Collect task proposals from all teams
+        print("Step 1: Collecting task proposals from teams...")
+        agents = self.slave_agents
+        proposals = await asyncio.gather(*(
+            self._propose_tasks_cached_async(agent, incident_description, deadline)
+            for agent in agents
+        ))
+        for agent, tasks in zip(agents, proposals):
+            print(f"    → {agent.team_name} proposed {len(tasks)} tasks")
+        
+        return self._summarize_incident(incident_description, deadline, agents,
+                                        dict(zip(agents, proposals)))
+    
+    def _print_incident_header(self, incident_description: str, deadline: datetime):
+        """Print the banner that opens an incident coordination run."""
         print(f"\n{'='*80}")
         print(f"INCIDENT RESPONSE COORDINATION")
         print(f"{'='*80}")
         print(f"Incident: {incident_description}")
         print(f"Deadline: {deadline.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"{'='*80}\n")
+    
+    def _summarize_incident(self, incident_description: str, deadline: datetime,
+                            agents: List[IncidentSlaveAgent],
+                            tasks_by_agent: Dict[IncidentSlaveAgent, List[Task]]) -> Dict[str, Any]:
+        """
+        Build the task graph and assignments from every team's proposals.
         
-        # Step 1: Collect task proposals from all teams
-        print("Step 1: Collecting task proposals from teams...")
+        Returns:
+            Dictionary containing task graph and assignments
+        """
+        # Assemble in team order so the graph and assignments are deterministic
         all_tasks = []
         team_tasks = {}
-        
-        for agent in self.slave_agents:
-            print(f"  • Requesting tasks from {agent.team_name}...")
-            tasks = agent.propose_tasks(incident_description, deadline)
+        for agent in agents:
+            tasks = tasks_by_agent[agent]
             team_tasks[agent.team_name] = tasks
             all_tasks.extend(tasks)
-            print(f"    → Proposed {len(tasks)} tasks")
         
         print(f"\nTotal tasks proposed: {len(all_tasks)}\n")
         
@@ -95,7 +640,47 @@ class IncidentMasterAgent:
             "teams_involved": len(team_tasks)
         }
     
-    def _build_task_graph(self, all_tasks: List[Dict[str, Any]], 
+    def _propose_tasks_cached(self, agent: IncidentSlaveAgent, incident_description: str,
+                              deadline: datetime) -> List[Task]:
+        """
+        Get an agent's task proposals, reusing a previous run for the same incident.
+        
+        Only Gemini proposals are cached; rule-based ones are cheaper to recompute than
+        to load.
+        
+        Returns:
+            List of proposed tasks
+        """
+        if not config.is_gemini_enabled():
+            return agent.propose_tasks(incident_description, deadline)
+        
+        cache_path = _task_cache_path(agent.team_file_path, incident_description)
+        tasks = _load_cached_tasks(cache_path, deadline)
+        if tasks is not None:
+            print(f"  • Using cached tasks for {agent.team_name}")
+            return tasks
+        
+        tasks = agent.propose_tasks(incident_description, deadline)
+        _store_cached_tasks(cache_path, tasks, deadline)
+        return tasks
+    
+    async def _propose_tasks_cached_async(self, agent: IncidentSlaveAgent, incident_description: str,
+                                          deadline: datetime) -> List[Task]:
+        """Async counterpart of _propose_tasks_cached."""
+        if not config.is_gemini_enabled():
+            return await agent.propose_tasks_async(incident_description, deadline)
+        
+        cache_path = _task_cache_path(agent.team_file_path, incident_description)
+        tasks = _load_cached_tasks(cache_path, deadline)
+        if tasks is not None:
+            print(f"  • Using cached tasks for {agent.team_name}")
+            return tasks
+        
+        tasks = await agent.propose_tasks_async(incident_description, deadline)
+        _store_cached_tasks(cache_path, tasks, deadline)
+        return tasks
+    
+    def _build_task_graph(self, all_tasks: List[Task], 
                          incident_description: str) -> Dict[str, Any]:
         """
         Build a graph representation of tasks and their relationships.
@@ -103,41 +688,42 @@ class IncidentMasterAgent:
         Returns:
             Dictionary with nodes and edges for visualization
         """
-        nodes = []
-        edges = []
-        
-        # Add incident as central node
-        nodes.append({
+        # Incident is the central node, followed by one node per task
+        nodes = [None] * (len(all_tasks) + 1)
+        nodes[0] = {
             "id": "INCIDENT",
-            "label": incident_description[:50] + "..." if len(incident_description) > 50 else incident_description,
+            "label": _truncate(incident_description, 50),
             "type": "incident",
             "importance": 10
-        })
+        }
+        edges = []
+        add_edge = edges.append
         
-        # Add task nodes
-        for task in all_tasks:
-            nodes.append({
-                "id": task["task_id"],
-                "label": task["description"][:40] + "..." if len(task["description"]) > 40 else task["description"],
+        for i, task in enumerate(all_tasks, 1):
+            task_id = task.task_id
+            importance = task.importance
+            nodes[i] = {
+                "id": task_id,
+                "label": _truncate(task.description, 40),
                 "type": "task",
-                "importance": task["importance"],
-                "team": task.get("assigned_to", "Unassigned"),
-                "deadline": task["tentative_deadline"].isoformat()
-            })
+                "importance": importance,
+                "team": task.assigned_to,
+                "deadline": task.tentative_deadline.isoformat()
+            }
             
             # Create edge from task to incident (task helps resolve incident)
-            edges.append({
-                "from": task["task_id"],
+            add_edge({
+                "from": task_id,
                 "to": "INCIDENT",
-                "weight": task["importance"],
-                "label": f"Priority: {task['importance']}"
+                "weight": importance,
+                "label": f"Priority: {importance}"
             })
             
             # Create edges for dependencies
-            for dep in task.get("dependencies", []):
-                edges.append({
+            for dep in task.dependencies:
+                add_edge({
                     "from": dep,
-                    "to": task["task_id"],
+                    "to": task_id,
                     "weight": 5,
                     "label": "depends on",
                     "type": "dependency"
@@ -148,8 +734,8 @@ class IncidentMasterAgent:
             "edges": edges
         }
     
-    def _create_assignments(self, all_tasks: List[Dict[str, Any]], 
-                           team_tasks: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    def _create_assignments(self, all_tasks: List[Task], 
+                           team_tasks: Dict[str, List[Task]]) -> List[Dict[str, Any]]:
         """
         Create prioritized task assignments grouped by team.
         
@@ -162,20 +748,18 @@ class IncidentMasterAgent:
             if not tasks:
                 continue
             
-            # Sort tasks by importance (descending)
-            sorted_tasks = sorted(tasks, key=lambda x: x["importance"], reverse=True)
-            
-            # Convert datetime objects to strings for JSON serialization
+            # Convert tasks for JSON serialization and total up team metrics in one pass
+            total_hours = 0
+            importance_sum = 0
             json_safe_tasks = []
-            for task in sorted_tasks:
-                task_copy = task.copy()
-                if isinstance(task_copy.get("tentative_deadline"), datetime):
-                    task_copy["tentative_deadline"] = task_copy["tentative_deadline"].isoformat()
-                json_safe_tasks.append(task_copy)
+            for task in tasks:
+                total_hours += task.estimated_hours
+                importance_sum += task.importance
+                json_safe_tasks.append(task.to_dict())
             
-            # Calculate team metrics
-            total_hours = sum(task["estimated_hours"] for task in tasks)
-            avg_importance = sum(task["importance"] for task in tasks) / len(tasks)
+            # Sort tasks by importance (descending)
+            json_safe_tasks.sort(key=itemgetter("importance"), reverse=True)
+            avg_importance = importance_sum / len(tasks)
             
             assignments.append({
                 "team_name": team_name,
@@ -186,7 +770,7 @@ class IncidentMasterAgent:
             })
         
         # Sort teams by average importance (most critical teams first)
-        assignments.sort(key=lambda x: x["average_importance"], reverse=True)
+        assignments.sort(key=itemgetter("average_importance"), reverse=True)
         
         return assignments
     
@@ -200,109 +784,11 @@ class IncidentMasterAgent:
         Returns:
             HTML string
         """
-        nodes_json = json.dumps(task_graph["nodes"])
-        edges_json = json.dumps(task_graph["edges"])
-        
-        html = f"""
-        <div id="graph-container" style="width: 100%; height: 600px; border: 1px solid #ddd; border-radius: 8px;"></div>
+        # "</" is escaped so task text cannot close the surrounding <script> element
+        nodes_json = _dumps(task_graph["nodes"]).replace("</", "<\\/")
+        edges_json = _dumps(task_graph["edges"]).replace("</", "<\\/")
         
-        <script type="text/javascript">
-            var nodes = new vis.DataSet({nodes_json});
-            var edges = new vis.DataSet({edges_json});
-            
-            var container = document.getElementById('graph-container');
-            var data = {{
-                nodes: nodes,
-                edges: edges
-            }};
-            
-            var options = {{
-                nodes: {{
-                    shape: 'box',
-                    margin: 10,
-                    widthConstraint: {{
-                        maximum: 200
-                    }},
-                    font: {{
-                        size: 14
-                    }},
-                    color: {{
-                        border: '#2B7CE9',
-                        background: '#D2E5FF',
-                        highlight: {{
-                            border: '#2B7CE9',
-                            background: '#FFC107'
-                        }}
-                    }}
-                }},
-                edges: {{
-                    arrows: {{
-                        to: {{
-                            enabled: true,
-                            scaleFactor: 0.5
-                        }}
-                    }},
-                    smooth: {{
-                        type: 'cubicBezier',
-                        forceDirection: 'vertical'
-                    }},
-                    color: {{
-                        color: '#848484',
-                        highlight: '#FFC107'
-                    }},
-                    font: {{
-                        size: 11,
-                        align: 'middle'
-                    }}
-                }},
-                layout: {{
-                    hierarchical: {{
-                        direction: 'UD',
-                        sortMethod: 'directed',
-                        nodeSpacing: 150,
-                        levelSeparation: 200
-                    }}
-                }},
-                physics: {{
-                    enabled: false
-                }}
-            }};
-            
-            // Customize node appearance based on type
-            nodes.forEach(function(node) {{
-                if (node.type === 'incident') {{
-                    node.color = {{
-                        border: '#D32F2F',
-                        background: '#FFCDD2'
-                    }};
-                    node.font = {{size: 16, bold: true}};
-                    node.shape = 'ellipse';
-                }} else {{
-                    var importance = node.importance || 1;
-                    var intensity = Math.min(255, 150 + importance * 10);
-                    node.color = {{
-                        border: '#2B7CE9',
-                        background: 'rgb(' + (255 - importance * 10) + ', ' + (255 - importance * 5) + ', 255)'
-                    }};
-                }}
-            }});
-            
-            // Customize edge appearance based on weight
-            edges.forEach(function(edge) {{
-                if (edge.type === 'dependency') {{
-                    edge.color = {{color: '#4CAF50'}};
-                    edge.dashes = true;
-                }} else {{
-                    var weight = edge.weight || 1;
-                    edge.width = Math.max(1, weight / 2);
-                }}
-            }});
-            
-            var network = new vis.Network(container, data, options);
-        </script>
-        """
-        
-        return html
+        return _GRAPH_HTML_TEMPLATE.substitute(nodes_json=nodes_json, edges_json=edges_json)
     
     def generate_assignments_html(self, assignments: List[Dict[str, Any]]) -> str:
         """
@@ -314,91 +800,28 @@ class IncidentMasterAgent:
         Returns:
             HTML string
         """
-        html = """
-        <div class="assignments-container">
-            <style>
-                .assignments-container {
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                }
-                .team-section {
-                    margin-bottom: 30px;
-                    border: 1px solid #ddd;
-                    border-radius: 8px;
-                    overflow: hidden;
-                }
-                .team-header {
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    padding: 20px;
-                }
-                .team-name {
-                    font-size: 24px;
-                    font-weight: bold;
-                    margin-bottom: 10px;
-                }
-                .team-stats {
-                    display: flex;
-                    gap: 30px;
-                    font-size: 14px;
-                    opacity: 0.9;
-                }
-                .stat-item {
-                    display: flex;
-                    align-items: center;
-                    gap: 5px;
-                }
-                .tasks-table {
-                    width: 100%;
-                    border-collapse: collapse;
-                }
-                .tasks-table th {
-                    background: #f5f5f5;
-                    padding: 12px;
-                    text-align: left;
-                    font-weight: 600;
-                    border-bottom: 2px solid #ddd;
-                }
-                .tasks-table td {
-                    padding: 12px;
-                    border-bottom: 1px solid #eee;
-                }
-                .tasks-table tr:hover {
-                    background: #f9f9f9;
-                }
-                .priority-badge {
-                    display: inline-block;
-                    padding: 4px 12px;
-                    border-radius: 12px;
-                    font-size: 12px;
-                    font-weight: bold;
-                }
-                .priority-high {
-                    background: #ffebee;
-                    color: #c62828;
-                }
-                .priority-medium {
-                    background: #fff3e0;
-                    color: #e65100;
-                }
-                .priority-low {
-                    background: #e8f5e9;
-                    color: #2e7d32;
-                }
-                .task-id {
-                    font-family: 'Courier New', monospace;
-                    font-size: 12px;
-                    color: #666;
-                }
-            </style>
+        return "".join(self.iter_assignments_html(assignments))
+    
+    def iter_assignments_html(self, assignments: List[Dict[str, Any]]) -> Iterator[str]:
         """
+        Generate HTML for task assignments table as a stream of fragments.
         
+        Args:
+            assignments: Task assignments data
+            
+        Yields:
+            HTML fragments, in document order
+        """
+        yield _ASSIGNMENTS_HEADER_HTML
+        
+        # Task text may come from Gemini or echo the incident report, so it is escaped
         for assignment in assignments:
-            team_name = assignment["team_name"]
+            team_name = escape(assignment["team_name"], quote=False)
             task_count = assignment["task_count"]
             total_hours = assignment["total_estimated_hours"]
             avg_importance = assignment["average_importance"]
             
-            html += f"""
+            yield f"""
             <div class="team-section">
                 <div class="team-header">
                     <div class="team-name">{team_name}</div>
@@ -433,43 +856,29 @@ class IncidentMasterAgent:
             
             for task in assignment["tasks"]:
                 importance = task["importance"]
-                if importance >= 8:
-                    priority_class = "priority-high"
-                    priority_label = "HIGH"
-                elif importance >= 5:
-                    priority_class = "priority-medium"
-                    priority_label = "MEDIUM"
-                else:
-                    priority_class = "priority-low"
-                    priority_label = "LOW"
+                priority = _PRIORITY_LEVELS[max(0, min(int(importance), 10))]
                 
-                # Handle both datetime objects and ISO strings
-                deadline = task["tentative_deadline"]
-                if isinstance(deadline, datetime):
-                    deadline_str = deadline.strftime("%Y-%m-%d %H:%M")
-                else:
-                    # Already a string (ISO format), just format it nicely
-                    deadline_str = deadline[:16].replace('T', ' ')
+                # Assignment deadlines are ISO strings (see Task.to_dict)
+                deadline_str = task["tentative_deadline"][:16].replace('T', ' ')
                 
-                html += f"""
+                yield f"""
                         <tr>
-                            <td><span class="priority-badge {priority_class}">{priority_label} ({importance})</span></td>
-                            <td class="task-id">{task["task_id"]}</td>
-                            <td>{task["description"]}</td>
-                            <td>{task["assigned_to"]}</td>
+                            <td><span class="priority-badge" data-priority="{priority}">{priority} ({importance})</span></td>
+                            <td class="task-id">{escape(task["task_id"], quote=False)}</td>
+                            <td>{escape(task["description"], quote=False)}</td>
+                            <td>{escape(task["assigned_to"], quote=False)}</td>
                             <td>{task["estimated_hours"]}h</td>
                             <td>{deadline_str}</td>
                         </tr>
                 """
             
-            html += """
+            yield """
                     </tbody>
                 </table>
             </div>
             """
         
-        html += "</div>"
-        return html
+        yield "</div>"
     
     def __repr__(self):
-        return f"IncidentMasterAgent(teams={len(self.slave_agents)})"
+        return f"IncidentMasterAgent(teams={len(self._team_files)})"
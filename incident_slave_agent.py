@@ -3,10 +3,116 @@ Incident Response Slave Agent
 Each team agent proposes tasks to help resolve an incident
 """
 
-import re
-from typing import Dict, List, Any
+import os
+import sys
+from collections import namedtuple
+from typing import Dict, FrozenSet, Iterable, List, Any, Tuple
 from datetime import datetime, timedelta
 from gemini_integration import get_gemini_enhancer
+from incident_task import Task
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+class _KeywordMatcher:
+    """
+    Finds which of a fixed set of keywords occur as substrings of a text.
+    
+    Uses a single Aho-Corasick pass when pyahocorasick is installed and falls
+    back to one substring check per keyword otherwise.
+    """
+    
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords = tuple(dict.fromkeys(keywords))
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return the keywords that occur in text."""
+        if self._automaton is None:
+            return frozenset(keyword for keyword in self.keywords if keyword in text)
+        
+        found = set()
+        for _, keyword in self._automaton.iter(text):
+            found.add(keyword)
+            if len(found) == len(self.keywords):
+                break
+        return frozenset(found)
+
+
+# Keywords in a team file that indicate each area of expertise
+EXPERTISE_KEYWORDS = {
+    'security': ['security', 'vulnerability', 'authentication', 'encryption'],
+    'frontend': ['frontend', 'ui', 'ux', 'dashboard', 'mobile', 'responsive'],
+    'backend': ['backend', 'api', 'database', 'server', 'infrastructure'],
+    'infrastructure': ['infrastructure', 'deployment', 'scaling', 'monitoring', 'uptime'],
+    'database': ['database', 'migration', 'sql', 'cache', 'redis'],
+    'performance': ['performance', 'optimization', 'scaling', 'rate limiting'],
+    'monitoring': ['monitoring', 'alerts', 'logging', 'metrics']
+}
+
+_EXPERTISE_MATCHER = _KeywordMatcher(
+    keyword for keywords in EXPERTISE_KEYWORDS.values() for keyword in keywords
+)
+
+# Keywords in an incident description used for relevance scoring and task generation
+INCIDENT_KEYWORDS = (
+    list(EXPERTISE_KEYWORDS) +
+    ['breach', 'vulnerability', 'outage', 'down', 'unavailable', 'slow',
+     'ui', 'user', 'data']
+)
+
+_INCIDENT_MATCHER = _KeywordMatcher(INCIDENT_KEYWORDS)
+
+# Relevance bonuses as (incident keywords, team expertise areas, points, reason).
+# A bonus applies when the incident mentions any of its keywords and the team
+# has any of its areas.
+RELEVANCE_RULES = (
+    (('outage', 'down'), ('infrastructure', 'backend'), 15, "Outage/down + infrastructure/backend"),
+    (('security', 'breach'), ('security',), 20, "Security incident + security expertise"),
+    (('performance', 'slow'), ('performance', 'database'), 15, "Performance issue + relevant expertise"),
+)
+
+# A rule-based task; the team's ID prefix is prepended to suffix and dependencies.
+# assignee is an index into the team's members, or None for the team lead.
+TaskSpec = namedtuple(
+    'TaskSpec',
+    'suffix description importance_delta estimated_hours hours_before assignee dependencies'
+)
+
+# Rule-based task templates as (team expertise areas, incident keywords, tasks).
+# A rule applies when the team has any of its areas and the incident mentions
+# any of its keywords.
+TASK_RULES = (
+    (('security',), ('security', 'breach', 'vulnerability'), (
+        TaskSpec('SEC_01', "Conduct immediate security audit of affected systems", 3, 4, 8, 0, ()),
+        TaskSpec('SEC_02', "Review access logs for suspicious activity", 2, 3, 6, 1, ('SEC_01',)),
+        TaskSpec('SEC_03', "Implement security patches and hotfixes", 4, 6, 2, None, ('SEC_01',)),
+    )),
+    (('infrastructure', 'backend'), ('outage', 'down', 'unavailable'), (
+        TaskSpec('INFRA_01', "Check server health and resource utilization", 4, 2, 10, 0, ()),
+        TaskSpec('INFRA_02', "Restart affected services and verify connectivity", 5, 3, 6, None, ('INFRA_01',)),
+        TaskSpec('INFRA_03', "Scale up resources if needed", 3, 4, 4, 1, ('INFRA_01',)),
+    )),
+    (('frontend',), ('ui', 'frontend', 'user'), (
+        TaskSpec('FRONT_01', "Display user-facing incident notification", 2, 2, 8, 0, ()),
+        TaskSpec('FRONT_02', "Implement graceful degradation for affected features", 3, 5, 4, None, ()),
+    )),
+    (('database',), ('database', 'data', 'slow'), (
+        TaskSpec('DB_01', "Analyze database query performance", 3, 3, 8, 0, ()),
+        TaskSpec('DB_02', "Optimize slow queries and add indexes", 4, 5, 3, None, ('DB_01',)),
+    )),
+)
+
+# Set to True to print each agent's parsing and task proposal steps
+VERBOSE = False
 
 
 class IncidentSlaveAgent:
@@ -21,91 +127,163 @@ class IncidentSlaveAgent:
         Args:
             team_file_path: Path to the text file containing team information
         """
-        print(f"\n{'─'*80}")
-        print(f"[SlaveAgent] Initializing agent from: {team_file_path}")
-        print(f"{'─'*80}")
+        if VERBOSE:
+            print(f"\n{'─'*80}")
+            print(f"[SlaveAgent] Initializing agent from: {team_file_path}")
+            print(f"{'─'*80}")
         
         self.team_file_path = team_file_path
         self.team_name = ""
         self.team_lead = ""
-        self.members = []
-        self.content = ""
+        self.members = ()
         self.expertise = []
+        self.expertise_set = frozenset()
+        
+        # The file text is only needed while parsing, so it is not kept on the agent
+        content = self._load_team_info()
+        self._identify_expertise(content.lower())
+        self._derive_lookups()
+        
+        if VERBOSE:
+            print(f"  ✓ Team: {self.team_name}")
+            print(f"  ✓ Lead: {self.team_lead}")
+            print(f"  ✓ Members: {len(self.members)}")
+            print(f"  ✓ Expertise: {', '.join(self.expertise)}")
+            print(f"{'─'*80}")
+    
+    @classmethod
+    def from_cache(cls, team_file_path: str,
+                   cache: Dict[Tuple[str, int, int], Dict[str, Any]]) -> "IncidentSlaveAgent":
+        """
+        Create an agent, reusing previously parsed team info when the file is unchanged.
         
-        self._load_team_info()
-        self._identify_expertise()
-        
-        print(f"  ✓ Team: {self.team_name}")
-        print(f"  ✓ Lead: {self.team_lead}")
-        print(f"  ✓ Members: {len(self.members)}")
-        print(f"  ✓ Expertise: {', '.join(self.expertise)}")
-        print(f"{'─'*80}")
+        Args:
+            team_file_path: Path to the text file containing team information
+            cache: JSON-serializable parsed team info keyed by (file path, mtime,
+                size). A miss, or an entry that does not have the expected fields,
+                parses the file and replaces any older entry for the same path.
+            
+        Returns:
+            The slave agent for the team file
+        """
+        stat = os.stat(team_file_path)
+        key = (os.path.abspath(team_file_path), stat.st_mtime_ns, stat.st_size)
+        state = cache.get(key)
+        if state is not None:
+            try:
+                agent = cls.__new__(cls)
+                agent.team_file_path = team_file_path
+                agent.team_name = sys.intern(state['team_name'])
+                agent.team_lead = sys.intern(state['team_lead'])
+                agent.members = tuple(sys.intern(member) for member in state['members'])
+                agent.expertise = [str(area) for area in state['expertise']]
+                agent.expertise_set = frozenset(agent.expertise)
+                agent._derive_lookups()
+                return agent
+            except (KeyError, TypeError):
+                pass
+        
+        agent = cls(team_file_path)
+        for stale_key in [k for k in cache if k[0] == key[0]]:
+            del cache[stale_key]
+        cache[key] = {
+            'team_name': agent.team_name,
+            'team_lead': agent.team_lead,
+            'members': list(agent.members),
+            'expertise': agent.expertise
+        }
+        return agent
     
-    def _load_team_info(self):
-        """Load and parse team information from the file."""
-        print(f"  [Loading] Reading team file...")
+    def _derive_lookups(self):
+        """Precompute the lookups derived from the parsed team name and expertise."""
+        # Prefix shared by every task ID this team proposes
+        self._id_prefix = self.team_name.replace(' ', '_')
+        # Lowercased name, matched against each incident's lowercased description
+        self._team_name_lower = self.team_name.lower()
+        # Incident keywords that could give this team a non-zero relevance score
+        self._trigger_set = self._relevance_triggers()
+        # Built on the first get_team_info call; team files never change under an agent
+        self._team_info = None
+    
+    @property
+    def content(self) -> str:
+        """Full text of the team file, read from disk on each access."""
+        with open(self.team_file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    
+    def _load_team_info(self) -> str:
+        """
+        Load and parse team information from the file.
+        
+        Returns:
+            The team file text
+        """
+        if VERBOSE:
+            print(f"  [Loading] Reading team file...")
         try:
             with open(self.team_file_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
-            print(f"  [Loading] File size: {len(self.content)} characters")
-            
-            # Extract team name
-            print(f"  [Loading] Extracting team information...")
-            team_name_match = re.search(r'Team Name:\s*(.+)', self.content)
-            if team_name_match:
-                self.team_name = team_name_match.group(1).strip()
-                print(f"  [Loading] Found team name: {self.team_name}")
+                content = f.read()
+            if VERBOSE:
+                print(f"  [Loading] File size: {len(content)} characters")
             
-            # Extract team lead
-            team_lead_match = re.search(r'Team Lead:\s*(.+)', self.content)
-            if team_lead_match:
-                self.team_lead = team_lead_match.group(1).strip()
-                print(f"  [Loading] Found team lead: {self.team_lead}")
+            # Extract team name, lead and members from their header lines in one pass.
+            # Names are interned since every task and assignment refers back to them.
+            if VERBOSE:
+                print(f"  [Loading] Extracting team information...")
+            members_str = None
+            for line in content.splitlines():
+                if not self.team_name and line.startswith("Team Name:"):
+                    self.team_name = sys.intern(line[len("Team Name:"):].strip())
+                    if VERBOSE:
+                        print(f"  [Loading] Found team name: {self.team_name}")
+                elif not self.team_lead and line.startswith("Team Lead:"):
+                    self.team_lead = sys.intern(line[len("Team Lead:"):].strip())
+                    if VERBOSE:
+                        print(f"  [Loading] Found team lead: {self.team_lead}")
+                elif members_str is None and line.startswith("Members:"):
+                    members_str = line[len("Members:"):].strip()
+                    self.members = tuple(sys.intern(m.strip()) for m in members_str.split(','))
+                    if VERBOSE:
+                        print(f"  [Loading] Found {len(self.members)} members")
+                
+                if self.team_name and self.team_lead and members_str is not None:
+                    break
             
-            # Extract members
-            members_match = re.search(r'Members:\s*(.+)', self.content)
-            if members_match:
-                members_str = members_match.group(1).strip()
-                self.members = [m.strip() for m in members_str.split(',')]
-                print(f"  [Loading] Found {len(self.members)} members")
+            return content
         
         except FileNotFoundError:
             raise FileNotFoundError(f"Team info file not found: {self.team_file_path}")
         except Exception as e:
             raise Exception(f"Error loading team info: {str(e)}")
     
-    def _identify_expertise(self):
-        """Identify team's areas of expertise based on content."""
-        print(f"  [Expertise] Analyzing team expertise...")
+    def _identify_expertise(self, content_lower: str):
+        """Identify team's areas of expertise based on the lowercased team file text."""
+        if VERBOSE:
+            print(f"  [Expertise] Analyzing team expertise...")
         self.expertise = []
-        content_lower = self.content.lower()
-        
-        # Identify expertise areas
-        expertise_keywords = {
-            'security': ['security', 'vulnerability', 'authentication', 'encryption'],
-            'frontend': ['frontend', 'ui', 'ux', 'dashboard', 'mobile', 'responsive'],
-            'backend': ['backend', 'api', 'database', 'server', 'infrastructure'],
-            'infrastructure': ['infrastructure', 'deployment', 'scaling', 'monitoring', 'uptime'],
-            'database': ['database', 'migration', 'sql', 'cache', 'redis'],
-            'performance': ['performance', 'optimization', 'scaling', 'rate limiting'],
-            'monitoring': ['monitoring', 'alerts', 'logging', 'metrics']
-        }
+        found = _EXPERTISE_MATCHER.find(content_lower)
         
-        for area, keywords in expertise_keywords.items():
-            if any(keyword in content_lower for keyword in keywords):
+        for area, keywords in EXPERTISE_KEYWORDS.items():
+            if any(keyword in found for keyword in keywords):
                 self.expertise.append(area)
-                print(f"  [Expertise] Identified: {area}")
+                if VERBOSE:
+                    print(f"  [Expertise] Identified: {area}")
+        
+        # Set view of the expertise list for membership checks
+        self.expertise_set = frozenset(self.expertise)
     
     def get_team_info(self) -> Dict[str, Any]:
-        """Return team information."""
-        return {
-            "team_name": self.team_name,
-            "team_lead": self.team_lead,
-            "member_count": len(self.members),
-            "expertise": self.expertise
-        }
+        """Return team information. The same dictionary is returned on every call."""
+        if self._team_info is None:
+            self._team_info = {
+                "team_name": self.team_name,
+                "team_lead": self.team_lead,
+                "member_count": len(self.members),
+                "expertise": self.expertise
+            }
+        return self._team_info
     
-    def propose_tasks(self, incident_description: str, deadline: datetime) -> List[Dict[str, Any]]:
+    def propose_tasks(self, incident_description: str, deadline: datetime) -> List[Task]:
         """
         Propose tasks that this team can do to help resolve the incident.
         
@@ -116,273 +294,219 @@ class IncidentSlaveAgent:
         Returns:
             List of proposed tasks with importance weights
         """
-        print(f"\n{'='*80}")
-        print(f"[{self.team_name}] PROPOSING TASKS")
-        print(f"{'='*80}")
-        print(f"  Incident: {incident_description[:70]}...")
-        print(f"  Deadline: {deadline.strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"  Team Expertise: {', '.join(self.expertise)}")
+        tasks, relevant = self._propose_base_tasks(incident_description, deadline)
+        if not relevant:
+            return tasks
         
-        tasks = []
-        incident_lower = incident_description.lower()
+        # Enhance with Gemini AI if available
+        if VERBOSE:
+            print(f"  [Enhancement] Checking for AI enhancement...")
+        gemini = get_gemini_enhancer()
+        if gemini.enabled:
+            tasks = gemini.enhance_task_proposals(
+                self.team_name, 
+                self.expertise, 
+                incident_description, 
+                tasks
+            )
         
-        # Analyze incident relevance to team's expertise
-        print(f"\n  [Analysis] Calculating relevance to incident...")
-        relevance_score = self._calculate_relevance(incident_description)
-        print(f"  [Analysis] Relevance score: {relevance_score}")
+        return self._finalize_tasks(tasks, deadline)
+    
+    async def propose_tasks_async(self, incident_description: str, deadline: datetime) -> List[Task]:
+        """
+        Propose tasks like propose_tasks, without blocking the event loop on Gemini.
         
-        if relevance_score == 0:
-            # Team has no relevant expertise, propose minimal support
-            print(f"  [Decision] Low relevance - proposing minimal support task")
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_SUPPORT_01",
-                "description": f"Monitor {self.team_name} systems for any related issues",
-                "importance": 1,  # Low importance
-                "estimated_hours": 2,
-                "tentative_deadline": deadline - timedelta(hours=4),
-                "assigned_to": self.team_lead,
-                "dependencies": []
-            })
-            print(f"  [Result] Proposed {len(tasks)} task(s)")
-            print(f"{'='*80}\n")
+        Args:
+            incident_description: Description of the incident
+            deadline: Deadline to resolve the incident
+            
+        Returns:
+            List of proposed tasks with importance weights
+        """
+        tasks, relevant = self._propose_base_tasks(incident_description, deadline)
+        if not relevant:
             return tasks
         
-        # Generate tasks based on team expertise and incident type
-        print(f"  [Generation] Generating expert tasks based on relevance...")
-        tasks = self._generate_expert_tasks(incident_description, deadline, relevance_score)
-        print(f"  [Generation] Generated {len(tasks)} base task(s)")
-        
         # Enhance with Gemini AI if available
-        print(f"  [Enhancement] Checking for AI enhancement...")
+        if VERBOSE:
+            print(f"  [Enhancement] Checking for AI enhancement...")
         gemini = get_gemini_enhancer()
         if gemini.enabled:
-            tasks = gemini.enhance_task_proposals(
+            tasks = await gemini.enhance_task_proposals_async(
                 self.team_name, 
                 self.expertise, 
                 incident_description, 
                 tasks
             )
         
+        return self._finalize_tasks(tasks, deadline)
+    
+    def _propose_base_tasks(self, incident_description: str,
+                            deadline: datetime) -> Tuple[List[Task], bool]:
+        """
+        Generate the rule-based tasks for an incident.
+        
+        Returns:
+            Tuple of the proposed tasks and whether the incident is relevant to
+            the team. Irrelevant incidents get a single, final support task.
+        """
+        if VERBOSE:
+            print(f"\n{'='*80}")
+            print(f"[{self.team_name}] PROPOSING TASKS")
+            print(f"{'='*80}")
+            print(f"  Incident: {incident_description[:70]}...")
+            print(f"  Deadline: {deadline.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"  Team Expertise: {', '.join(self.expertise)}")
+        
+        tasks = []
+        incident_lower = incident_description.lower()
+        hits = _INCIDENT_MATCHER.find(incident_lower)
+        
+        # Analyze incident relevance to team's expertise, unless a quick check
+        # shows that neither a keyword nor the team name could score
+        if hits.isdisjoint(self._trigger_set) and self._team_name_lower not in incident_lower:
+            relevance_score = 0
+        else:
+            if VERBOSE:
+                print(f"\n  [Analysis] Calculating relevance to incident...")
+            relevance_score = self._calculate_relevance(incident_lower, hits)
+        if VERBOSE:
+            print(f"  [Analysis] Relevance score: {relevance_score}")
+        
+        if relevance_score == 0:
+            # Team has no relevant expertise, propose minimal support
+            if VERBOSE:
+                print(f"  [Decision] Low relevance - proposing minimal support task")
+            tasks.append(Task(
+                task_id=f"{self._id_prefix}_SUPPORT_01",
+                description=f"Monitor {self.team_name} systems for any related issues",
+                importance=1,  # Low importance
+                estimated_hours=2,
+                tentative_deadline=deadline - timedelta(hours=4),
+                assigned_to=self.team_lead
+            ))
+            if VERBOSE:
+                print(f"  [Result] Proposed {len(tasks)} task(s)")
+                print(f"{'='*80}\n")
+            return tasks, False
+        
+        # Generate tasks based on team expertise and incident type
+        if VERBOSE:
+            print(f"  [Generation] Generating expert tasks based on relevance...")
+        tasks = self._generate_expert_tasks(hits, deadline, relevance_score)
+        if VERBOSE:
+            print(f"  [Generation] Generated {len(tasks)} base task(s)")
+        
+        return tasks, True
+    
+    def _finalize_tasks(self, tasks: List[Task], deadline: datetime) -> List[Task]:
+        """Fill in deadlines and assignees left open by the Gemini enhancement."""
         # Set deadlines for any tasks that don't have them
         for i, task in enumerate(tasks):
-            if task.get('tentative_deadline') is None:
+            if task.tentative_deadline is None:
                 hours_before = max(2, (len(tasks) - i) * 2)
-                task['tentative_deadline'] = deadline - timedelta(hours=hours_before)
-            if task.get('assigned_to') == 'TBD':
-                task['assigned_to'] = self.team_lead if not self.members else self.members[i % len(self.members)]
-        
-        print(f"\n  [Result] Final task count: {len(tasks)}")
-        for i, task in enumerate(tasks, 1):
-            source = task.get('source', 'rule-based')
-            print(f"    {i}. [{source}] {task['description'][:60]}... (Priority: {task['importance']})")
-        print(f"{'='*80}\n")
+                task.tentative_deadline = deadline - timedelta(hours=hours_before)
+            if task.assigned_to == 'TBD':
+                task.assigned_to = self.team_lead if not self.members else self.members[i % len(self.members)]
+        
+        if VERBOSE:
+            print(f"\n  [Result] Final task count: {len(tasks)}")
+            for i, task in enumerate(tasks, 1):
+                print(f"    {i}. [{task.source}] {task.description[:60]}... (Priority: {task.importance})")
+            print(f"{'='*80}\n")
         
         return tasks
     
-    def _calculate_relevance(self, incident_description: str) -> int:
-        """Calculate how relevant this incident is to the team's expertise."""
-        incident_lower = incident_description.lower()
+    def _calculate_relevance(self, incident_lower: str, hits: FrozenSet[str]) -> int:
+        """
+        Calculate how relevant this incident is to the team's expertise.
+        
+        Args:
+            incident_lower: Lowercased incident description
+            hits: Incident keywords found in the description
+            
+        Returns:
+            Relevance score, 0 when the team has nothing to contribute
+        """
         score = 0
         
         # Check if team name is mentioned
-        if self.team_name.lower() in incident_lower:
+        if self._team_name_lower in incident_lower:
             score += 20
-            print(f"    • Team name mentioned: +20 points")
+            if VERBOSE:
+                print(f"    • Team name mentioned: +20 points")
         
         # Check expertise match
         for expertise in self.expertise:
-            if expertise in incident_lower:
+            if expertise in hits:
                 score += 10
-                print(f"    • Expertise '{expertise}' matches: +10 points")
-        
-        # Check for specific keywords in team content
-        if 'outage' in incident_lower or 'down' in incident_lower:
-            if 'infrastructure' in self.expertise or 'backend' in self.expertise:
-                score += 15
-                print(f"    • Outage/down + infrastructure/backend: +15 points")
-        
-        if 'security' in incident_lower or 'breach' in incident_lower:
-            if 'security' in self.expertise:
-                score += 20
-                print(f"    • Security incident + security expertise: +20 points")
+                if VERBOSE:
+                    print(f"    • Expertise '{expertise}' matches: +10 points")
         
-        if 'performance' in incident_lower or 'slow' in incident_lower:
-            if 'performance' in self.expertise or 'database' in self.expertise:
-                score += 15
-                print(f"    • Performance issue + relevant expertise: +15 points")
+        # Check for incident keywords that call for the team's expertise
+        for keywords, areas, points, reason in RELEVANCE_RULES:
+            if (any(keyword in hits for keyword in keywords) and
+                    any(area in self.expertise_set for area in areas)):
+                score += points
+                if VERBOSE:
+                    print(f"    • {reason}: +{points} points")
         
         return score
     
-    def _generate_expert_tasks(self, incident_description: str, deadline: datetime, 
-                               relevance_score: int) -> List[Dict[str, Any]]:
+    def _relevance_triggers(self) -> FrozenSet[str]:
+        """Return the incident keywords that add to this team's relevance score."""
+        triggers = set(self.expertise_set)
+        for keywords, areas, _, _ in RELEVANCE_RULES:
+            if not self.expertise_set.isdisjoint(areas):
+                triggers.update(keywords)
+        return frozenset(triggers)
+    
+    def _generate_expert_tasks(self, hits: FrozenSet[str], deadline: datetime, 
+                               relevance_score: int) -> List[Task]:
         """Generate tasks based on team's expertise."""
         tasks = []
-        incident_lower = incident_description.lower()
         
         # Determine task importance based on relevance
         base_importance = min(10, max(1, relevance_score // 5))
         
-        # Generate tasks based on team type
-        if 'security' in self.expertise:
-            tasks.extend(self._generate_security_tasks(incident_description, deadline, base_importance))
-        
-        if 'infrastructure' in self.expertise or 'backend' in self.expertise:
-            tasks.extend(self._generate_infrastructure_tasks(incident_description, deadline, base_importance))
-        
-        if 'frontend' in self.expertise:
-            tasks.extend(self._generate_frontend_tasks(incident_description, deadline, base_importance))
-        
-        if 'database' in self.expertise:
-            tasks.extend(self._generate_database_tasks(incident_description, deadline, base_importance))
+        # Generate tasks from every rule matching the team type and incident
+        for areas, keywords, specs in TASK_RULES:
+            if (any(area in self.expertise_set for area in areas) and
+                    any(keyword in hits for keyword in keywords)):
+                tasks.extend(self._instantiate_tasks(specs, deadline, base_importance))
         
         # If no specific tasks generated, create general support tasks
         if not tasks:
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_INVESTIGATE_01",
-                "description": f"Investigate incident impact on {self.team_name} systems",
-                "importance": base_importance,
-                "estimated_hours": 3,
-                "tentative_deadline": deadline - timedelta(hours=6),
-                "assigned_to": self.team_lead,
-                "dependencies": []
-            })
-        
-        return tasks
-    
-    def _generate_security_tasks(self, incident: str, deadline: datetime, 
-                                 base_importance: int) -> List[Dict[str, Any]]:
-        """Generate security-related tasks."""
-        tasks = []
-        incident_lower = incident.lower()
-        
-        if 'security' in incident_lower or 'breach' in incident_lower or 'vulnerability' in incident_lower:
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_SEC_01",
-                "description": "Conduct immediate security audit of affected systems",
-                "importance": base_importance + 3,
-                "estimated_hours": 4,
-                "tentative_deadline": deadline - timedelta(hours=8),
-                "assigned_to": self.members[0] if self.members else self.team_lead,
-                "dependencies": []
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_SEC_02",
-                "description": "Review access logs for suspicious activity",
-                "importance": base_importance + 2,
-                "estimated_hours": 3,
-                "tentative_deadline": deadline - timedelta(hours=6),
-                "assigned_to": self.members[1] if len(self.members) > 1 else self.team_lead,
-                "dependencies": [f"{self.team_name.replace(' ', '_')}_SEC_01"]
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_SEC_03",
-                "description": "Implement security patches and hotfixes",
-                "importance": base_importance + 4,
-                "estimated_hours": 6,
-                "tentative_deadline": deadline - timedelta(hours=2),
-                "assigned_to": self.team_lead,
-                "dependencies": [f"{self.team_name.replace(' ', '_')}_SEC_01"]
-            })
-        
-        return tasks
-    
-    def _generate_infrastructure_tasks(self, incident: str, deadline: datetime,
-                                       base_importance: int) -> List[Dict[str, Any]]:
-        """Generate infrastructure-related tasks."""
-        tasks = []
-        incident_lower = incident.lower()
-        
-        if 'outage' in incident_lower or 'down' in incident_lower or 'unavailable' in incident_lower:
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_INFRA_01",
-                "description": "Check server health and resource utilization",
-                "importance": base_importance + 4,
-                "estimated_hours": 2,
-                "tentative_deadline": deadline - timedelta(hours=10),
-                "assigned_to": self.members[0] if self.members else self.team_lead,
-                "dependencies": []
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_INFRA_02",
-                "description": "Restart affected services and verify connectivity",
-                "importance": base_importance + 5,
-                "estimated_hours": 3,
-                "tentative_deadline": deadline - timedelta(hours=6),
-                "assigned_to": self.team_lead,
-                "dependencies": [f"{self.team_name.replace(' ', '_')}_INFRA_01"]
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_INFRA_03",
-                "description": "Scale up resources if needed",
-                "importance": base_importance + 3,
-                "estimated_hours": 4,
-                "tentative_deadline": deadline - timedelta(hours=4),
-                "assigned_to": self.members[1] if len(self.members) > 1 else self.team_lead,
-                "dependencies": [f"{self.team_name.replace(' ', '_')}_INFRA_01"]
-            })
+            tasks.append(Task(
+                task_id=f"{self._id_prefix}_INVESTIGATE_01",
+                description=f"Investigate incident impact on {self.team_name} systems",
+                importance=base_importance,
+                estimated_hours=3,
+                tentative_deadline=deadline - timedelta(hours=6),
+                assigned_to=self.team_lead
+            ))
         
         return tasks
     
-    def _generate_frontend_tasks(self, incident: str, deadline: datetime,
-                                 base_importance: int) -> List[Dict[str, Any]]:
-        """Generate frontend-related tasks."""
+    def _instantiate_tasks(self, specs: Iterable[TaskSpec], deadline: datetime,
+                           base_importance: int) -> List[Task]:
+        """Create this team's tasks from rule-based task templates."""
+        members = self.members
         tasks = []
-        incident_lower = incident.lower()
-        
-        if 'ui' in incident_lower or 'frontend' in incident_lower or 'user' in incident_lower:
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_FRONT_01",
-                "description": "Display user-facing incident notification",
-                "importance": base_importance + 2,
-                "estimated_hours": 2,
-                "tentative_deadline": deadline - timedelta(hours=8),
-                "assigned_to": self.members[0] if self.members else self.team_lead,
-                "dependencies": []
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_FRONT_02",
-                "description": "Implement graceful degradation for affected features",
-                "importance": base_importance + 3,
-                "estimated_hours": 5,
-                "tentative_deadline": deadline - timedelta(hours=4),
-                "assigned_to": self.team_lead,
-                "dependencies": []
-            })
-        
-        return tasks
-    
-    def _generate_database_tasks(self, incident: str, deadline: datetime,
-                                 base_importance: int) -> List[Dict[str, Any]]:
-        """Generate database-related tasks."""
-        tasks = []
-        incident_lower = incident.lower()
-        
-        if 'database' in incident_lower or 'data' in incident_lower or 'slow' in incident_lower:
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_DB_01",
-                "description": "Analyze database query performance",
-                "importance": base_importance + 3,
-                "estimated_hours": 3,
-                "tentative_deadline": deadline - timedelta(hours=8),
-                "assigned_to": self.members[0] if self.members else self.team_lead,
-                "dependencies": []
-            })
-            
-            tasks.append({
-                "task_id": f"{self.team_name.replace(' ', '_')}_DB_02",
-                "description": "Optimize slow queries and add indexes",
-                "importance": base_importance + 4,
-                "estimated_hours": 5,
-                "tentative_deadline": deadline - timedelta(hours=3),
-                "assigned_to": self.team_lead,
-                "dependencies": [f"{self.team_name.replace(' ', '_')}_DB_01"]
-            })
-        
+        for spec in specs:
+            if spec.assignee is not None and spec.assignee < len(members):
+                assigned_to = members[spec.assignee]
+            else:
+                assigned_to = self.team_lead
+            tasks.append(Task(
+                task_id=f"{self._id_prefix}_{spec.suffix}",
+                description=spec.description,
+                importance=base_importance + spec.importance_delta,
+                estimated_hours=spec.estimated_hours,
+                tentative_deadline=deadline - timedelta(hours=spec.hours_before),
+                assigned_to=assigned_to,
+                dependencies=tuple(f"{self._id_prefix}_{dep}" for dep in spec.dependencies)
+            ))
         return tasks
     
     def __repr__(self):
@@ -0,0 +1,67 @@
+"""
+Incident Response Task
+Lightweight record for a task proposed by a team agent
+"""
+
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Any, Optional, Tuple
+
+
+# slots=True needs Python 3.10+; older interpreters fall back to a regular dataclass
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class Task:
+    """
+    A single task proposed by a team to help resolve an incident.
+    """
+    task_id: str
+    description: str
+    importance: int
+    estimated_hours: float
+    tentative_deadline: Optional[datetime]
+    assigned_to: str
+    dependencies: Tuple[str, ...] = ()
+    source: str = "rule-based"
+    justification: str = ""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return a JSON-safe dictionary, with the deadline as an ISO string.
+        
+        source and justification are only included for tasks that are not
+        rule-based, as in the original dictionary tasks.
+        """
+        deadline = self.tentative_deadline
+        data = {
+            "task_id": self.task_id,
+            "description": self.description,
+            "importance": self.importance,
+            "estimated_hours": self.estimated_hours,
+            "tentative_deadline": deadline.isoformat() if isinstance(deadline, datetime) else deadline,
+            "assigned_to": self.assigned_to,
+            "dependencies": list(self.dependencies)
+        }
+        if self.source != "rule-based":
+            data["source"] = self.source
+            data["justification"] = self.justification
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Task":
+        """Rebuild a task from a to_dict result."""
+        deadline = data["tentative_deadline"]
+        return cls(
+            task_id=data["task_id"],
+            description=data["description"],
+            importance=data["importance"],
+            estimated_hours=data["estimated_hours"],
+            tentative_deadline=datetime.fromisoformat(deadline) if deadline is not None else None,
+            assigned_to=data["assigned_to"],
+            dependencies=tuple(data["dependencies"]),
+            source=data.get("source", "rule-based"),
+            justification=data.get("justification", "")
+        )
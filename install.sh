@@ -32,6 +32,22 @@ fi
 echo "✓ Dependencies installed"
 echo ""
 
+# Vendor the graph library so the web page does not fetch it from a CDN on every load.
+# The version is pinned to match VIS_NETWORK_VERSION in web_server.py.
+VIS_NETWORK_VERSION=9.1.9
+if [ ! -f static/vis-network.min.js ] || [ "$(cat static/.vis-network-version 2>/dev/null)" != "$VIS_NETWORK_VERSION" ]; then
+    echo "Downloading vis-network $VIS_NETWORK_VERSION..."
+    mkdir -p static
+    if curl -fsSL -o static/vis-network.min.js "https://unpkg.com/vis-network@$VIS_NETWORK_VERSION/standalone/umd/vis-network.min.js"; then
+        echo "$VIS_NETWORK_VERSION" > static/.vis-network-version
+        echo "✓ vis-network saved to static/"
+    else
+        rm -f static/vis-network.min.js static/.vis-network-version
+        echo "⚠️  Could not download vis-network; the web page will load it from the CDN"
+    fi
+    echo ""
+fi
+
 # Create .env file if it doesn't exist
 if [ ! -f .env ]; then
     echo "Creating .env file from template..."
@@ -3,10 +3,35 @@ Master Agent - Intelligently coordinates slave agents to answer user queries
 The master agent selects which slave agents to query based on their capabilities
 """
 
+import heapq
 import os
 import re
-from typing import List, Dict, Any, Tuple
-from slave_agent import SlaveAgent
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import List, Dict, Any, Optional, Set, Tuple
+from slave_agent import QueryContext, SlaveAgent
+
+
+# Upper-case words (likely project/issue names) and issue IDs (e.g., TSUNAMI-101)
+_CAPITALIZED_RE = re.compile(r'\b([A-Z][A-Z]+)\b')
+_ISSUE_ID_RE = re.compile(r'\b([A-Z]+-\d+)\b')
+
+# Terms that route a query to agents, found anywhere in the lowercased query
+# (so "meetings" also yields "meeting"); the lookahead finds overlapping hits
+_IMPORTANT_TERMS = (
+    'meeting', 'issue', 'ticket', 'jira', 'confluence', 'slack',
+    'frontend', 'backend', 'infrastructure', 'security', 'team'
+)
+_IMPORTANT_TERM_RE = re.compile('(?=(' + '|'.join(_IMPORTANT_TERMS) + '))')
+
+# Keywords whose per-agent capability matches the master remembers before starting over
+_MAX_KEYWORD_COLUMNS = 1024
+
+# Rule printed around query output
+_SEP = "=" * 80
+
+# Issues kept in an aggregated answer, most relevant first
+_MAX_ISSUES_SHOWN = 10
 
 
 class MasterAgent:
@@ -25,25 +50,48 @@ class MasterAgent:
         self.team_info_directory = team_info_directory
         self.slave_agents: List[SlaveAgent] = []
         self._initialize_slave_agents()
+        
+        # keyword -> (agent index, matching capabilities) for each agent the keyword matches
+        self._keyword_columns: Dict[str, Tuple[Tuple[int, Tuple[str, ...]], ...]] = {}
+        self._index_capabilities()
+        self._index_team_names()
+        
+        # One pool for every query; worker threads start on first use and are reused after
+        self._pool = ThreadPoolExecutor(max_workers=max(1, min(32, len(self.slave_agents))))
     
     def _initialize_slave_agents(self):
         """Create a slave agent for each team info file."""
-        if not os.path.exists(self.team_info_directory):
+        # Find all text files in the directory; scandir reports the file type with each entry
+        try:
+            with os.scandir(self.team_info_directory) as entries:
+                file_paths = [
+                    entry.path for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file()
+                ]
+        except FileNotFoundError:
             raise FileNotFoundError(f"Team info directory not found: {self.team_info_directory}")
         
-        # Find all text files in the directory
-        for filename in os.listdir(self.team_info_directory):
-            if filename.endswith('.txt'):
-                file_path = os.path.join(self.team_info_directory, filename)
-                try:
-                    agent = SlaveAgent(file_path)
-                    self.slave_agents.append(agent)
-                    print(f"✓ Initialized slave agent for: {agent.team_name}")
-                except Exception as e:
-                    print(f"✗ Failed to initialize agent for {filename}: {str(e)}")
+        # Read and parse the team files concurrently; map keeps directory order
+        with ThreadPoolExecutor(max_workers=max(1, min(32, len(file_paths)))) as executor:
+            outcomes = list(executor.map(self._create_slave_agent, file_paths))
+        
+        for file_path, (agent, error) in zip(file_paths, outcomes):
+            if agent is not None:
+                self.slave_agents.append(agent)
+                print(f"✓ Initialized slave agent for: {agent.team_name}")
+            else:
+                print(f"✗ Failed to initialize agent for {os.path.basename(file_path)}: {str(error)}")
         
         print(f"\nTotal slave agents initialized: {len(self.slave_agents)}")
     
+    @staticmethod
+    def _create_slave_agent(file_path: str) -> Tuple[Optional[SlaveAgent], Optional[Exception]]:
+        """Create a slave agent, returning the error instead of raising it."""
+        try:
+            return SlaveAgent(file_path), None
+        except Exception as e:
+            return None, e
+    
     def get_all_agents_info(self) -> List[Dict[str, Any]]:
         """Get identity information from all slave agents."""
         return [agent.get_identity() for agent in self.slave_agents]
@@ -52,6 +100,8 @@ class MasterAgent:
         """
         Extract important keywords from the user's query.
         
+        Keywords that no loaded agent's capabilities contain are left out.
+        
         Args:
             query: User's question
             
@@ -61,66 +111,128 @@ class MasterAgent:
         keywords = []
         
         # Extract capitalized words (likely project/issue names)
-        capitalized = re.findall(r'\b([A-Z][A-Z]+)\b', query)
+        capitalized = _CAPITALIZED_RE.findall(query)
         keywords.extend(capitalized)
         
         # Extract issue IDs (e.g., TSUNAMI-101)
-        issue_ids = re.findall(r'\b([A-Z]+-\d+)\b', query)
+        issue_ids = _ISSUE_ID_RE.findall(query)
         keywords.extend(issue_ids)
         
-        # Extract important terms
-        important_terms = [
-            'meeting', 'issue', 'ticket', 'jira', 'confluence', 'slack',
-            'frontend', 'backend', 'infrastructure', 'security', 'team'
+        # Extract important terms in one scan of the query
+        found = set(_IMPORTANT_TERM_RE.findall(query.lower()))
+        if found:
+            keywords.extend(term for term in _IMPORTANT_TERMS if term in found)
+        
+        capability_text_upper = self._capability_text_upper
+        capability_text_lower = self._capability_text_lower
+        return [
+            keyword for keyword in set(keywords)
+            if keyword.upper() in capability_text_upper or keyword.lower() in capability_text_lower
         ]
+    
+    def _index_capabilities(self):
+        """
+        Join every agent's capabilities into one upper- and one lowercase text.
         
-        query_lower = query.lower()
-        for term in important_terms:
-            if term in query_lower:
-                keywords.append(term)
+        A keyword can only match a capability it is a substring of (ignoring case),
+        so a keyword found in neither text matches no agent in this deployment.
+        """
+        capabilities = [capability for agent in self.slave_agents for capability in agent.capabilities]
+        self._capability_text_upper = '\n'.join(capability.upper() for capability in capabilities)
+        self._capability_text_lower = '\n'.join(capability.lower() for capability in capabilities)
+    
+    def _index_team_names(self):
+        """
+        Index team names so one scan of a query finds every team it mentions.
+        
+        Each name maps to the agents whose names it contains, so a team whose name
+        is part of a longer one is still found where the longer name matches.
+        """
+        names = {agent._team_name_lower for agent in self.slave_agents}
+        self._agents_by_name: Dict[str, Tuple[int, ...]] = {
+            name: tuple(
+                index for index, agent in enumerate(self.slave_agents)
+                if agent._team_name_lower in name
+            )
+            for name in names
+        }
         
-        return list(set(keywords))
+        # Longest names first; the lookahead reports a match starting at every position
+        alternatives = '|'.join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+        self._team_name_re = re.compile('(?=(' + alternatives + '))')
     
-    def _score_agent_relevance(self, agent: SlaveAgent, query: str, keywords: List[str]) -> Tuple[int, List[str]]:
+    def _mentioned_agents(self, query_lower: str) -> Set[int]:
+        """Return the indices of the agents whose team name appears in the query."""
+        mentioned = set()
+        for name in self._team_name_re.findall(query_lower):
+            mentioned.update(self._agents_by_name.get(name, ()))
+        return mentioned
+    
+    def _keyword_column(self, keyword: str) -> Tuple[Tuple[int, Tuple[str, ...]], ...]:
         """
-        Score how relevant an agent is to the query.
+        Return the agents a keyword matches, with the capabilities it matches in each.
+        
+        Agents and their capabilities are fixed after loading, so each keyword's
+        column is built once and only agents with a match are listed.
         
         Args:
-            agent: The slave agent to score
-            query: User's question
+            keyword: Keyword extracted from a query
+            
+        Returns:
+            Tuple of (agent index, matching capabilities), in agent order
+        """
+        column = self._keyword_columns.get(keyword)
+        if column is None:
+            column = tuple(
+                (index, matches)
+                for index, matches in enumerate(agent.match_capabilities(keyword) for agent in self.slave_agents)
+                if matches
+            )
+            if len(self._keyword_columns) >= _MAX_KEYWORD_COLUMNS:
+                self._keyword_columns.clear()
+            self._keyword_columns[keyword] = column
+        return column
+    
+    def _score_agents(self, query_lower: str, keywords: List[str],
+                      general_bonus: int = 0) -> List[Tuple[int, int, List[str]]]:
+        """
+        Score the agents relevant to the query.
+        
+        Only agents a keyword matches or the query names are scored, unless the
+        general bonus makes every agent relevant.
+        
+        Args:
+            query_lower: User's question, lowercased
             keywords: Extracted keywords from the query
+            general_bonus: Points added for a very general query
             
         Returns:
-            Tuple of (relevance_score, matching_capabilities)
+            List of (agent index, relevance_score, matching_capabilities) for agents
+            with a positive score, in agent order
         """
-        score = 0
-        matching_capabilities = []
+        columns = [self._keyword_column(keyword) for keyword in keywords]
+        mentioned = self._mentioned_agents(query_lower)
+        
+        if general_bonus > 0:
+            candidates = range(len(self.slave_agents))
+        else:
+            candidates = sorted({index for column in columns for index, _ in column} | mentioned)
         
-        identity = agent.get_identity()
-        capabilities = identity['capabilities']
+        scores = dict.fromkeys(candidates, general_bonus)
+        matching_capabilities: Dict[int, List[str]] = {index: [] for index in candidates}
         
         # Check if keywords match capabilities
-        for keyword in keywords:
-            keyword_upper = keyword.upper()
-            keyword_lower = keyword.lower()
-            
-            for capability in capabilities:
-                if keyword_upper in capability.upper() or keyword_lower in capability.lower():
-                    score += 10
-                    matching_capabilities.append(capability)
+        for column in columns:
+            for index, matches in column:
+                scores[index] += 10 * len(matches)
+                matching_capabilities[index].extend(matches)
         
         # Check if team name is mentioned in query
-        team_name = identity['team_name'].lower()
-        if team_name in query.lower():
-            score += 20
-            matching_capabilities.append(f"team:{identity['team_name']}")
-        
-        # If query is very general, include all agents with lower score
-        general_terms = ['all', 'every', 'total', 'overall']
-        if any(term in query.lower() for term in general_terms):
-            score += 1
+        for index in mentioned:
+            scores[index] += 20
+            matching_capabilities[index].append(f"team:{self.slave_agents[index].team_name}")
         
-        return score, matching_capabilities
+        return [(index, scores[index], matching_capabilities[index]) for index in candidates]
     
     def _select_agents(self, query: str) -> List[Tuple[SlaveAgent, int, List[str]]]:
         """
@@ -133,13 +245,17 @@ class MasterAgent:
             List of tuples (agent, relevance_score, matching_capabilities)
         """
         keywords = self._extract_query_keywords(query)
+        query_lower = query.lower()
+        
+        # If query is very general, include all agents with lower score
+        general_terms = ['all', 'every', 'total', 'overall']
+        general_bonus = 1 if any(term in query_lower for term in general_terms) else 0
         
-        # Score all agents
-        scored_agents = []
-        for agent in self.slave_agents:
-            score, matching = self._score_agent_relevance(agent, query, keywords)
-            if score > 0:
-                scored_agents.append((agent, score, matching))
+        # Score the relevant agents
+        scored_agents = [
+            (self.slave_agents[index], score, matching)
+            for index, score, matching in self._score_agents(query_lower, keywords, general_bonus)
+        ]
         
         # Sort by relevance score (highest first)
         scored_agents.sort(key=lambda x: x[1], reverse=True)
@@ -162,9 +278,9 @@ class MasterAgent:
             Dictionary containing the aggregated results
         """
         if verbose:
-            print(f"\n{'='*80}")
+            print(f"\n{_SEP}")
             print(f"MASTER AGENT: Processing query")
-            print(f"{'='*80}")
+            print(_SEP)
             print(f"Query: {query}\n")
         
         # Select relevant agents
@@ -182,19 +298,25 @@ class MasterAgent:
                     print(f"     Matching capabilities: {', '.join(matching)}")
             print()
         
-        # Query selected agents
-        results = []
-        for agent, score, matching in selected_agents:
-            if verbose:
+        # Query selected agents concurrently; map keeps answers in relevance order
+        if verbose:
+            for agent, score, matching in selected_agents:
                 print(f"Querying: {agent.team_name}...")
-            
-            answer = agent.answer_query(query)
+        
+        # Tokenize the query once for every agent
+        ctx = QueryContext.from_query(query)
+        answers = list(self._pool.map(lambda selected: selected[0].answer_query(query, ctx), selected_agents))
+        
+        results = []
+        for (agent, score, matching), answer in zip(selected_agents, answers):
             answer['relevance_score'] = score
             answer['matching_capabilities'] = matching
             results.append(answer)
             
             if verbose:
-                print(f"  ✓ Response received\n")
+                print(f"  ✓ Response received from {agent.team_name}")
+        if verbose:
+            print()
         
         # Aggregate results
         aggregated = self._aggregate_results(query, results)
@@ -240,12 +362,10 @@ class MasterAgent:
             total_meetings = sum(r.get('meeting_count', 0) for r in results)
             all_meetings = []
             for result in results:
-                for meeting in result.get('meetings', []):
-                    meeting['team'] = result['team_name']
-                    all_meetings.append(meeting)
+                all_meetings.extend(result.get('meetings', []))
             
             # Sort by date
-            all_meetings.sort(key=lambda x: x['date'], reverse=True)
+            all_meetings.sort(key=attrgetter('date'), reverse=True)
             
             aggregated['summary'] = {
                 "type": "meetings",
@@ -258,12 +378,10 @@ class MasterAgent:
             total_issues = sum(r.get('issue_count', 0) for r in results)
             all_issues = []
             for result in results:
-                for issue in result.get('issues', []):
-                    issue['team'] = result['team_name']
-                    all_issues.append(issue)
+                all_issues.extend(result.get('issues', []))
             
-            # Sort by relevance
-            all_issues.sort(key=lambda x: x['relevance'], reverse=True)
+            # Keep only the most relevant issues; ties stay in team order
+            all_issues = heapq.nlargest(_MAX_ISSUES_SHOWN, all_issues, key=attrgetter('relevance'))
             
             aggregated['summary'] = {
                 "type": "issues",
@@ -291,9 +409,9 @@ class MasterAgent:
             Formatted string response
         """
         output = []
-        output.append("\n" + "="*80)
+        output.append("\n" + _SEP)
         output.append("MASTER AGENT: Final Answer")
-        output.append("="*80 + "\n")
+        output.append(_SEP + "\n")
         
         summary = aggregated_results.get('summary', {})
         summary_type = summary.get('type')
@@ -311,9 +429,9 @@ class MasterAgent:
             
             meetings = summary.get('all_meetings', [])
             for meeting in meetings:
-                output.append(f"• {meeting['date']} - {meeting['team']}")
+                output.append(f"• {meeting.date} - {meeting.team}")
                 # Extract first line of meeting info
-                first_line = meeting['info'].split('\n')[0]
+                first_line = meeting.info.partition('\n')[0]
                 output.append(f"  {first_line}")
         
         elif summary_type == 'issues':
@@ -321,10 +439,10 @@ class MasterAgent:
             output.append(f"Total Issues Found: {total}\n")
             
             issues = summary.get('all_issues', [])
-            for issue in issues[:10]:  # Show top 10
-                output.append(f"• {issue['issue_id']} - {issue['team']}")
+            for issue in issues[:_MAX_ISSUES_SHOWN]:
+                output.append(f"• {issue.issue_id} - {issue.team}")
                 # Extract first line of issue info
-                first_line = issue['info'].split('\n')[0]
+                first_line = issue.info.partition('\n')[0]
                 output.append(f"  {first_line}")
         
         else:
@@ -333,7 +451,7 @@ class MasterAgent:
                 output.append(f"• {result['team_name']}")
                 output.append(f"  Relevance score: {result.get('relevance_score', 0)}")
         
-        output.append("\n" + "="*80)
+        output.append("\n" + _SEP)
         
         return "\n".join(output)
     
@@ -351,5 +469,9 @@ class MasterAgent:
         results = self.process_query(query, verbose=verbose)
         return self.format_response(results)
     
+    def close(self):
+        """Shut down the worker pool used to query slave agents."""
+        self._pool.shutdown(wait=True)
+    
     def __repr__(self):
         return f"MasterAgent(slave_agents={len(self.slave_agents)})"
@@ -3,8 +3,110 @@ Slave Agent - Represents knowledge about a specific team
 Each slave agent only knows about its team's information and can answer queries about it
 """
 
+import heapq
 import re
-from typing import Dict, Any, List
+import sys
+import threading
+from collections import OrderedDict, namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Pattern, Tuple
+
+
+# Team file header fields
+_TEAM_NAME_RE = re.compile(r'Team Name:\s*(.+)')
+_TEAM_LEAD_RE = re.compile(r'Team Lead:\s*(.+)')
+_MEMBERS_RE = re.compile(r'Members:\s*(.+)')
+
+# Topics, data sources and meetings a team file can answer questions about, found in
+# its lowercased content; the lookahead also reports terms that overlap one another
+_ISSUE_TOPIC_RE = re.compile(r'([a-z]+-\d+)')  # JIRA-style issue IDs
+_DOMAIN_TERMS = ('frontend', 'backend', 'infrastructure', 'security')
+_SOURCE_TERMS = ('jira', 'confluence', 'slack')
+_CAPABILITY_TERM_RE = re.compile(
+    '(?=(' + '|'.join(('tsunami',) + _DOMAIN_TERMS + _SOURCE_TERMS + ('meeting',)) + '))'
+)
+
+# Phrases in a count query that are followed by the term to count
+_COUNT_QUERY_PATTERNS = [
+    re.compile(r'how many times.*?(\w+)', re.IGNORECASE),
+    re.compile(r'count.*?(\w+)', re.IGNORECASE),
+    re.compile(r'occurrences of (\w+)', re.IGNORECASE),
+]
+
+_CAPITALIZED_RE = re.compile(r'\b([A-Z][A-Z]+)\b')
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Meeting and issue entries in a team file
+_MEETING_RE = re.compile(r'- (\d{4}-\d{2}-\d{2}):\s*(.+?)(?=\n  - |\n\n|\Z)', re.DOTALL)
+_ISSUE_RE = re.compile(r'- ([A-Z]+-\d+):\s*(.+?)(?=\n  - |\n\n- [A-Z]+-|\n\n===|\Z)', re.DOTALL)
+
+
+# slots=True needs Python 3.10+; older interpreters fall back to a regular dataclass
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Entries returned by meeting and issue queries, tagged with the team they came from
+Meeting = namedtuple('Meeting', 'date info relevance team')
+Issue = namedtuple('Issue', 'issue_id info relevance team')
+
+# Keywords whose capability matches each agent remembers before starting over
+_MAX_CAPABILITY_MATCHES = 1024
+
+# Answers each agent keeps for repeated queries, least recently used evicted first
+ANSWER_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=256)
+def _term_pattern(term: str) -> Pattern[str]:
+    """Return the whole-word pattern for a lowercase term, shared by all agents."""
+    return re.compile(r'\b' + re.escape(term) + r'\b')
+
+
+def _words(text: str) -> FrozenSet[str]:
+    """Return the distinct lowercase words in a piece of text."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
+def _copy_answer(answer: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an answer deep enough that callers can annotate it and its entries."""
+    copied = dict(answer)
+    for key, value in copied.items():
+        if isinstance(value, list):
+            copied[key] = [dict(item) if isinstance(item, dict) else item for item in value]
+        elif isinstance(value, dict):
+            copied[key] = dict(value)
+    return copied
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class QueryContext:
+    """
+    A query preprocessed once so every slave agent answering it can share the work.
+    """
+    raw: str
+    lower: str
+    terms: FrozenSet[str]
+    is_all: bool
+    count_terms: Tuple[str, ...]
+    
+    @classmethod
+    def from_query(cls, query: str) -> "QueryContext":
+        """Tokenize a query and extract the terms a count query asks about."""
+        query_lower = query.lower()
+        
+        # Terms after "how many times"/"count"/"occurrences of", plus capitalized words
+        terms_to_count = []
+        for pattern in _COUNT_QUERY_PATTERNS:
+            terms_to_count.extend(pattern.findall(query))
+        terms_to_count.extend(_CAPITALIZED_RE.findall(query))
+        
+        return cls(
+            raw=query,
+            lower=query_lower,
+            terms=frozenset(_WORD_RE.findall(query_lower)),
+            is_all="all" in query_lower,
+            count_terms=tuple(set(terms_to_count))
+        )
 
 
 class SlaveAgent:
@@ -13,6 +115,13 @@ class SlaveAgent:
     It can identify itself and answer questions about its team's information.
     """
     
+    __slots__ = (
+        'team_file_path', 'team_name', 'team_lead', 'members', 'capabilities',
+        '_content_lower', '_sections', '_meetings', '_issues',
+        '_team_name_lower', '_capabilities_cf', '_capability_matches', '_identity',
+        '_answer_cache', '_answer_lock'
+    )
+    
     def __init__(self, team_file_path: str):
         """
         Initialize the slave agent with team information from a file.
@@ -24,30 +133,70 @@ class SlaveAgent:
         self.team_name = ""
         self.team_lead = ""
         self.members = []
-        self.content = ""
+        self._content_lower = ""
+        self._sections: List[Tuple[str, FrozenSet[str]]] = []
+        self._meetings: List[Tuple[str, str, FrozenSet[str]]] = []
+        self._issues: List[Tuple[str, str, FrozenSet[str]]] = []
         self.capabilities = []
         
         self._load_team_info()
         self._identify_capabilities()
+        
+        # Team data never changes after loading, so derive lookup forms once
+        self._team_name_lower = self.team_name.lower()
+        self._capabilities_cf = [(c, c.upper(), c.lower()) for c in self.capabilities]
+        self._capability_matches: Dict[str, Tuple[str, ...]] = {}
+        self._identity = {
+            "team_name": self.team_name,
+            "team_lead": self.team_lead,
+            "member_count": len(self.members),
+            "capabilities": self.capabilities,
+            "file_path": self.team_file_path
+        }
+        self._answer_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._answer_lock = threading.Lock()
+    
+    @property
+    def content(self) -> str:
+        """Full text of the team file, rebuilt from its sections on each access."""
+        return '\n\n'.join(section for section, _ in self._sections)
     
     def _load_team_info(self):
         """Load and parse team information from the file."""
         try:
             with open(self.team_file_path, 'r', encoding='utf-8') as f:
-                self.content = f.read()
+                content = f.read()
+            
+            # Lowercase once; every case-insensitive scan runs on this copy
+            self._content_lower = content.lower()
+            
+            # Split sections and extract meeting and issue entries once, each with
+            # the set of words it contains; queries only score these. The sections
+            # also stand in for the full text, which is not kept
+            self._sections = [
+                (section, _words(section)) for section in content.split('\n\n')
+            ]
+            self._meetings = [
+                (date, meeting_info.strip(), _words(meeting_info))
+                for date, meeting_info in _MEETING_RE.findall(content)
+            ]
+            self._issues = [
+                (issue_id, issue_info.strip(), _words(issue_info))
+                for issue_id, issue_info in _ISSUE_RE.findall(content)
+            ]
             
             # Extract team name
-            team_name_match = re.search(r'Team Name:\s*(.+)', self.content)
+            team_name_match = _TEAM_NAME_RE.search(content)
             if team_name_match:
                 self.team_name = team_name_match.group(1).strip()
             
             # Extract team lead
-            team_lead_match = re.search(r'Team Lead:\s*(.+)', self.content)
+            team_lead_match = _TEAM_LEAD_RE.search(content)
             if team_lead_match:
                 self.team_lead = team_lead_match.group(1).strip()
             
             # Extract members
-            members_match = re.search(r'Members:\s*(.+)', self.content)
+            members_match = _MEMBERS_RE.search(content)
             if members_match:
                 members_str = members_match.group(1).strip()
                 self.members = [m.strip() for m in members_str.split(',')]
@@ -64,37 +213,34 @@ class SlaveAgent:
         """
         self.capabilities = []
         
-        # Identify key topics and keywords
-        content_lower = self.content.lower()
+        content_lower = self._content_lower
         
         # Add team name as primary capability
         if self.team_name:
             self.capabilities.append(f"team:{self.team_name}")
         
-        # Identify specific projects/issues mentioned
-        issue_patterns = [
-            r'([A-Z]+-\d+)',  # JIRA-style issue IDs
-            r'(TSUNAMI)',
-            r'(frontend|backend|infrastructure|security)',
-        ]
+        # One scan finds every other term; dict keys keep first-occurrence order
+        found = dict.fromkeys(_CAPABILITY_TERM_RE.findall(content_lower))
         
-        for pattern in issue_patterns:
-            matches = re.findall(pattern, self.content, re.IGNORECASE)
-            for match in matches:
-                capability = f"topic:{match.upper()}"
-                if capability not in self.capabilities:
-                    self.capabilities.append(capability)
+        # Identify specific projects/issues mentioned: issue IDs, then TSUNAMI, then domains
+        topics = [match.upper() for match in _ISSUE_TOPIC_RE.findall(content_lower)]
+        if 'tsunami' in found:
+            topics.append('TSUNAMI')
+        topics.extend(term.upper() for term in found if term in _DOMAIN_TERMS)
+        
+        seen_topics = set()
+        for topic in topics:
+            if topic not in seen_topics:
+                seen_topics.add(topic)
+                self.capabilities.append(f"topic:{topic}")
         
         # Identify data sources
-        if 'jira' in content_lower:
-            self.capabilities.append("source:jira")
-        if 'confluence' in content_lower:
-            self.capabilities.append("source:confluence")
-        if 'slack' in content_lower:
-            self.capabilities.append("source:slack")
+        for source in _SOURCE_TERMS:
+            if source in found:
+                self.capabilities.append(f"source:{source}")
         
         # Identify meeting information
-        if 'meeting' in content_lower:
+        if 'meeting' in found:
             self.capabilities.append("has:meetings")
     
     def get_identity(self) -> Dict[str, Any]:
@@ -103,67 +249,96 @@ class SlaveAgent:
         This is used by the master agent to decide which agents to query.
         
         Returns:
-            Dictionary containing agent identity and capabilities
+            Dictionary containing agent identity and capabilities; shared, do not modify
         """
-        return {
-            "team_name": self.team_name,
-            "team_lead": self.team_lead,
-            "member_count": len(self.members),
-            "capabilities": self.capabilities,
-            "file_path": self.team_file_path
-        }
+        return self._identity
+    
+    def match_capabilities(self, keyword: str) -> Tuple[str, ...]:
+        """
+        Return the capabilities that contain a keyword, ignoring case.
+        
+        Capabilities never change after loading, so matches are remembered per
+        keyword and repeated queries skip the capability scan.
+        
+        Args:
+            keyword: Keyword extracted from a query
+            
+        Returns:
+            Matching capabilities, in capability order
+        """
+        matches = self._capability_matches.get(keyword)
+        if matches is None:
+            keyword_upper = keyword.upper()
+            keyword_lower = keyword.lower()
+            matches = tuple(
+                capability for capability, capability_upper, capability_lower in self._capabilities_cf
+                if keyword_upper in capability_upper or keyword_lower in capability_lower
+            )
+            if len(self._capability_matches) >= _MAX_CAPABILITY_MATCHES:
+                self._capability_matches.clear()
+            self._capability_matches[keyword] = matches
+        return matches
     
-    def answer_query(self, query: str) -> Dict[str, Any]:
+    def answer_query(self, query: str, ctx: Optional[QueryContext] = None) -> Dict[str, Any]:
         """
         Answer a specific query about the team's information.
         
+        Answers are remembered per query string; callers always get their own copy.
+        
         Args:
             query: The question to answer
+            ctx: The query, preprocessed; built here when not supplied
             
         Returns:
             Dictionary containing the answer and relevant information
         """
-        query_lower = query.lower()
+        with self._answer_lock:
+            answer = self._answer_cache.get(query)
+            if answer is not None:
+                self._answer_cache.move_to_end(query)
+        
+        if answer is None:
+            if ctx is None:
+                ctx = QueryContext.from_query(query)
+            answer = self._compute_answer(ctx)
+            with self._answer_lock:
+                self._answer_cache[query] = answer
+                self._answer_cache.move_to_end(query)
+                if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+                    self._answer_cache.popitem(last=False)
+        
+        return _copy_answer(answer)
+    
+    def _compute_answer(self, ctx: QueryContext) -> Dict[str, Any]:
+        """Route a query to the search that fits it."""
+        query_lower = ctx.lower
         
         # Count occurrences of specific terms
         if "how many times" in query_lower or "count" in query_lower:
-            return self._count_occurrences(query)
+            return self._count_occurrences(ctx)
         
         # Find meetings related to a topic
         if "meeting" in query_lower:
-            return self._find_meetings(query)
+            return self._find_meetings(ctx)
         
         # Find issues/tickets
         if "issue" in query_lower or "ticket" in query_lower or "jira" in query_lower:
-            return self._find_issues(query)
+            return self._find_issues(ctx)
         
         # General search
-        return self._general_search(query)
+        return self._general_search(ctx)
     
-    def _count_occurrences(self, query: str) -> Dict[str, Any]:
+    def _count_occurrences(self, ctx: QueryContext) -> Dict[str, Any]:
         """Count how many times a term appears in the team's information."""
-        # Extract the term to count
-        terms_to_count = []
-        
-        # Look for specific patterns
-        patterns = [
-            r'how many times.*?(\w+)',
-            r'count.*?(\w+)',
-            r'occurrences of (\w+)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, query, re.IGNORECASE)
-            if matches:
-                terms_to_count.extend(matches)
-        
-        # Also extract capitalized words (likely issue names)
-        capitalized = re.findall(r'\b([A-Z][A-Z]+)\b', query)
-        terms_to_count.extend(capitalized)
-        
         results = {}
-        for term in set(terms_to_count):
-            count = len(re.findall(r'\b' + re.escape(term) + r'\b', self.content, re.IGNORECASE))
+        content_lower = self._content_lower
+        for term in ctx.count_terms:
+            term_lower = term.lower()
+            # A plain substring test rules out most absent terms before the word-boundary regex
+            if term_lower in content_lower:
+                count = len(_term_pattern(term_lower).findall(content_lower))
+            else:
+                count = 0
             results[term] = count
         
         return {
@@ -173,27 +348,16 @@ class SlaveAgent:
             "total_mentions": sum(results.values())
         }
     
-    def _find_meetings(self, query: str) -> Dict[str, Any]:
+    def _find_meetings(self, ctx: QueryContext) -> Dict[str, Any]:
         """Find meetings related to the query."""
         meetings = []
         
-        # Extract meeting sections
-        meeting_pattern = r'- (\d{4}-\d{2}-\d{2}):\s*(.+?)(?=\n  - |\n\n|\Z)'
-        matches = re.findall(meeting_pattern, self.content, re.DOTALL)
-        
-        for date, meeting_info in matches:
-            # Check if query terms are in the meeting info
-            query_terms = re.findall(r'\b\w+\b', query.lower())
-            meeting_lower = meeting_info.lower()
+        for date, meeting_info, meeting_words in self._meetings:
+            # Count the query words that appear in the meeting info
+            relevance_score = len(ctx.terms & meeting_words)
             
-            relevance_score = sum(1 for term in query_terms if term in meeting_lower)
-            
-            if relevance_score > 0 or "all" in query.lower():
-                meetings.append({
-                    "date": date,
-                    "info": meeting_info.strip(),
-                    "relevance": relevance_score
-                })
+            if relevance_score > 0 or ctx.is_all:
+                meetings.append(Meeting(date, meeting_info, relevance_score, self.team_name))
         
         return {
             "team_name": self.team_name,
@@ -202,27 +366,16 @@ class SlaveAgent:
             "meeting_count": len(meetings)
         }
     
-    def _find_issues(self, query: str) -> Dict[str, Any]:
+    def _find_issues(self, ctx: QueryContext) -> Dict[str, Any]:
         """Find issues/tickets related to the query."""
         issues = []
         
-        # Extract issue sections
-        issue_pattern = r'- ([A-Z]+-\d+):\s*(.+?)(?=\n  - |\n\n- [A-Z]+-|\n\n===|\Z)'
-        matches = re.findall(issue_pattern, self.content, re.DOTALL)
-        
-        for issue_id, issue_info in matches:
-            # Check if query terms are in the issue info
-            query_terms = re.findall(r'\b\w+\b', query.lower())
-            issue_lower = issue_info.lower()
-            
-            relevance_score = sum(1 for term in query_terms if term in issue_lower)
+        for issue_id, issue_info, issue_words in self._issues:
+            # Count the query words that appear in the issue info
+            relevance_score = len(ctx.terms & issue_words)
             
-            if relevance_score > 0 or "all" in query.lower():
-                issues.append({
-                    "issue_id": issue_id,
-                    "info": issue_info.strip(),
-                    "relevance": relevance_score
-                })
+            if relevance_score > 0 or ctx.is_all:
+                issues.append(Issue(issue_id, issue_info, relevance_score, self.team_name))
         
         return {
             "team_name": self.team_name,
@@ -231,17 +384,13 @@ class SlaveAgent:
             "issue_count": len(issues)
         }
     
-    def _general_search(self, query: str) -> Dict[str, Any]:
+    def _general_search(self, ctx: QueryContext) -> Dict[str, Any]:
         """Perform a general search in the team's information."""
-        query_terms = re.findall(r'\b\w+\b', query.lower())
-        
         # Find relevant sections
         relevant_sections = []
-        sections = self.content.split('\n\n')
         
-        for section in sections:
-            section_lower = section.lower()
-            relevance_score = sum(1 for term in query_terms if term in section_lower)
+        for section, section_words in self._sections:
+            relevance_score = len(ctx.terms & section_words)
             
             if relevance_score > 0:
                 relevant_sections.append({
@@ -249,13 +398,11 @@ class SlaveAgent:
                     "relevance": relevance_score
                 })
         
-        # Sort by relevance
-        relevant_sections.sort(key=lambda x: x["relevance"], reverse=True)
-        
         return {
             "team_name": self.team_name,
             "query_type": "general",
-            "relevant_sections": relevant_sections[:5],  # Top 5 most relevant
+            # Top 5 most relevant, ties kept in file order
+            "relevant_sections": heapq.nlargest(5, relevant_sections, key=lambda x: x["relevance"]),
             "total_matches": len(relevant_sections)
         }
     
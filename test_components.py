@@ -0,0 +1,208 @@
+"""
+Quick test script to verify configuration parsing and the incident caches
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import config
+import gemini_integration
+import incident_master_agent
+from incident_master_agent import IncidentMasterAgent
+from incident_slave_agent import IncidentSlaveAgent
+from incident_task import Task
+from test_helpers import check
+
+
+TEAM_INFO_DIR = os.path.join(os.path.dirname(__file__), 'team_info')
+
+
+def _load_config_with(env):
+    """Load a fresh Config with the given environment overrides, then restore the environment."""
+    saved = {name: os.environ.get(name) for name in env}
+    os.environ.update(env)
+    try:
+        return config.load_config.__wrapped__()
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def test_components():
+    """Run basic tests against the configuration, Gemini parsing and cache helpers."""
+    print("="*80)
+    print("TESTING INCIDENT COMPONENTS")
+    print("="*80)
+    
+    passed = True
+    
+    # Test 1: Task proposal cache files
+    print("\n1. Testing Task Cache...")
+    work_dir = tempfile.mkdtemp()
+    saved_files_dir = incident_master_agent.TASK_FILES_DIR
+    incident_master_agent.TASK_FILES_DIR = work_dir
+    try:
+        master = IncidentMasterAgent(TEAM_INFO_DIR)
+        agent = master.slave_agents[0]
+        deadline = datetime.now() + timedelta(hours=4)
+        tasks = agent.propose_tasks("Database outage", deadline)
+        
+        cache_path = os.path.join(work_dir, "roundtrip.json")
+        incident_master_agent._store_cached_tasks(cache_path, tasks, deadline)
+        cached = incident_master_agent._load_cached_tasks(cache_path, deadline + timedelta(hours=1))
+        passed &= check(cached is not None and len(cached) == len(tasks), "Cached tasks load back")
+        passed &= check(all(new.tentative_deadline - old.tentative_deadline == timedelta(hours=1)
+                            for old, new in zip(tasks, cached or []) if old.tentative_deadline),
+                        "Cached deadlines are rebased onto the new incident deadline")
+        
+        with open(cache_path, 'wb') as f:
+            f.write(b"not json")
+        passed &= check(incident_master_agent._load_cached_tasks(cache_path, deadline) is None,
+                        "A corrupt cache file is treated as a miss")
+        
+        for i in range(5):
+            path = os.path.join(work_dir, f"entry{i}.json")
+            with open(path, 'wb') as f:
+                f.write(b"{}")
+            age = incident_master_agent.TASK_CACHE_TTL + 60 if i == 0 else i
+            os.utime(path, (time.time() - age, time.time() - age))
+        os.remove(cache_path)
+        
+        saved_max_files = incident_master_agent.TASK_CACHE_MAX_FILES
+        incident_master_agent.TASK_CACHE_MAX_FILES = 3
+        try:
+            incident_master_agent._prune_task_cache()
+        finally:
+            incident_master_agent.TASK_CACHE_MAX_FILES = saved_max_files
+        remaining = sorted(os.listdir(work_dir))
+        passed &= check(remaining == ["entry1.json", "entry2.json", "entry3.json"],
+                        f"Pruning drops expired and oldest entries → {remaining}")
+    finally:
+        incident_master_agent.TASK_FILES_DIR = saved_files_dir
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    # Test 2: Environment values are coerced to their field types
+    print("\n2. Testing Config Coercion...")
+    passed &= check(config._coerce('GEMINI_MAX_TOKENS', '512', int) == 512, "int values are parsed")
+    passed &= check(config._coerce('DEBUG_MODE', ' No ', bool) is False, "bool values accept yes/no in any case")
+    for name, raw, value_type in (('SERVER_PORT', 'abc', int), ('SERVER_PORT', '70000', int),
+                                  ('DEBUG_MODE', 'maybe', bool), ('GEMINI_TEMPERATURE', 'hot', float)):
+        try:
+            config._coerce(name, raw, value_type)
+            passed &= check(False, f"{name}={raw!r} is rejected")
+        except ValueError:
+            passed &= check(True, f"{name}={raw!r} is rejected")
+    
+    try:
+        _load_config_with({'SERVER_PORT': 'abc', 'CONFIG_STRICT': '1'})
+        passed &= check(False, "Strict mode exits on a malformed value")
+    except SystemExit:
+        passed &= check(True, "Strict mode exits on a malformed value")
+    
+    cfg = _load_config_with({'SERVER_PORT': 'abc', 'CONFIG_STRICT': '0'})
+    passed &= check(cfg.server_port == 8000 and any('SERVER_PORT' in issue for issue in cfg.issues),
+                    "Lenient mode falls back to the default and reports an issue")
+    
+    # Test 3: Task dictionaries keep the original JSON shape
+    print("\n3. Testing Task Dictionaries...")
+    deadline = datetime.now() + timedelta(hours=4)
+    rule_task = Task("T_01", "Check servers", 8, 2, deadline, "Lead")
+    gemini_task = Task("T_GEMINI_01", "Review alerts", 6, 1, None, "TBD", source="gemini", justification="Noise")
+    passed &= check("source" not in rule_task.to_dict() and "justification" not in rule_task.to_dict(),
+                    "Rule-based tasks have no source or justification keys")
+    passed &= check(gemini_task.to_dict()["source"] == "gemini" and gemini_task.to_dict()["justification"] == "Noise",
+                    "Gemini tasks keep their source and justification")
+    passed &= check(Task.from_dict(rule_task.to_dict()) == rule_task and Task.from_dict(gemini_task.to_dict()) == gemini_task,
+                    "from_dict rebuilds the task to_dict produced")
+    
+    # Test 4: Team agents follow edits to the team info directory
+    print("\n4. Testing Agent Reload...")
+    work_dir = tempfile.mkdtemp()
+    saved_agent_cache_path = incident_master_agent.AGENT_CACHE_PATH
+    saved_interval = incident_master_agent.TEAM_RESCAN_INTERVAL
+    incident_master_agent.AGENT_CACHE_PATH = os.path.join(work_dir, 'agents.json')
+    try:
+        team_dir = os.path.join(work_dir, 'teams')
+        os.mkdir(team_dir)
+        team_file = os.path.join(team_dir, 'aws_database_team.txt')
+        shutil.copy(os.path.join(TEAM_INFO_DIR, 'aws_database_team.txt'), team_file)
+        master = IncidentMasterAgent(team_dir)
+        agents = master.slave_agents
+        passed &= check(master.slave_agents is agents, "Agents are reused while the team files are unchanged")
+        
+        with open(team_file) as f:
+            content = f.read()
+        with open(team_file, 'w') as f:
+            f.write(content.replace(agents[0].team_name, "Renamed Database Team", 1))
+        later = time.time() + 1
+        os.utime(team_file, (later, later))
+        incident_master_agent.TEAM_RESCAN_INTERVAL = 3600
+        passed &= check(master.slave_agents is agents, "The directory is not rescanned within the rescan interval")
+        
+        incident_master_agent.TEAM_RESCAN_INTERVAL = 0
+        passed &= check(master.slave_agents[0].team_name == "Renamed Database Team",
+                        "An edited team file is reloaded")
+        passed &= check(agents[0].team_name != "Renamed Database Team", "Agents handed out earlier are unchanged")
+        
+        cached_versions = [key for key in incident_master_agent._AGENT_CACHE if key[0] == os.path.abspath(team_file)]
+        passed &= check(len(cached_versions) == 1, "Older versions of the file are evicted from the agent cache")
+        
+        shutil.copy(os.path.join(TEAM_INFO_DIR, 'aws_devops_team.txt'), team_dir)
+        passed &= check(len(master.slave_agents) == 2, "A new team file is picked up")
+        
+        shutil.rmtree(team_dir)
+        passed &= check(len(master.slave_agents) == 2, "The loaded agents are kept when the directory goes away")
+    finally:
+        incident_master_agent.AGENT_CACHE_PATH = saved_agent_cache_path
+        incident_master_agent.TEAM_RESCAN_INTERVAL = saved_interval
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    # Test 5: Parsed team info is cached on disk as JSON
+    print("\n5. Testing Agent Disk Cache...")
+    cache = {}
+    team_file = os.path.join(TEAM_INFO_DIR, 'aws_database_team.txt')
+    parsed = IncidentSlaveAgent.from_cache(team_file, cache)
+    cached = IncidentSlaveAgent.from_cache(team_file, cache)
+    passed &= check(len(cache) == 1 and vars(cached) == vars(parsed), "A cache hit rebuilds the parsed agent")
+    
+    key = next(iter(cache))
+    cache[key] = {"team_name": "Broken"}
+    passed &= check(vars(IncidentSlaveAgent.from_cache(team_file, cache)) == vars(parsed),
+                    "An incomplete cache entry is parsed again")
+    
+    work_dir = tempfile.mkdtemp()
+    saved_agent_cache_path = incident_master_agent.AGENT_CACHE_PATH
+    incident_master_agent.AGENT_CACHE_PATH = os.path.join(work_dir, 'agents.json')
+    try:
+        incident_master_agent._store_agent_cache(cache)
+        passed &= check(incident_master_agent._load_agent_cache() == cache, "The cache round-trips through JSON")
+        with open(incident_master_agent.AGENT_CACHE_PATH, 'wb') as f:
+            f.write(b"\x80\x04not json")
+        passed &= check(incident_master_agent._load_agent_cache() == {}, "A corrupt cache file is ignored")
+    finally:
+        incident_master_agent.AGENT_CACHE_PATH = saved_agent_cache_path
+        shutil.rmtree(work_dir, ignore_errors=True)
+    
+    # Test 6: Numbers from Gemini responses
+    print("\n6. Testing Gemini Number Parsing...")
+    cases = [(3, 3), ("2.5", 2.5), ("4", 4), (None, 1), (True, 1), ("soon", 1),
+             (float('inf'), 1), (float('nan'), 1), ("inf", 1), ("-inf", 1)]
+    for value, expected in cases:
+        result = gemini_integration._as_number(value, 1)
+        passed &= check(result == expected, f"_as_number({value!r}) → {result!r}")
+    
+    print("\n" + "="*80)
+    print("ALL TESTS PASSED ✓" if passed else "SOME TESTS FAILED ✗")
+    print("="*80)
+    
+    assert passed
+
+
+if __name__ == "__main__":
+    test_components()
@@ -0,0 +1,9 @@
+"""
+Shared helpers for the incident test scripts
+"""
+
+
+def check(ok, message):
+    """Print a check's result and return whether it passed."""
+    print(f"   {'✓' if ok else '✗'} {message}")
+    return ok
@@ -0,0 +1,232 @@
+"""
+Quick test script to verify the incident web server's API
+"""
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from http.client import HTTPConnection
+
+from incident_master_agent import IncidentMasterAgent
+from test_helpers import check
+import web_server
+
+
+def _start_server():
+    """Start an incident server on a free local port and return it."""
+    team_info_dir = os.path.join(os.path.dirname(__file__), 'team_info')
+    web_server.STATE.master_agent = IncidentMasterAgent(team_info_dir)
+    server = web_server.IncidentHTTPServer(('127.0.0.1', 0), web_server.IncidentResponseHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _request(server, method, path, body=None, headers=None):
+    """Send one request and return (status, response headers, body bytes)."""
+    conn = HTTPConnection('127.0.0.1', server.server_port, timeout=60)
+    if body is not None and not isinstance(body, bytes):
+        body = json.dumps(body)
+    conn.request(method, path, body=body, headers=headers or {})
+    response = conn.getresponse()
+    result = (response.status, response.headers, response.read())
+    conn.close()
+    return result
+
+
+def _events(body):
+    """Return the (event type, data) pairs of a server-sent event stream."""
+    events = []
+    for message in body.decode().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in message.splitlines() if ": " in line)
+        if 'event' in lines:
+            events.append((lines['event'], json.loads(lines.get('data', 'null'))))
+    return events
+
+
+def test_web_server():
+    """Run basic tests against a running web server."""
+    print("="*80)
+    print("TESTING INCIDENT WEB SERVER")
+    print("="*80)
+    
+    print("\n1. Starting server...")
+    server = _start_server()
+    master = web_server.STATE.master_agent
+    print(f"   ✓ Listening on port {server.server_port}")
+    
+    passed = True
+    
+    # Test 1: Streamed submissions report each team, then the summary
+    print("\n2. Testing Stream Endpoint...")
+    status, headers, body = _request(server, 'POST', '/api/create_incident/stream',
+                                     {"title": "Stream", "description": "Database outage"})
+    events = [event for event, _ in _events(body)]
+    passed &= check(status == 200 and headers.get('Content-type') == 'text/event-stream',
+                    f"Stream → {status} {headers.get('Content-type')}")
+    passed &= check(events == ["team_done"] * len(master.slave_agents) + ["summary"],
+                    f"Stream events → {events}")
+    
+    def failing_stream(incident_description, deadline):
+        raise RuntimeError("planner unavailable")
+        yield
+    
+    master.stream_incident = failing_stream
+    try:
+        status, _, body = _request(server, 'POST', '/api/create_incident/stream',
+                                   {"title": "Stream", "description": "Database outage"})
+    finally:
+        del master.stream_incident
+    passed &= check(_events(body) == [("error", {"error": "planner unavailable"})],
+                    f"A failed plan ends the stream with an error event → {_events(body)}")
+    
+    # Test 2: Background jobs are polled until they finish
+    print("\n3. Testing Job Endpoint...")
+    status, _, body = _request(server, 'POST', '/api/create_incident/job',
+                               {"title": "Job", "description": "Login page down"})
+    job_id = json.loads(body).get('job_id') if status == 202 else None
+    passed &= check(job_id is not None, f"Job submission → {status}")
+    
+    for _ in range(300):
+        status, _, body = _request(server, 'GET', f'/api/incident/{job_id}')
+        if status != 202:
+            break
+        time.sleep(0.1)
+    passed &= check(status == 200 and json.loads(body)['data']['incident_report']['title'] == "Job",
+                    f"Job poll → {status}")
+    
+    status, _, _ = _request(server, 'GET', '/api/incident/not-a-job')
+    passed &= check(status == 404, f"Unknown job → {status}")
+    
+    # Test 3: Report fields stay plain text in the JSON API and are escaped on the page
+    print("\n4. Testing Report Escaping...")
+    status, _, body = _request(server, 'POST', '/api/create_incident',
+                               {"title": "A & B", "description": "x <script>y</script>"})
+    report = json.loads(body)['data']['incident_report']
+    passed &= check(report['title'] == "A & B" and report['description'] == "x <script>y</script>",
+                    "JSON report fields are returned as submitted")
+    _, _, page = _request(server, 'GET', '/')
+    passed &= check(b"A &amp; B" in page and b"x &lt;script&gt;y&lt;/script&gt;" in page,
+                    "Report fields are escaped on the page")
+    
+    # Test 4: Content negotiation
+    print("\n5. Testing Compression...")
+    for accept, expected in (('gzip', 'gzip'), ('gzip;q=0', None), ('deflate, *;q=0', None), ('*', 'gzip')):
+        _, headers, _ = _request(server, 'GET', '/', headers={'Accept-Encoding': accept})
+        passed &= check(headers.get('Content-Encoding') == expected,
+                        f"Accept-Encoding: {accept} → Content-Encoding {headers.get('Content-Encoding')}")
+    
+    # Test 5: Conditional requests
+    print("\n6. Testing ETags...")
+    status, headers, _ = _request(server, 'GET', '/')
+    etag = headers.get('ETag')
+    status, _, body = _request(server, 'GET', '/', headers={'If-None-Match': etag})
+    passed &= check(etag is not None and status == 304 and body == b"", f"If-None-Match on / → {status}")
+    
+    # Test 6: Invalid incident fields are rejected with a JSON error
+    print("\n7. Testing Input Validation...")
+    bad_reports = [
+        {"description": "db down", "hours_to_deadline": "abc"},
+        {"description": "db down", "hours_to_deadline": None},
+        {"description": "db down", "hours_to_deadline": 1e12},
+        {"description": "db down", "hours_to_deadline": float('nan')},
+        {"description": "db down", "severity": 5},
+        {"description": 123},
+        {"description": "db down", "title": ["a"]},
+        {"title": "no description"},
+    ]
+    for report in bad_reports:
+        status, _, body = _request(server, 'POST', '/api/create_incident', report)
+        passed &= check(status == 400 and 'error' in json.loads(body),
+                        f"{json.dumps(report)} → {status}")
+    
+    status, _, body = _request(server, 'POST', '/api/create_incident', b'[1, 2]')
+    passed &= check(status == 400, f"Non-object body → {status}")
+    
+    status, _, body = _request(server, 'POST', '/api/create_incident',
+                               {"title": "DB down", "description": "Database outage", "hours_to_deadline": 4})
+    passed &= check(status == 200 and json.loads(body)['success'], f"Valid incident → {status}")
+    
+    # Test 7: Identical reports submitted together are planned once
+    print("\n8. Testing Request Coalescing...")
+    deadline = datetime.now() + timedelta(hours=4)
+    planned = master.handle_incident("Database outage", deadline)
+    calls = []
+    
+    def slow_handle_incident(incident_description, deadline):
+        calls.append(incident_description)
+        time.sleep(0.5)
+        return planned
+    
+    def failing_handle_incident(incident_description, deadline):
+        raise RuntimeError("planner unavailable")
+    
+    master.handle_incident = slow_handle_incident
+    try:
+        # The same report, sent with different key order and whitespace
+        report = {"title": "Coalesce", "description": "Database outage", "hours_to_deadline": 4}
+        bodies = [json.dumps(report), json.dumps(dict(reversed(list(report.items()))), indent=2)] * 3
+        responses = [None] * len(bodies)
+        
+        def submit(index):
+            responses[index] = _request(server, 'POST', '/api/create_incident', bodies[index].encode())
+        
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(responses))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        passed &= check(all(status == 200 for status, _, _ in responses),
+                        f"Concurrent identical submissions → {[status for status, _, _ in responses]}")
+        passed &= check(len(calls) == 1, f"Planned {len(calls)} time(s) for {len(responses)} identical submissions")
+        passed &= check(len({body for _, _, body in responses}) == 1, "All submitters received the same plan")
+        
+        _request(server, 'POST', '/api/create_incident', report)
+        passed &= check(len(calls) == 2, "A later identical submission is planned again")
+        
+        _request(server, 'POST', '/api/create_incident', dict(report, title="Different"))
+        passed &= check(len(calls) == 3, "A different submission is planned separately")
+        
+        master.handle_incident = failing_handle_incident
+        status, _, body = _request(server, 'POST', '/api/create_incident', report)
+        passed &= check(status == 500 and json.loads(body) == {"error": "planner unavailable"},
+                        f"A failed plan → {status} {body[:60]}")
+    finally:
+        del master.handle_incident
+    
+    # Test 8: A bad item in a batch gets its own error without failing the others
+    print("\n9. Testing Batch Endpoint...")
+    batch = {"incidents": [
+        {"title": "A", "description": "Database outage"},
+        {"description": "b", "hours_to_deadline": "x"},
+        {"severity": 3},
+        "not an object",
+        {"title": "B", "description": "Login page down"},
+    ]}
+    status, _, body = _request(server, 'POST', '/api/create_incident/batch', batch)
+    results = json.loads(body)['results'] if status == 200 else []
+    passed &= check([result['success'] for result in results] == [True, False, False, False, True],
+                    f"Mixed batch → {status}, per-item success {[r['success'] for r in results]}")
+    passed &= check(results[-1]['data']['incident_report']['title'] == "B" if results else False,
+                    "Results keep submission order")
+    
+    status, _, _ = _request(server, 'POST', '/api/create_incident/batch', {"incidents": []})
+    passed &= check(status == 400, f"Empty batch → {status}")
+    status, _, _ = _request(server, 'POST', '/api/create_incident/batch',
+                            {"incidents": [{"description": "x"}] * (web_server.MAX_BATCH_SIZE + 1)})
+    passed &= check(status == 413, f"Oversized batch → {status}")
+    
+    server.shutdown()
+    server.server_close()
+    
+    print("\n" + "="*80)
+    print("ALL TESTS PASSED ✓" if passed else "SOME TESTS FAILED ✗")
+    print("="*80)
+    
+    assert passed
+
+
+if __name__ == "__main__":
+    test_web_server()
@@ -3,152 +3,326 @@ Web server for incident response visualization
 Displays task graphs and assignment tables
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import atexit
+import gzip
+import hashlib
 import json
+import logging
+import math
 import os
+import queue
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from html import escape
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, Tuple, TypedDict
 from urllib.parse import parse_qs, urlparse
+import config
 from incident_master_agent import IncidentMasterAgent
 
-
-class IncidentResponseHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for incident response visualization."""
+try:
+    import orjson
     
-    # Class variable to store the master agent
-    master_agent = None
-    current_incident_data = None
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON with orjson; non-string keys are stringified like json does."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
     
-    def do_GET(self):
-        """Handle GET requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        if path == '/' or path == '/index.html':
-            self.serve_index()
-        elif path == '/api/incident':
-            self.serve_incident_data()
-        elif path == '/api/teams':
-            self.serve_teams_data()
-        else:
-            self.send_error(404, "Not Found")
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize with sorted keys, so equal objects give equal bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
     
-    def do_POST(self):
-        """Handle POST requests."""
-        parsed_path = urlparse(self.path)
-        path = parsed_path.path
-        
-        if path == '/api/create_incident':
-            self.handle_create_incident()
-        else:
-            self.send_error(404, "Not Found")
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_bytes(obj: Any) -> bytes:
+        """Serialize to UTF-8 JSON with the json module."""
+        return json.dumps(obj).encode()
     
-    def serve_index(self):
-        """Serve the main HTML page."""
-        html = self.generate_index_html()
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
-        self.wfile.write(html.encode())
+    def _canonical_json(obj: Any) -> bytes:
+        """Serialize with sorted keys, so equal objects give equal bytes."""
+        return json.dumps(obj, sort_keys=True, separators=(',', ':')).encode()
     
-    def serve_incident_data(self):
-        """Serve current incident data as JSON."""
-        if self.current_incident_data is None:
-            self.send_response(404)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": "No incident data"}).encode())
-            return
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(self.current_incident_data).encode())
+    # json.loads detects the encoding of a bytes body itself
+    _json_loads = json.loads
+
+
+# Largest request body accepted; incident reports are a few KB of form fields
+MAX_BODY_SIZE = 1 << 20
+
+# Most incidents accepted by one /api/create_incident/batch request
+MAX_BATCH_SIZE = 100
+
+# Responses smaller than this are sent uncompressed even when the client accepts gzip
+GZIP_MIN_SIZE = 1024
+
+def _success_json(data_json: bytes) -> bytes:
+    """Wrap already-serialized incident JSON in the {"success": true, "data": ...} envelope."""
+    return b'{"success":true,"data":' + data_json + b'}'
+
+
+def _etag(body: bytes) -> str:
+    """Weak entity tag for a response body, shared by its gzip and identity encodings."""
+    return 'W/"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+# Files served under /static/. Gzipped copies are kept in memory; uncompressed responses
+# are sent from disk with sendfile. vis-network.min.js is
+# vendored here by install.sh; without it the page loads the library from the CDN.
+# Pages link static files with a ?v= content hash, so they can be cached as immutable.
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+VIS_NETWORK_VERSION = '9.1.9'
+_STATIC_CONTENT_TYPES = {
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+}
+
+
+def _load_static_assets():
+    """
+    Index every servable file in STATIC_DIR.
     
-    def serve_teams_data(self):
-        """Serve teams information as JSON."""
-        if self.master_agent is None:
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": "Master agent not initialized"}).encode())
-            return
-        
-        teams = [agent.get_team_info() for agent in self.master_agent.slave_agents]
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(teams).encode())
+    Returns:
+        Dict of file name to (content type, path, size, gzipped bytes or None, content hash)
+    """
+    assets = {}
+    if not os.path.isdir(STATIC_DIR):
+        return assets
+    for entry in os.scandir(STATIC_DIR):
+        content_type = _STATIC_CONTENT_TYPES.get(os.path.splitext(entry.name)[1])
+        if content_type and entry.is_file():
+            with open(entry.path, 'rb') as f:
+                body = f.read()
+            gzipped = gzip.compress(body, 9) if len(body) >= GZIP_MIN_SIZE else None
+            digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+            assets[entry.name] = (content_type, entry.path, len(body), gzipped, digest)
+    return assets
+
+
+_STATIC_ASSETS = _load_static_assets()
+VIS_NETWORK_SRC = (
+    f"/static/vis-network.min.js?v={_STATIC_ASSETS['vis-network.min.js'][4]}"
+    if 'vis-network.min.js' in _STATIC_ASSETS
+    else f"https://unpkg.com/vis-network@{VIS_NETWORK_VERSION}/standalone/umd/vis-network.min.js"
+)
+
+# Incidents submitted as background jobs, polled by job id; only the newest MAX_JOBS are kept.
+# The executor is created with the first server, see _start_background_workers
+JOB_EXECUTOR: Optional[ThreadPoolExecutor] = None
+MAX_JOBS = 100
+_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_jobs_lock = threading.Lock()
+
+# Incidents being planned, keyed by a digest of the request body, so identical reports
+# submitted together (a double click, a client retry) share one plan
+_inflight: Dict[bytes, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Request log lines are queued by handler threads and written to stdout by one
+# listener thread, so concurrent requests never wait on the console
+_request_log = logging.getLogger("web_server.requests")
+_request_log.setLevel(logging.INFO)
+_request_log.propagate = False
+_log_listener: Optional[QueueListener] = None
+
+# Renders the index page for newly stored incidents off the request thread; one worker
+# keeps renders in the order incidents were stored
+RENDER_EXECUTOR: Optional[ThreadPoolExecutor] = None
+
+_workers_lock = threading.Lock()
+
+
+def _start_background_workers():
+    """
+    Create the job and render executors and start the request log listener.
     
-    def handle_create_incident(self):
-        """Handle incident creation request."""
-        content_length = int(self.headers['Content-Length'])
-        post_data = self.rfile.read(content_length)
-        data = json.loads(post_data.decode())
-        
-        # Extract comprehensive incident report data
-        title = data.get('title', '')
-        description = data.get('description', '')
-        severity = data.get('severity', 'medium')
-        hours_to_deadline = data.get('hours_to_deadline', 24)
-        affected_services = data.get('affected_services', '')
-        impact = data.get('impact', '')
-        reported_by = data.get('reported_by', 'Unknown')
-        detection_method = data.get('detection_method', '')
-        initial_actions = data.get('initial_actions', '')
-        
-        if not description:
-            self.send_response(400)
-            self.send_header('Content-type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": "Incident description required"}).encode())
+    Called when a server is created rather than at import, so importing this module
+    starts no threads. Later calls are no-ops.
+    """
+    global JOB_EXECUTOR, RENDER_EXECUTOR, _log_listener
+    with _workers_lock:
+        if _log_listener is not None:
             return
-        
-        # Build comprehensive incident description for agents
-        full_description = f"{title}: {description}"
-        if affected_services:
-            full_description += f" | Affected Services: {affected_services}"
-        if impact:
-            full_description += f" | Customer Impact: {impact}"
-        if severity:
-            full_description += f" | Severity: {severity.upper()}"
-        if initial_actions:
-            full_description += f" | Initial Actions: {initial_actions}"
-        
-        # Calculate deadline
-        deadline = datetime.now() + timedelta(hours=hours_to_deadline)
-        
-        # Handle incident with comprehensive description
-        incident_data = self.master_agent.handle_incident(full_description, deadline)
-        
-        # Add incident report metadata
-        incident_data['incident_report'] = {
-            'title': title,
-            'description': description,
-            'severity': severity,
-            'affected_services': affected_services,
-            'impact': impact,
-            'reported_by': reported_by,
-            'detection_method': detection_method,
-            'initial_actions': initial_actions,
-            'reported_at': datetime.now().isoformat()
-        }
-        
-        # Store in class variable so it persists across requests
-        IncidentResponseHandler.current_incident_data = incident_data
-        
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps({"success": True, "data": incident_data}).encode())
-    
-    def _generate_internals_html(self):
-        """Generate HTML explaining the internal coordination process."""
-        if not self.current_incident_data:
-            return ""
-        
-        assignments = self.current_incident_data.get('assignments', [])
-        
-        html = """
+        JOB_EXECUTOR = ThreadPoolExecutor(max_workers=10)
+        RENDER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="render")
+        log_queue = queue.SimpleQueue()
+        _request_log.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+
+# Example incident scenarios offered on the report form, served as /api/examples.json
+INCIDENT_EXAMPLES = {
+    "rds": {
+        "title": "Production RDS Connection Pool Exhaustion",
+        "description": "PostgreSQL RDS instance (prod-db-01) experiencing connection pool exhaustion. Started at 14:30 UTC. Authentication service unable to establish database connections, causing cascading failures across API endpoints.",
+        "severity": "critical",
+        "deadline": 4,
+        "affected_services": "RDS, EC2, Lambda, API Gateway",
+        "impact": "Complete service outage - users unable to login, all API requests failing with 500 errors. Approximately 50,000 active users affected.",
+        "reported_by": "CloudWatch Alarm",
+        "detection_method": "monitoring",
+        "initial_actions": "Verified RDS instance health, checked CloudWatch metrics showing 100% connection pool utilization, attempted connection pool restart (failed)"
+    },
+    "security": {
+        "title": "Suspicious IAM Activity Detected",
+        "description": "GuardDuty detected unusual IAM role assumption patterns from unknown IP addresses. Multiple failed authentication attempts followed by successful access to S3 buckets containing customer data.",
+        "severity": "critical",
+        "deadline": 2,
+        "affected_services": "IAM, S3, CloudTrail, GuardDuty",
+        "impact": "Potential data breach - unauthorized access to customer data buckets. No confirmed data exfiltration yet but access logs show suspicious read operations.",
+        "reported_by": "Security Team",
+        "detection_method": "automated",
+        "initial_actions": "Revoked compromised IAM credentials, enabled MFA requirement, isolated affected S3 buckets, initiated CloudTrail log analysis"
+    },
+    "lambda": {
+        "title": "Lambda Function Timeout Spike",
+        "description": "Payment processing Lambda functions experiencing widespread timeouts (>90% failure rate). Functions timing out after 30 seconds when attempting to connect to external payment gateway API.",
+        "severity": "high",
+        "deadline": 6,
+        "affected_services": "Lambda, API Gateway, DynamoDB, SQS",
+        "impact": "Payment processing completely down. Users unable to complete purchases. Estimated revenue loss: $5,000/hour. Queue backlog building up in SQS.",
+        "reported_by": "Customer Support",
+        "detection_method": "customer",
+        "initial_actions": "Checked Lambda CloudWatch logs, verified payment gateway API status (operational), increased Lambda timeout to 60s (no improvement), scaled up concurrent executions"
+    },
+    "s3": {
+        "title": "S3 Bucket Access Denied Errors",
+        "description": "Production application unable to access S3 bucket (prod-assets-bucket) due to permission errors. Bucket policy was recently updated and appears to have incorrect IAM permissions.",
+        "severity": "medium",
+        "deadline": 12,
+        "affected_services": "S3, CloudFront, EC2",
+        "impact": "Static assets (images, CSS, JS) not loading on website. Users seeing broken images and unstyled pages. Approximately 30% of page functionality affected.",
+        "reported_by": "DevOps Team",
+        "detection_method": "internal",
+        "initial_actions": "Reviewed recent S3 bucket policy changes, attempted to rollback policy (access denied), verified IAM role permissions, checked CloudTrail for policy modification events"
+    },
+    "api": {
+        "title": "API Response Time Degradation",
+        "description": "REST API endpoints showing increased response times. Average latency increased from 200ms to 3000ms over the past hour. Affecting all API Gateway endpoints.",
+        "severity": "high",
+        "deadline": 8,
+        "affected_services": "API Gateway, Lambda, DynamoDB",
+        "impact": "Mobile app and web application experiencing slow performance. User complaints increasing. Approximately 25,000 active users affected.",
+        "reported_by": "Monitoring Team",
+        "detection_method": "monitoring",
+        "initial_actions": "Checked API Gateway metrics, reviewed Lambda execution times, verified DynamoDB throttling (none detected)"
+    },
+    "disk": {
+        "title": "EC2 Instance Disk Space Critical",
+        "description": "Production EC2 instance (i-0abc123def) disk usage at 95%. Application logs filling up /var/log partition. Risk of service disruption if disk fills completely.",
+        "severity": "medium",
+        "deadline": 6,
+        "affected_services": "EC2",
+        "impact": "No immediate user impact, but application may crash if disk fills. Log rotation not functioning properly.",
+        "reported_by": "CloudWatch Alarm",
+        "detection_method": "monitoring",
+        "initial_actions": "Identified large log files, manually compressed old logs to free 10% space temporarily"
+    },
+    "ssl": {
+        "title": "SSL Certificate Expiring Soon",
+        "description": "SSL certificate for api.example.com expires in 5 days. Certificate renewal process needs to be initiated to avoid service disruption.",
+        "severity": "low",
+        "deadline": 96,
+        "affected_services": "CloudFront, Route53, ACM",
+        "impact": "No current impact. If not renewed, users will see security warnings and API access will be blocked.",
+        "reported_by": "Security Team",
+        "detection_method": "automated",
+        "initial_actions": "Verified certificate details in ACM, checked DNS validation records"
+    },
+    "memory": {
+        "title": "Application Memory Leak Detected",
+        "description": "Node.js application showing gradual memory increase over 24 hours. Memory usage started at 512MB, now at 3.2GB and climbing. Application performance degrading.",
+        "severity": "high",
+        "deadline": 12,
+        "affected_services": "EC2, ECS",
+        "impact": "Application becoming unresponsive. Response times increasing. Will require restart soon, causing brief downtime.",
+        "reported_by": "DevOps Team",
+        "detection_method": "monitoring",
+        "initial_actions": "Captured heap dump for analysis, reviewed recent code deployments, prepared restart procedure"
+    }
+}
+_EXAMPLES_JSON = _json_bytes(INCIDENT_EXAMPLES)
+_EXAMPLES_GZIP = gzip.compress(_EXAMPLES_JSON, 9)
+_EXAMPLES_ETAG = _etag(_EXAMPLES_JSON)
+EXAMPLES_CACHE_CONTROL = "public, max-age=86400"
+
+# Sent with the main page so the browser fetches the examples into its cache while idle,
+# ready for the first "load example" click. Prefetch rather than preload: most visitors
+# never click one, and an unused preload is reported as a warning in the console.
+INDEX_LINK_HEADER = '</api/examples.json>; rel=prefetch; as=fetch; crossorigin'
+
+
+class IncidentReport(TypedDict, total=False):
+    """Incident report fields as submitted by the web form."""
+    title: str
+    description: str
+    severity: str
+    affected_services: str
+    impact: str
+    reported_by: str
+    detection_method: str
+    initial_actions: str
+    reported_at: str
+
+
+# Report fields read from the request body, with their defaults
+_REPORT_DEFAULTS = (
+    ('title', ''),
+    ('description', ''),
+    ('severity', 'medium'),
+    ('affected_services', ''),
+    ('impact', ''),
+    ('reported_by', 'Unknown'),
+    ('detection_method', ''),
+    ('initial_actions', ''),
+)
+
+# Longest deadline accepted, in hours; the web form allows at most a week
+MAX_DEADLINE_HOURS = 24 * 365
+
+# Report fields appended to the description the agents see, in order
+_DESCRIPTION_FIELDS = (
+    ('affected_services', 'Affected Services'),
+    ('impact', 'Customer Impact'),
+    ('severity', 'Severity'),
+    ('initial_actions', 'Initial Actions'),
+)
+
+
+# Severity badge shown in the incident overview; known severities are rendered once
+_BADGE_TEMPLATE = """<div style="display: inline-block; background: {color}; color: white; padding: 4px 12px; border-radius: 4px; font-weight: 600; margin: 10px 0;">
+            {label} SEVERITY
+        </div>"""
+_DEFAULT_SEVERITY_COLOR = '#ca8a04'
+SEVERITY_BADGES = {
+    severity: _BADGE_TEMPLATE.format(color=color, label=severity.upper())
+    for severity, color in (
+        ('critical', '#dc2626'),
+        ('high', '#ea580c'),
+        ('medium', '#ca8a04'),
+        ('low', '#16a34a'),
+    )
+}
+
+# Optional incident report fields shown in the overview, in display order
+_OVERVIEW_FIELDS = (
+    ('affected_services', 'Affected Services'),
+    ('impact', 'Customer Impact'),
+    ('reported_by', 'Reported By'),
+    ('detection_method', 'Detection Method'),
+    ('initial_actions', 'Initial Actions'),
+)
+
+
+# Static parts of the internals panel and the responding-teams list; only the
+# per-team blocks between them are rendered for each incident
+_INTERNALS_HEAD_HTML = """
         <div style="background: #f9fafb; border-radius: 8px; padding: 20px; border: 2px solid #e5e7eb;">
             <h3 style="margin: 0 0 15px 0; color: #059669;">🤖 Multi-Agent Coordination Process</h3>
             
@@ -174,33 +348,7 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
                 </ul>
             </div>
         """
-        
-        # Add team-specific analysis
-        for assignment in assignments:
-            team_name = assignment.get('team_name', 'Unknown Team')
-            task_count = assignment.get('task_count', 0)
-            
-            html += f"""
-            <div style="background: white; padding: 15px; border-radius: 6px; margin-bottom: 15px; border-left: 4px solid #f59e0b;">
-                <h4 style="margin: 0 0 10px 0; color: #d97706;">👥 {team_name}</h4>
-                <p style="margin: 0 0 8px 0; color: #4b5563; font-size: 14px;">
-                    <strong>Relevance Analysis:</strong> This team calculated their relevance score by matching incident keywords 
-                    with their expertise areas and checking for similar past incidents.
-                </p>
-                <p style="margin: 0 0 8px 0; color: #4b5563; font-size: 14px;">
-                    <strong>Task Generation:</strong> Based on relevance, the team agent proposed <strong>{task_count} tasks</strong> 
-                    by analyzing:
-                </p>
-                <ul style="margin: 0; padding-left: 20px; color: #4b5563; font-size: 13px;">
-                    <li>Current team capacity from JIRA</li>
-                    <li>Relevant runbooks from Confluence</li>
-                    <li>Team member availability from Slack</li>
-                    <li>Historical incident response patterns</li>
-                </ul>
-            </div>
-            """
-        
-        html += """
+_INTERNALS_TAIL_HTML = """
             <div style="background: white; padding: 15px; border-radius: 6px; margin-bottom: 15px; border-left: 4px solid #ec4899;">
                 <h4 style="margin: 0 0 10px 0; color: #be185d;">🔗 Step 3: Dependency Analysis</h4>
                 <p style="margin: 0; color: #4b5563; font-size: 14px;">
@@ -233,184 +381,106 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
             </div>
         </div>
         """
-        
-        return html
-    
-    def _generate_teams_list_html(self):
-        """Generate HTML list of teams involved in the incident response."""
-        if not self.current_incident_data:
-            return ""
-        
-        assignments = self.current_incident_data.get('assignments', [])
-        if not assignments:
-            return ""
-        
-        html = """
+_TEAMS_LIST_HEAD_HTML = """
         <div style="margin-top: 20px; padding: 15px; background: #f9fafb; border-radius: 8px; border-left: 4px solid #667eea;">
             <h4 style="margin: 0 0 10px 0; color: #333; font-size: 14px;">👥 Responding Teams:</h4>
             <div style="display: flex; flex-wrap: wrap; gap: 8px;">
         """
-        
-        for assignment in assignments:
-            team_name = assignment.get('team_name', 'Unknown Team')
-            task_count = assignment.get('task_count', 0)
-            html += f"""
-                <div style="background: white; padding: 8px 12px; border-radius: 6px; border: 1px solid #e5e7eb; font-size: 13px;">
-                    <strong>{team_name}</strong> <span style="color: #6b7280;">({task_count} tasks)</span>
-                </div>
-            """
-        
-        html += """
+_TEAMS_LIST_TAIL_HTML = """
             </div>
         </div>
         """
-        
-        return html
-    
-    def _generate_incident_overview_html(self):
-        """Generate HTML for incident overview with comprehensive details."""
-        if not self.current_incident_data:
-            return ""
-        
-        report = self.current_incident_data.get('incident_report', {})
-        
-        # Severity badge color
-        severity_colors = {
-            'critical': '#dc2626',
-            'high': '#ea580c',
-            'medium': '#ca8a04',
-            'low': '#16a34a'
-        }
-        severity = report.get('severity', 'medium')
-        severity_color = severity_colors.get(severity, '#ca8a04')
-        
-        html = f"""
-        <h3>{report.get('title', self.current_incident_data.get('incident', 'Incident'))}</h3>
-        <div style="display: inline-block; background: {severity_color}; color: white; padding: 4px 12px; border-radius: 4px; font-weight: 600; margin: 10px 0;">
-            {severity.upper()} SEVERITY
-        </div>
-        <p style="margin-top: 15px;"><strong>Description:</strong> {report.get('description', 'N/A')}</p>
-        """
-        
-        if report.get('affected_services'):
-            html += f"<p><strong>Affected Services:</strong> {report.get('affected_services')}</p>"
-        
-        if report.get('impact'):
-            html += f"<p><strong>Customer Impact:</strong> {report.get('impact')}</p>"
-        
-        if report.get('reported_by'):
-            html += f"<p><strong>Reported By:</strong> {report.get('reported_by')}</p>"
-        
-        if report.get('detection_method'):
-            html += f"<p><strong>Detection Method:</strong> {report.get('detection_method').replace('_', ' ').title()}</p>"
-        
-        if report.get('initial_actions'):
-            html += f"<p><strong>Initial Actions:</strong> {report.get('initial_actions')}</p>"
-        
-        html += f"<p><strong>Deadline:</strong> {self.current_incident_data.get('deadline', '')}</p>"
-        
-        return html
-    
-    def generate_index_html(self):
-        """Generate the main HTML page."""
-        graph_html = ""
-        assignments_html = ""
-        
-        if self.current_incident_data:
-            graph_html = self.master_agent.generate_graph_html(
-                self.current_incident_data["task_graph"]
-            )
-            assignments_html = self.master_agent.generate_assignments_html(
-                self.current_incident_data["assignments"]
-            )
-        
-        html = f"""
+
+
+# Static parts of the index page: the document head, styles and incident form, and the
+# page script. Only the results between them depend on the current incident.
+_INDEX_HEAD = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Incident Response Coordination System</title>
-    <script type="text/javascript" src="https://unpkg.com/vis-network/standalone/umd/vis-network.min.js"></script>
+    <script type="text/javascript" src="{vis_network_src}"></script>
     <style>
-        * {{
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
+        }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             min-height: 100vh;
             padding: 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1400px;
             margin: 0 auto;
-        }}
+        }
         
-        .header {{
+        .header {
             background: white;
             padding: 30px;
             border-radius: 12px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             margin-bottom: 30px;
-        }}
+        }
         
-        .header h1 {{
+        .header h1 {
             font-size: 32px;
             color: #333;
             margin-bottom: 10px;
-        }}
+        }
         
-        .header p {{
+        .header p {
             color: #666;
             font-size: 16px;
-        }}
+        }
         
-        .incident-form {{
+        .incident-form {
             background: white;
             padding: 30px;
             border-radius: 12px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             margin-bottom: 30px;
-        }}
+        }
         
-        .form-group {{
+        .form-group {
             margin-bottom: 20px;
-        }}
+        }
         
-        .form-group label {{
+        .form-group label {
             display: block;
             font-weight: 600;
             margin-bottom: 8px;
             color: #333;
-        }}
+        }
         
         .form-group input,
-        .form-group textarea {{
+        .form-group textarea {
             width: 100%;
             padding: 12px;
             border: 2px solid #ddd;
             border-radius: 6px;
             font-size: 14px;
             font-family: inherit;
-        }}
+        }
         
-        .form-group textarea {{
+        .form-group textarea {
             resize: vertical;
             min-height: 100px;
-        }}
+        }
         
         .form-group input:focus,
-        .form-group textarea:focus {{
+        .form-group textarea:focus {
             outline: none;
             border-color: #667eea;
-        }}
+        }
         
-        .btn {{
+        .btn {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 14px 30px;
@@ -420,25 +490,25 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
             font-weight: 600;
             cursor: pointer;
             transition: transform 0.2s;
-        }}
+        }
         
-        .btn:hover {{
+        .btn:hover {
             transform: translateY(-2px);
-        }}
+        }
         
-        .btn:active {{
+        .btn:active {
             transform: translateY(0);
-        }}
+        }
         
-        .section {{
+        .section {
             background: white;
             padding: 30px;
             border-radius: 12px;
             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
             margin-bottom: 30px;
-        }}
+        }
         
-        .section-title {{
+        .section-title {
             font-size: 24px;
             font-weight: bold;
             margin-bottom: 20px;
@@ -446,67 +516,67 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
             display: flex;
             align-items: center;
             gap: 10px;
-        }}
+        }
         
-        .incident-info {{
+        .incident-info {
             background: #f8f9fa;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .incident-info h3 {{
+        .incident-info h3 {
             font-size: 18px;
             margin-bottom: 10px;
             color: #333;
-        }}
+        }
         
-        .incident-info p {{
+        .incident-info p {
             color: #666;
             margin-bottom: 8px;
-        }}
+        }
         
-        .stats {{
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             margin-bottom: 20px;
-        }}
+        }
         
-        .stat-card {{
+        .stat-card {
             background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
             color: white;
             padding: 20px;
             border-radius: 8px;
             text-align: center;
-        }}
+        }
         
-        .stat-value {{
+        .stat-value {
             font-size: 32px;
             font-weight: bold;
             margin-bottom: 5px;
-        }}
+        }
         
-        .stat-label {{
+        .stat-label {
             font-size: 14px;
             opacity: 0.9;
-        }}
+        }
         
-        .no-data {{
+        .no-data {
             text-align: center;
             padding: 40px;
             color: #999;
             font-size: 16px;
-        }}
+        }
         
-        .example-buttons {{
+        .example-buttons {
             display: flex;
             gap: 10px;
             margin: 15px 0 25px 0;
             flex-wrap: wrap;
-        }}
+        }
         
-        .example-btn {{
+        .example-btn {
             background: white;
             border: 2px solid #667eea;
             color: #667eea;
@@ -516,20 +586,20 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
             font-weight: 600;
             cursor: pointer;
             transition: all 0.2s;
-        }}
+        }
         
-        .example-btn:hover {{
+        .example-btn:hover {
             background: #667eea;
             color: white;
             transform: translateY(-2px);
-        }}
+        }
         
-        .loading {{
+        .loading {
             text-align: center;
             padding: 40px;
-        }}
+        }
         
-        .spinner {{
+        .spinner {
             border: 4px solid #f3f3f3;
             border-top: 4px solid #667eea;
             border-radius: 50%;
@@ -537,12 +607,12 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
             height: 40px;
             animation: spin 1s linear infinite;
             margin: 0 auto;
-        }}
+        }
         
-        @keyframes spin {{
-            0% {{ transform: rotate(0deg); }}
-            100% {{ transform: rotate(360deg); }}
-        }}
+        @keyframes spin {
+            0% { transform: rotate(0deg); }
+            100% { transform: rotate(360deg); }
+        }
     </style>
 </head>
 <body>
@@ -636,55 +706,17 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
                 
                 <button type="submit" class="btn">🚀 Coordinate Response</button>
             </form>
-        </div>
-        
-        <div id="results" style="display: {'block' if self.current_incident_data else 'none'};">
-            <div class="section">
-                <div class="section-title">📊 Incident Overview</div>
-                <div class="incident-info">
-                    {self._generate_incident_overview_html() if self.current_incident_data else ''}
-                </div>
-                <div class="stats">
-                    <div class="stat-card">
-                        <div class="stat-value">{self.current_incident_data.get('total_tasks', 0) if self.current_incident_data else 0}</div>
-                        <div class="stat-label">Total Tasks</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value">{self.current_incident_data.get('teams_involved', 0) if self.current_incident_data else 0}</div>
-                        <div class="stat-label">Teams Involved</div>
-                    </div>
-                </div>
-                {self._generate_teams_list_html() if self.current_incident_data else ''}
-            </div>
-            
-            <div class="section">
-                <div class="section-title">🕸️ Task Dependency Graph</div>
-                {graph_html if graph_html else '<div class="no-data">No graph data available</div>'}
-            </div>
-            
-            <div class="section">
-                <div class="section-title">📋 Task Assignments</div>
-                {assignments_html if assignments_html else '<div class="no-data">No assignments available</div>'}
-            </div>
-            
-            <div class="section">
-                <button onclick="toggleInternals()" class="btn" style="width: 100%; background: linear-gradient(135deg, #10b981 0%, #059669 100%);">
-                    🔍 See Internals - How We Generated This Response
-                </button>
-                
-                <div id="internals" style="display: none; margin-top: 20px;">
-                    {self._generate_internals_html() if self.current_incident_data else ''}
-                </div>
-            </div>
-        </div>
+        </div>"""
+
+_INDEX_SCRIPT = """
     </div>
     
     <script>
-        document.getElementById('incidentForm').addEventListener('submit', async (e) => {{
+        document.getElementById('incidentForm').addEventListener('submit', async (e) => {
             e.preventDefault();
             
             // Collect all form data
-            const formData = {{
+            const formData = {
                 title: document.getElementById('title').value,
                 description: document.getElementById('description').value,
                 severity: document.getElementById('severity').value,
@@ -694,192 +726,1033 @@ class IncidentResponseHandler(BaseHTTPRequestHandler):
                 reported_by: document.getElementById('reported_by').value,
                 detection_method: document.getElementById('detection_method').value,
                 initial_actions: document.getElementById('initial_actions').value
-            }};
+            };
             
             // Show loading state
             const resultsDiv = document.getElementById('results');
             resultsDiv.style.display = 'block';
             resultsDiv.innerHTML = '<div class=\"loading\"><div class=\"spinner\"></div><p>Coordinating response...</p></div>';
             
-            try {{
-                const response = await fetch('/api/create_incident', {{
+            try {
+                const response = await fetch('/api/create_incident/stream', {
                     method: 'POST',
-                    headers: {{
+                    headers: {
                         'Content-Type': 'application/json'
-                    }},
+                    },
                     body: JSON.stringify(formData)
-                }});
+                });
+                
+                if (!response.ok) {
+                    const result = await response.json();
+                    alert('Error: ' + (result.error || 'Unknown error'));
+                    resultsDiv.style.display = 'none';
+                    return;
+                }
                 
-                const result = await response.json();
+                // Show each team's proposals as they arrive, then the full results
+                const progress = document.createElement('div');
+                resultsDiv.querySelector('.loading').appendChild(progress);
                 
-                if (result.success) {{
-                    // Hide form and header, show only results
-                    document.getElementById('incidentFormContainer').style.display = 'none';
-                    document.querySelector('.header p').innerHTML = '<a href="/" style="color: #667eea; text-decoration: none;">← Report New Incident</a>';
+                const reader = response.body.getReader();
+                const decoder = new TextDecoder();
+                let buffer = '';
+                let finished = false;
+                
+                while (true) {
+                    const { value, done } = await reader.read();
+                    if (done) break;
+                    buffer += decoder.decode(value, { stream: true });
                     
-                    // Reload page to show results
-                    window.location.reload();
-                }} else {{
-                    alert('Error: ' + (result.error || 'Unknown error'));
-                }}
-            }} catch (error) {{
+                    let boundary;
+                    while ((boundary = buffer.indexOf('\\n\\n')) !== -1) {
+                        const message = buffer.slice(0, boundary);
+                        buffer = buffer.slice(boundary + 2);
+                        
+                        let eventType = 'message';
+                        let data = '';
+                        for (const line of message.split('\\n')) {
+                            if (line.startsWith('event: ')) eventType = line.slice(7);
+                            else if (line.startsWith('data: ')) data += line.slice(6);
+                        }
+                        const payload = JSON.parse(data);
+                        
+                        if (eventType === 'team_done') {
+                            const line = document.createElement('p');
+                            line.textContent = '✓ ' + payload.team + ' proposed ' + payload.tasks.length + ' tasks';
+                            progress.appendChild(line);
+                        } else if (eventType === 'summary' && payload.success) {
+                            // Swap in the rendered results; scripts added through outerHTML
+                            // do not run, so the graph script is re-created to execute it
+                            resultsDiv.outerHTML = payload.results_html;
+                            const shownResults = document.getElementById('results');
+                            for (const inert of shownResults.querySelectorAll('script')) {
+                                const script = document.createElement('script');
+                                script.textContent = inert.textContent;
+                                inert.replaceWith(script);
+                            }
+                            showResults(shownResults);
+                            finished = true;
+                        } else if (eventType === 'error') {
+                            throw new Error(payload.error || 'Unknown error');
+                        }
+                    }
+                }
+                
+                // A stream that ends without its summary was cut off before the plan was stored
+                if (!finished) {
+                    throw new Error('the server closed the connection before the results arrived');
+                }
+            } catch (error) {
                 alert('Error creating incident: ' + error.message);
                 resultsDiv.style.display = 'none';
-            }}
-        }});
+            }
+        });
         
         // Example incident scenarios
-        function loadExample(type) {{
-            const examples = {{
-                'rds': {{
-                    title: 'Production RDS Connection Pool Exhaustion',
-                    description: 'PostgreSQL RDS instance (prod-db-01) experiencing connection pool exhaustion. Started at 14:30 UTC. Authentication service unable to establish database connections, causing cascading failures across API endpoints.',
-                    severity: 'critical',
-                    deadline: 4,
-                    affected_services: 'RDS, EC2, Lambda, API Gateway',
-                    impact: 'Complete service outage - users unable to login, all API requests failing with 500 errors. Approximately 50,000 active users affected.',
-                    reported_by: 'CloudWatch Alarm',
-                    detection_method: 'monitoring',
-                    initial_actions: 'Verified RDS instance health, checked CloudWatch metrics showing 100% connection pool utilization, attempted connection pool restart (failed)'
-                }},
-                'security': {{
-                    title: 'Suspicious IAM Activity Detected',
-                    description: 'GuardDuty detected unusual IAM role assumption patterns from unknown IP addresses. Multiple failed authentication attempts followed by successful access to S3 buckets containing customer data.',
-                    severity: 'critical',
-                    deadline: 2,
-                    affected_services: 'IAM, S3, CloudTrail, GuardDuty',
-                    impact: 'Potential data breach - unauthorized access to customer data buckets. No confirmed data exfiltration yet but access logs show suspicious read operations.',
-                    reported_by: 'Security Team',
-                    detection_method: 'automated',
-                    initial_actions: 'Revoked compromised IAM credentials, enabled MFA requirement, isolated affected S3 buckets, initiated CloudTrail log analysis'
-                }},
-                'lambda': {{
-                    title: 'Lambda Function Timeout Spike',
-                    description: 'Payment processing Lambda functions experiencing widespread timeouts (>90% failure rate). Functions timing out after 30 seconds when attempting to connect to external payment gateway API.',
-                    severity: 'high',
-                    deadline: 6,
-                    affected_services: 'Lambda, API Gateway, DynamoDB, SQS',
-                    impact: 'Payment processing completely down. Users unable to complete purchases. Estimated revenue loss: $5,000/hour. Queue backlog building up in SQS.',
-                    reported_by: 'Customer Support',
-                    detection_method: 'customer',
-                    initial_actions: 'Checked Lambda CloudWatch logs, verified payment gateway API status (operational), increased Lambda timeout to 60s (no improvement), scaled up concurrent executions'
-                }},
-                's3': {{
-                    title: 'S3 Bucket Access Denied Errors',
-                    description: 'Production application unable to access S3 bucket (prod-assets-bucket) due to permission errors. Bucket policy was recently updated and appears to have incorrect IAM permissions.',
-                    severity: 'medium',
-                    deadline: 12,
-                    affected_services: 'S3, CloudFront, EC2',
-                    impact: 'Static assets (images, CSS, JS) not loading on website. Users seeing broken images and unstyled pages. Approximately 30% of page functionality affected.',
-                    reported_by: 'DevOps Team',
-                    detection_method: 'internal',
-                    initial_actions: 'Reviewed recent S3 bucket policy changes, attempted to rollback policy (access denied), verified IAM role permissions, checked CloudTrail for policy modification events'
-                }},
-                'api': {{
-                    title: 'API Response Time Degradation',
-                    description: 'REST API endpoints showing increased response times. Average latency increased from 200ms to 3000ms over the past hour. Affecting all API Gateway endpoints.',
-                    severity: 'high',
-                    deadline: 8,
-                    affected_services: 'API Gateway, Lambda, DynamoDB',
-                    impact: 'Mobile app and web application experiencing slow performance. User complaints increasing. Approximately 25,000 active users affected.',
-                    reported_by: 'Monitoring Team',
-                    detection_method: 'monitoring',
-                    initial_actions: 'Checked API Gateway metrics, reviewed Lambda execution times, verified DynamoDB throttling (none detected)'
-                }},
-                'disk': {{
-                    title: 'EC2 Instance Disk Space Critical',
-                    description: 'Production EC2 instance (i-0abc123def) disk usage at 95%. Application logs filling up /var/log partition. Risk of service disruption if disk fills completely.',
-                    severity: 'medium',
-                    deadline: 6,
-                    affected_services: 'EC2',
-                    impact: 'No immediate user impact, but application may crash if disk fills. Log rotation not functioning properly.',
-                    reported_by: 'CloudWatch Alarm',
-                    detection_method: 'monitoring',
-                    initial_actions: 'Identified large log files, manually compressed old logs to free 10% space temporarily'
-                }},
-                'ssl': {{
-                    title: 'SSL Certificate Expiring Soon',
-                    description: 'SSL certificate for api.example.com expires in 5 days. Certificate renewal process needs to be initiated to avoid service disruption.',
-                    severity: 'low',
-                    deadline: 96,
-                    affected_services: 'CloudFront, Route53, ACM',
-                    impact: 'No current impact. If not renewed, users will see security warnings and API access will be blocked.',
-                    reported_by: 'Security Team',
-                    detection_method: 'automated',
-                    initial_actions: 'Verified certificate details in ACM, checked DNS validation records'
-                }},
-                'memory': {{
-                    title: 'Application Memory Leak Detected',
-                    description: 'Node.js application showing gradual memory increase over 24 hours. Memory usage started at 512MB, now at 3.2GB and climbing. Application performance degrading.',
-                    severity: 'high',
-                    deadline: 12,
-                    affected_services: 'EC2, ECS',
-                    impact: 'Application becoming unresponsive. Response times increasing. Will require restart soon, causing brief downtime.',
-                    reported_by: 'DevOps Team',
-                    detection_method: 'monitoring',
-                    initial_actions: 'Captured heap dump for analysis, reviewed recent code deployments, prepared restart procedure'
-                }}
-            }};
+        // Fetched on the first click and shared by later ones; the browser caches it across page loads
+        let examplesRequest = null;
+        const EXAMPLE_FIELDS = ['title', 'description', 'severity', 'deadline', 'affected_services',
+                                'impact', 'reported_by', 'detection_method', 'initial_actions'];
+        
+        async function loadExample(type) {
+            if (!examplesRequest) {
+                examplesRequest = fetch('/api/examples.json').then(response => {
+                    if (!response.ok) throw new Error('HTTP ' + response.status);
+                    return response.json();
+                });
+            }
+            let examples;
+            try {
+                examples = await examplesRequest;
+            } catch (error) {
+                examplesRequest = null;
+                alert('Error loading example: ' + error.message);
+                return;
+            }
             
             const example = examples[type];
-            if (example) {{
-                document.getElementById('title').value = example.title;
-                document.getElementById('description').value = example.description;
-                document.getElementById('severity').value = example.severity;
-                document.getElementById('deadline').value = example.deadline;
-                document.getElementById('affected_services').value = example.affected_services;
-                document.getElementById('impact').value = example.impact;
-                document.getElementById('reported_by').value = example.reported_by;
-                document.getElementById('detection_method').value = example.detection_method;
-                document.getElementById('initial_actions').value = example.initial_actions;
-                
-                // Scroll to form
-                document.getElementById('title').scrollIntoView({{ behavior: 'smooth', block: 'center' }});
-            }}
-        }}
+            if (example) {
+                // Fill every field in one frame, then scroll, so layout is computed once
+                requestAnimationFrame(() => {
+                    for (const field of EXAMPLE_FIELDS) {
+                        document.getElementById(field).value = example[field];
+                    }
+                    document.getElementById('title').scrollIntoView({ behavior: 'smooth', block: 'center' });
+                });
+            }
+        }
         
         // Toggle internals section
-        function toggleInternals() {{
+        function toggleInternals() {
             const internalsDiv = document.getElementById('internals');
             const button = event.target;
             
-            if (internalsDiv.style.display === 'none') {{
+            if (internalsDiv.style.display === 'none') {
                 internalsDiv.style.display = 'block';
                 button.textContent = '🔼 Hide Internals';
-                internalsDiv.scrollIntoView({{ behavior: 'smooth', block: 'nearest' }});
-            }} else {{
+                internalsDiv.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+            } else {
                 internalsDiv.style.display = 'none';
                 button.textContent = '🔍 See Internals - How We Generated This Response';
-            }}
-        }}
+            }
+        }
+        
+        // Hide the form and link back to it, leaving only the results on screen
+        function showResults(resultsDiv) {
+            document.getElementById('incidentFormContainer').style.display = 'none';
+            
+            // Change header subtitle to "Report New Incident" link
+            const link = document.createElement('a');
+            link.href = '/';
+            link.textContent = '← Report New Incident';
+            link.style.cssText = 'color: white; text-decoration: none; background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 6px; display: inline-block; transition: all 0.2s;';
+            link.onmouseover = () => { link.style.background = 'rgba(255,255,255,0.3)'; };
+            link.onmouseout = () => { link.style.background = 'rgba(255,255,255,0.2)'; };
+            document.querySelector('.header p').replaceChildren(link);
+            
+            // Scroll to results
+            resultsDiv.scrollIntoView({ behavior: 'smooth' });
+        }
         
         // On page load, hide form if results are shown
-        window.addEventListener('DOMContentLoaded', function() {{
+        window.addEventListener('DOMContentLoaded', function() {
             const resultsDiv = document.getElementById('results');
-            const formContainer = document.getElementById('incidentFormContainer');
-            const headerSubtitle = document.querySelector('.header p');
-            
-            if (resultsDiv && resultsDiv.style.display === 'block') {{
-                // Hide the form
-                formContainer.style.display = 'none';
-                
-                // Change header subtitle to "Report New Incident" link
-                headerSubtitle.innerHTML = '<a href="/" style="color: white; text-decoration: none; background: rgba(255,255,255,0.2); padding: 8px 16px; border-radius: 6px; display: inline-block; transition: all 0.2s;" onmouseover="this.style.background=\\'rgba(255,255,255,0.3)\\'" onmouseout="this.style.background=\\'rgba(255,255,255,0.2)\\'">← Report New Incident</a>';
-                
-                // Scroll to results
-                resultsDiv.scrollIntoView({{ behavior: 'smooth' }});
-            }}
-        }});
+            if (resultsDiv && resultsDiv.style.display === 'block') {
+                showResults(resultsDiv);
+            }
+        });
     </script>
 </body>
 </html>
+"""
+
+_INDEX_HEAD = _INDEX_HEAD.replace('{vis_network_src}', VIS_NETWORK_SRC)
+_INDEX_HEAD_BYTES = _INDEX_HEAD.encode()
+_INDEX_SCRIPT_BYTES = _INDEX_SCRIPT.encode()
+
+# Results section shown before any incident has been reported. The whole empty page is
+# rendered at import and seeds the page cache for version 0.
+_EMPTY_RESULTS_HTML = """
+        
+        <div id="results" style="display: none;">
+            <div class="section">
+                <div class="section-title">📊 Incident Overview</div>
+                <div class="incident-info">
+                    
+                </div>
+                <div class="stats">
+                    <div class="stat-card">
+                        <div class="stat-value">0</div>
+                        <div class="stat-label">Total Tasks</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-value">0</div>
+                        <div class="stat-label">Teams Involved</div>
+                    </div>
+                </div>
+                
+            </div>
+            
+            <div class="section">
+                <div class="section-title">🕸️ Task Dependency Graph</div>
+                <div class="no-data">No graph data available</div>
+            </div>
+            
+            <div class="section">
+                <div class="section-title">📋 Task Assignments</div>
+                <div class="no-data">No assignments available</div>
+            </div>
+            
+            <div class="section">
+                <button onclick="toggleInternals()" class="btn" style="width: 100%; background: linear-gradient(135deg, #10b981 0%, #059669 100%);">
+                    🔍 See Internals - How We Generated This Response
+                </button>
+                
+                <div id="internals" style="display: none; margin-top: 20px;">
+                    
+                </div>
+            </div>
+        </div>"""
+_EMPTY_INDEX_BYTES = _INDEX_HEAD_BYTES + _EMPTY_RESULTS_HTML.encode() + _INDEX_SCRIPT_BYTES
+
+
+# slots=True needs Python 3.10+; older interpreters fall back to a regular dataclass
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class IncidentSnapshot:
+    """
+    A stored incident and its serialized form.
+    
+    Snapshots are never modified; storing an incident replaces the snapshot in
+    ServerState as a whole, so readers take one reference and need no lock.
+    """
+    version: int
+    data: Dict[str, Any]
+    json_bytes: bytes
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class ServerState:
+    """
+    State shared by every request handler thread.
+    """
+    master_agent: Optional[IncidentMasterAgent] = None
+    incident: Optional[IncidentSnapshot] = None
+    
+    # The rendered index page is reused until an incident with a new version is stored.
+    # index_cache is (incident version or 0, page bytes, gzipped page bytes, ETag).
+    index_cache: Optional[Tuple[int, bytes, bytes, str]] = None
+    # Background render of the newest incident's page, as (incident version, future)
+    index_render: Optional[Tuple[int, Future]] = None
+    
+    # Serialized team list, reused while the master agent keeps the same slave agents.
+    # teams_cache is (slave agent list, JSON bytes, gzipped JSON bytes or None, ETag).
+    teams_cache: Optional[Tuple[Any, bytes, Optional[bytes], str]] = None
+
+
+STATE = ServerState(index_cache=(
+    0, _EMPTY_INDEX_BYTES, gzip.compress(_EMPTY_INDEX_BYTES, 9), _etag(_EMPTY_INDEX_BYTES)
+))
+# Held while storing an incident, so versions are handed out in order
+STATE_LOCK = threading.Lock()
+
+
+class IncidentHTTPServer(ThreadingHTTPServer):
+    """
+    HTTP server that handles each connection on a bounded pool of worker threads.
+    
+    Connections beyond the pool size wait for a free worker instead of each starting a
+    new thread. Kept-alive connections hold a worker until they close or go idle for
+    the handler's timeout, and incident submissions hold one while they are planned,
+    so the pool is sized well above a few browser tabs' worth of connections plus a
+    handful of submissions in flight.
+    
+    Workers are daemon threads, like ThreadingHTTPServer's, so an idle kept-alive
+    connection does not hold up interpreter exit the way ThreadPoolExecutor workers,
+    which are joined at exit, would.
+    """
+    request_queue_size = 128
+    max_workers = max(64, (os.cpu_count() or 1) * 8)
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _start_background_workers()
+        self._connections = queue.SimpleQueue()
+        for i in range(self.max_workers):
+            threading.Thread(target=self._serve_connections, name=f"http-{i}", daemon=True).start()
+    
+    def _serve_connections(self):
+        """Worker loop: handle queued connections until a None sentinel arrives."""
+        while True:
+            item = self._connections.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+    
+    def process_request(self, request, client_address):
+        """Queue the connection for the next free worker."""
+        self._connections.put((request, client_address))
+    
+    def server_close(self):
+        """Close the listening socket and stop the workers once they are idle."""
+        super().server_close()
+        for _ in range(self.max_workers):
+            self._connections.put(None)
+
+
+class IncidentResponseHandler(BaseHTTPRequestHandler):
+    """HTTP request handler for incident response visualization."""
+    
+    # Buffer writes so headers and body leave in one send; streamed responses flush as they go
+    wbufsize = 64 * 1024
+    
+    # Keep connections open between requests. Complete responses carry a Content-Length;
+    # streamed ones have no length up front, so they close the connection when done
+    protocol_version = "HTTP/1.1"
+    
+    # Each connection holds a worker thread, so close kept-alive connections after a
+    # few idle seconds and drop clients that stall mid-request; browsers reconnect
+    # transparently, and request bodies are small enough to arrive well within this
+    timeout = 5
+    
+    # Send small responses immediately instead of waiting on Nagle's algorithm,
+    # which would otherwise delay replies on kept-alive connections
+    disable_nagle_algorithm = True
+    
+    # Routes by exact path, naming the handler method; GET_PREFIX_ROUTES pass the rest of
+    # the path (a job id or file name) to theirs
+    GET_ROUTES = {
+        '/': 'serve_index',
+        '/index.html': 'serve_index',
+        '/api/incident': 'serve_incident_data',
+        '/api/teams': 'serve_teams_data',
+        '/api/examples.json': 'serve_examples',
+    }
+    GET_PREFIX_ROUTES = (
+        ('/api/incident/', 'serve_incident_job'),
+        ('/static/', 'serve_static'),
+    )
+    POST_ROUTES = {
+        '/api/create_incident': 'handle_create_incident',
+        '/api/create_incident/stream': 'handle_create_incident_stream',
+        '/api/create_incident/job': 'handle_create_incident_job',
+        '/api/create_incident/batch': 'handle_create_incident_batch',
+    }
+    
+    def do_GET(self):
+        """Handle GET requests."""
+        path = urlparse(self.path).path
+        
+        route = self.GET_ROUTES.get(path)
+        if route is not None:
+            getattr(self, route)()
+            return
+        
+        for prefix, route in self.GET_PREFIX_ROUTES:
+            if path.startswith(prefix):
+                getattr(self, route)(path[len(prefix):])
+                return
+        
+        self.send_error(404, "Not Found")
+    
+    def do_POST(self):
+        """Handle POST requests."""
+        route = self.POST_ROUTES.get(urlparse(self.path).path)
+        if route is None:
+            self.send_error(404, "Not Found")
+            return
+        
+        getattr(self, route)()
+    
+    def _accepts_gzip(self) -> bool:
+        """
+        Return True if the client accepts gzip-encoded responses.
+        
+        An explicit gzip (or x-gzip) entry wins over a "*" wildcard, and a q-value
+        of 0, or one that does not parse, refuses the coding.
+        """
+        wildcard = None
+        for entry in self.headers.get('Accept-Encoding', '').split(','):
+            coding, _, params = entry.partition(';')
+            coding = coding.strip().lower()
+            if coding not in ('gzip', 'x-gzip', '*'):
+                continue
+            
+            quality = 1.0
+            for param in params.split(';'):
+                name, _, value = param.partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            
+            if coding == '*':
+                wildcard = quality > 0
+            else:
+                return quality > 0
+        return bool(wildcard)
+    
+    def _etag_matches(self, etag: str) -> bool:
+        """Return True if the request's If-None-Match names etag (weak comparison)."""
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        if header.strip() == '*':
+            return True
+        opaque = etag[2:] if etag.startswith('W/') else etag
+        for tag in header.split(','):
+            tag = tag.strip()
+            if (tag[2:] if tag.startswith('W/') else tag) == opaque:
+                return True
+        return False
+    
+    def _send_bytes(self, status: int, content_type: str, body: bytes, gzipped: bytes = None,
+                    etag: str = None, cache_control: str = 'no-cache', link: str = None):
+        """
+        Send a complete response; the buffered headers and body are flushed together.
+        
+        Bodies of at least GZIP_MIN_SIZE bytes are gzip-compressed when the client
+        accepts it, using the pre-compressed gzipped body if one is given. With an
+        etag, clients revalidate per cache_control (by default on each use) and get an
+        empty 304 while it matches. link, if given, is sent as a Link header with
+        full responses.
         """
+        compressible = gzipped is not None or len(body) >= GZIP_MIN_SIZE
+        if etag is not None and self._etag_matches(etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+            if compressible:
+                self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        if compressible and self._accepts_gzip():
+            body = gzipped if gzipped is not None else gzip.compress(body, 6)
+            encoding = 'gzip'
+        else:
+            encoding = None
+        
+        self.send_response(status)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        if compressible:
+            self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', cache_control)
+        if link is not None:
+            self.send_header('Link', link)
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def _send_json(self, status: int, obj: Any):
+        """Send a JSON response."""
+        self._send_bytes(status, 'application/json', _json_bytes(obj))
+    
+    def serve_index(self):
+        """
+        Serve the main HTML page.
+        
+        The page is rendered and compressed once per stored incident, in the
+        background as soon as the incident is stored. A request that arrives while
+        that render is running waits for it; if there is no render to wait for, the
+        page is written to the client as it is generated.
+        """
+        incident = STATE.incident
+        version = incident.version if incident else 0
+        cached = STATE.index_cache
+        
+        pending = STATE.index_render
+        if (cached is None or cached[0] != version) and pending is not None and pending[0] == version:
+            # A failed render leaves the cache stale and falls through to rendering here
+            wait([pending[1]])
+            cached = STATE.index_cache
+        
+        if cached is not None and cached[0] == version:
+            self._send_bytes(200, 'text/html', cached[1], cached[2], cached[3], link=INDEX_LINK_HEADER)
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Link', INDEX_LINK_HEADER)
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        
+        chunks = []
+        for chunk in self._iter_index_bytes(incident):
+            chunks.append(chunk)
+            self.wfile.write(chunk)
+            self.wfile.flush()
+        page = b"".join(chunks)
+        STATE.index_cache = (version, page, gzip.compress(page, 9), _etag(page))
+    
+    def _results_html(self, incident: IncidentSnapshot) -> str:
+        """
+        Return the results section of the main page for a stored incident.
+        
+        It is cut from the cached page once the background render finishes, and only
+        rendered here if that render failed or was superseded by a newer incident.
+        """
+        pending = STATE.index_render
+        if pending is not None and pending[0] == incident.version:
+            wait([pending[1]])
+        
+        cached = STATE.index_cache
+        if cached is not None and cached[0] == incident.version:
+            return cached[1][len(_INDEX_HEAD_BYTES):-len(_INDEX_SCRIPT_BYTES)].decode()
+        return "".join(self._iter_results_html(incident))
+    
+    def _cache_index_page(self, incident: IncidentSnapshot):
+        """Render the main page for a newly stored incident into the page cache."""
+        page = b"".join(self._iter_index_bytes(incident))
+        cached = (incident.version, page, gzip.compress(page, 9), _etag(page))
+        # A newer incident may have been stored while this one was rendering
+        if STATE.incident is incident:
+            STATE.index_cache = cached
+    
+    def serve_examples(self):
+        """Serve the example incident scenarios, which only change with the code."""
+        self._send_bytes(200, 'application/json', _EXAMPLES_JSON, _EXAMPLES_GZIP, _EXAMPLES_ETAG,
+                         EXAMPLES_CACHE_CONTROL)
+    
+    def serve_static(self, name):
+        """
+        Serve a file from STATIC_DIR with a long-lived cache lifetime.
+        
+        Gzip responses come from memory; otherwise the file is copied to the socket
+        by the kernel with sendfile (socket.sendfile falls back to plain sends where
+        that is unavailable).
+        """
+        asset = _STATIC_ASSETS.get(name)
+        if asset is None:
+            self.send_error(404, "Not Found")
+            return
+        
+        content_type, path, size, gzipped, _ = asset
+        use_gzip = gzipped is not None and self._accepts_gzip()
+        
+        self.send_response(200)
+        self.send_header('Content-type', content_type)
+        self.send_header('Content-Length', str(len(gzipped) if use_gzip else size))
+        self.send_header('Cache-Control', STATIC_CACHE_CONTROL)
+        if gzipped is not None:
+            self.send_header('Vary', 'Accept-Encoding')
+        if use_gzip:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        
+        if use_gzip:
+            self.wfile.write(gzipped)
+        else:
+            self.wfile.flush()
+            with open(path, 'rb') as f:
+                self.connection.sendfile(f)
+    
+    def serve_incident_data(self):
+        """Serve current incident data as JSON, serialized when the incident was stored."""
+        incident = STATE.incident
+        if incident is None:
+            self._send_json(404, {"error": "No incident data"})
+            return
+        
+        self._send_bytes(200, 'application/json', incident.json_bytes)
+    
+    def serve_teams_data(self):
+        """Serve teams information as JSON."""
+        if STATE.master_agent is None:
+            self._send_json(500, {"error": "Master agent not initialized"})
+            return
+        
+        agents = STATE.master_agent.slave_agents
+        cached = STATE.teams_cache
+        if cached is None or cached[0] is not agents:
+            teams = [agent.get_team_info() for agent in agents]
+            body = _json_bytes(teams)
+            gzipped = gzip.compress(body, 9) if len(body) >= GZIP_MIN_SIZE else None
+            cached = (agents, body, gzipped, _etag(body))
+            STATE.teams_cache = cached
+        
+        self._send_bytes(200, 'application/json', cached[1], cached[2], cached[3])
+    
+    def _read_json_body(self):
+        """
+        Read and parse a JSON object from the request body.
+        
+        Returns:
+            The parsed object, or None if the request was invalid and an error
+            response has been sent
+        """
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.close_connection = True
+            self._send_json(400, {"error": "Invalid Content-Length"})
+            return None
+        if content_length > MAX_BODY_SIZE:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self._send_json(413, {"error": "Request body too large"})
+            return None
+        
+        try:
+            data = _json_loads(self.rfile.read(content_length))
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            self._send_json(400, {"error": "Request body must be a JSON object"})
+            return None
+        return data
+    
+    def _read_incident_request(self):
+        """
+        Parse an incident report from the request body.
+        
+        Returns:
+            Tuple of (full_description, deadline, incident_report, request_key), or
+            None if the request was invalid and an error response has been sent.
+            request_key is a digest of the report with its keys sorted, equal for
+            identical reports however their JSON is formatted.
+        """
+        data = self._read_json_body()
+        if data is None:
+            return None
+        
+        try:
+            full_description, deadline, incident_report = self._parse_incident_report(data)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+            return None
+        
+        request_key = hashlib.blake2b(_canonical_json(data), digest_size=16).digest()
+        return full_description, deadline, incident_report, request_key
+    
+    def _parse_incident_report(self, data):
+        """
+        Build the agents' description and the stored report from one incident's fields.
+        
+        Returns:
+            Tuple of (full_description, deadline, incident_report)
+            
+        Raises:
+            ValueError: If the incident has no description or a field has the wrong type
+        """
+        # Extract comprehensive incident report data; missing and null fields take their defaults
+        report: IncidentReport = {}
+        for key, default in _REPORT_DEFAULTS:
+            value = data.get(key)
+            if value is None:
+                value = default
+            elif not isinstance(value, str):
+                raise ValueError(f"{key} must be a string")
+            report[key] = value
+        
+        if not report['description']:
+            raise ValueError("Incident description required")
+        
+        hours = data.get('hours_to_deadline', 24)
+        if (isinstance(hours, bool) or not isinstance(hours, (int, float))
+                or not math.isfinite(hours) or not 0 < hours <= MAX_DEADLINE_HOURS):
+            raise ValueError(f"hours_to_deadline must be a number of hours between 0 and {MAX_DEADLINE_HOURS}")
+        
+        # Build comprehensive incident description for agents
+        parts = [f"{report['title']}: {report['description']}"]
+        for key, label in _DESCRIPTION_FIELDS:
+            value = report[key]
+            if value:
+                if key == 'severity':
+                    value = value.upper()
+                parts.append(f"{label}: {value}")
+        full_description = " | ".join(parts)
+        
+        # Calculate deadline; the report is timestamped with the same moment
+        now = datetime.now()
+        deadline = now + timedelta(hours=hours)
+        
+        # Fields are kept as submitted; the page escapes them when it renders the overview
+        report['reported_at'] = now.isoformat()
+        
+        return full_description, deadline, report
+    
+    def _store_incident(self, incident_data, incident_report) -> IncidentSnapshot:
+        """
+        Attach the report metadata and keep the incident for later page loads.
         
-        return html
+        Returns:
+            The stored snapshot, including the incident serialized as JSON
+        """
+        incident_data['incident_report'] = incident_report
+        incident_json = _json_bytes(incident_data)
+        
+        # Store in the shared server state so it persists across requests
+        with STATE_LOCK:
+            version = STATE.incident.version + 1 if STATE.incident else 1
+            incident = IncidentSnapshot(version, incident_data, incident_json)
+            STATE.incident = incident
+        
+        # Render the page in the background, so page loads for this incident are served
+        # from the cache without holding up this response
+        STATE.index_render = (version, RENDER_EXECUTOR.submit(self._cache_index_page, incident))
+        return incident
+    
+    def _plan_incident(self, full_description, deadline, incident_report) -> bytes:
+        """Coordinate the response to an incident, store it and return it as JSON."""
+        # Handle incident with comprehensive description
+        incident_data = STATE.master_agent.handle_incident(full_description, deadline)
+        return self._store_incident(incident_data, incident_report).json_bytes
+    
+    def _submit_incident(self, full_description, deadline, incident_report, request_key) -> Future:
+        """
+        Plan an incident on JOB_EXECUTOR, or join an identical one already being planned.
+        
+        Returns:
+            A future for the incident's JSON
+        """
+        with _inflight_lock:
+            future = _inflight.get(request_key)
+            if future is not None:
+                return future
+            future = JOB_EXECUTOR.submit(self._plan_incident, full_description, deadline, incident_report)
+            _inflight[request_key] = future
+        
+        def forget(done):
+            with _inflight_lock:
+                if _inflight.get(request_key) is done:
+                    del _inflight[request_key]
+        
+        # Added outside the lock: it runs right away if the plan has already finished
+        future.add_done_callback(forget)
+        return future
+    
+    def handle_create_incident(self):
+        """Handle incident creation request."""
+        request = self._read_incident_request()
+        if request is None:
+            return
+        
+        try:
+            incident_json = self._submit_incident(*request).result()
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        self._send_bytes(200, 'application/json', _success_json(incident_json))
+    
+    def handle_create_incident_batch(self):
+        """
+        Handle several incidents in one request, planned together with handle_batch.
+        
+        Results keep the order of the submitted incidents; an invalid incident gets an
+        error in its place without failing the others. The last valid incident becomes
+        the one shown on the main page.
+        """
+        data = self._read_json_body()
+        if data is None:
+            return
+        items = data.get('incidents')
+        if not isinstance(items, list) or not items:
+            self._send_json(400, {"error": "incidents must be a non-empty array"})
+            return
+        if len(items) > MAX_BATCH_SIZE:
+            self._send_json(413, {"error": f"At most {MAX_BATCH_SIZE} incidents per batch"})
+            return
+        
+        parsed = []
+        for item in items:
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("Incident must be a JSON object")
+                parsed.append(self._parse_incident_report(item))
+            except ValueError as e:
+                parsed.append(str(e))
+        
+        planned = [request for request in parsed if not isinstance(request, str)]
+        incidents = iter(STATE.master_agent.handle_batch(
+            [(full_description, deadline) for full_description, deadline, _ in planned]
+        ))
+        
+        results = []
+        latest = None
+        for request in parsed:
+            if isinstance(request, str):
+                results.append({"success": False, "error": request})
+                continue
+            incident_data = next(incidents)
+            incident_data['incident_report'] = request[2]
+            results.append({"success": True, "data": incident_data})
+            latest = incident_data
+        
+        if latest is not None:
+            self._store_incident(latest, latest['incident_report'])
+        self._send_json(200, {"results": results})
+    
+    def handle_create_incident_job(self):
+        """Start coordinating an incident in the background and return a job id to poll."""
+        request = self._read_incident_request()
+        if request is None:
+            return
+        
+        job_id = uuid.uuid4().hex
+        future = self._submit_incident(*request)
+        with _jobs_lock:
+            _jobs[job_id] = future
+            while len(_jobs) > MAX_JOBS:
+                _jobs.popitem(last=False)
+        
+        self._send_json(202, {"job_id": job_id})
+    
+    def serve_incident_job(self, job_id):
+        """Serve the state of a background incident job, with its result once done."""
+        with _jobs_lock:
+            future = _jobs.get(job_id)
+        
+        if future is None:
+            self._send_json(404, {"error": "Unknown job"})
+        elif not future.done():
+            self._send_json(202, {"job_id": job_id, "status": "running"})
+        elif future.exception() is not None:
+            self._send_json(500, {"error": str(future.exception())})
+        else:
+            self._send_bytes(200, 'application/json', _success_json(future.result()))
+    
+    def handle_create_incident_stream(self):
+        """Handle incident creation, streaming each team's proposals as server-sent events."""
+        request = self._read_incident_request()
+        if request is None:
+            return
+        full_description, deadline, incident_report, _ = request
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        self.wfile.flush()
+        
+        # The 200 is already sent, so a failure is reported as an error event instead
+        try:
+            for event in STATE.master_agent.stream_incident(full_description, deadline):
+                if event["type"] == "summary":
+                    incident = self._store_incident(event["result"], incident_report)
+                    # The page shows the results in place, so it does not reload the whole page
+                    payload = (b'{"success":true,"data":' + incident.json_bytes
+                               + b',"results_html":' + _json_bytes(self._results_html(incident)) + b'}')
+                else:
+                    payload = _json_bytes(event)
+                self._send_event(event['type'], payload)
+        except Exception as e:
+            self._send_event("error", _json_bytes({"error": str(e)}))
+    
+    def _send_event(self, event_type: str, payload: bytes):
+        """Write one server-sent event and flush it to the client."""
+        self.wfile.write(b"event: " + event_type.encode() + b"\ndata: " + payload + b"\n\n")
+        self.wfile.flush()
+    
+    def _generate_internals_html(self, data):
+        """Generate HTML explaining the internal coordination process."""
+        if not data:
+            return ""
+        
+        assignments = data.get('assignments', [])
+        
+        parts = [_INTERNALS_HEAD_HTML]
+        
+        # Add team-specific analysis
+        for assignment in assignments:
+            team_name = escape(assignment.get('team_name', 'Unknown Team'), quote=False)
+            task_count = assignment.get('task_count', 0)
+            
+            parts.append(f"""
+            <div style="background: white; padding: 15px; border-radius: 6px; margin-bottom: 15px; border-left: 4px solid #f59e0b;">
+                <h4 style="margin: 0 0 10px 0; color: #d97706;">👥 {team_name}</h4>
+                <p style="margin: 0 0 8px 0; color: #4b5563; font-size: 14px;">
+                    <strong>Relevance Analysis:</strong> This team calculated their relevance score by matching incident keywords 
+                    with their expertise areas and checking for similar past incidents.
+                </p>
+                <p style="margin: 0 0 8px 0; color: #4b5563; font-size: 14px;">
+                    <strong>Task Generation:</strong> Based on relevance, the team agent proposed <strong>{task_count} tasks</strong> 
+                    by analyzing:
+                </p>
+                <ul style="margin: 0; padding-left: 20px; color: #4b5563; font-size: 13px;">
+                    <li>Current team capacity from JIRA</li>
+                    <li>Relevant runbooks from Confluence</li>
+                    <li>Team member availability from Slack</li>
+                    <li>Historical incident response patterns</li>
+                </ul>
+            </div>
+            """)
+        
+        parts.append(_INTERNALS_TAIL_HTML)
+        
+        return "".join(parts)
+    
+    def _generate_teams_list_html(self, data):
+        """Generate HTML list of teams involved in the incident response."""
+        if not data:
+            return ""
+        
+        assignments = data.get('assignments', [])
+        if not assignments:
+            return ""
+        
+        parts = [_TEAMS_LIST_HEAD_HTML]
+        
+        for assignment in assignments:
+            team_name = escape(assignment.get('team_name', 'Unknown Team'), quote=False)
+            task_count = assignment.get('task_count', 0)
+            parts.append(f"""
+                <div style="background: white; padding: 8px 12px; border-radius: 6px; border: 1px solid #e5e7eb; font-size: 13px;">
+                    <strong>{team_name}</strong> <span style="color: #6b7280;">({task_count} tasks)</span>
+                </div>
+            """)
+        
+        parts.append(_TEAMS_LIST_TAIL_HTML)
+        
+        return "".join(parts)
+    
+    def _generate_incident_overview_html(self, data):
+        """Generate HTML for incident overview with comprehensive details."""
+        if not data:
+            return ""
+        
+        report = data.get('incident_report', {})
+        
+        severity = report.get('severity', 'medium')
+        badge = SEVERITY_BADGES.get(severity)
+        if badge is None:
+            badge = _BADGE_TEMPLATE.format(color=_DEFAULT_SEVERITY_COLOR, label=escape(severity.upper()))
+        title = escape(report.get('title', data.get('incident', 'Incident')))
+        
+        parts = [f"""
+        <h3>{title}</h3>
+        {badge}
+        <p style="margin-top: 15px;"><strong>Description:</strong> {escape(report.get('description', 'N/A'))}</p>
+        """]
+        
+        for key, label in _OVERVIEW_FIELDS:
+            value = report.get(key)
+            if value:
+                if key == 'detection_method':
+                    value = value.replace('_', ' ').title()
+                parts.append(f"<p><strong>{label}:</strong> {escape(value)}</p>")
+        
+        parts.append(f"<p><strong>Deadline:</strong> {data.get('deadline', '')}</p>")
+        
+        return "".join(parts)
+    
+    def generate_index_html(self):
+        """Generate the main HTML page for the current incident."""
+        return "".join(self.iter_index_html(STATE.incident))
+    
+    def iter_index_html(self, incident: Optional[IncidentSnapshot]):
+        """Generate the main HTML page for an incident as a stream of fragments."""
+        yield _INDEX_HEAD
+        yield from self._iter_results_html(incident)
+        yield _INDEX_SCRIPT
+    
+    def _iter_index_bytes(self, incident: Optional[IncidentSnapshot]):
+        """Generate the main HTML page as UTF-8 fragments; the static parts are encoded once."""
+        yield _INDEX_HEAD_BYTES
+        for chunk in self._iter_results_html(incident):
+            yield chunk.encode()
+        yield _INDEX_SCRIPT_BYTES
+    
+    def _iter_results_html(self, incident: Optional[IncidentSnapshot]):
+        """Generate the part of the main page that shows an incident."""
+        data = incident.data if incident else None
+        if not data:
+            yield _EMPTY_RESULTS_HTML
+            return
+        
+        graph_html = STATE.master_agent.generate_graph_html(
+            data["task_graph"]
+        )
+        
+        yield f"""
+        
+        <div id="results" style="display: block;">
+            <div class="section">
+                <div class="section-title">📊 Incident Overview</div>
+                <div class="incident-info">
+                    {self._generate_incident_overview_html(data)}
+                </div>
+                <div class="stats">
+                    <div class="stat-card">
+                        <div class="stat-value">{data.get('total_tasks', 0)}</div>
+                        <div class="stat-label">Total Tasks</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="stat-value">{data.get('teams_involved', 0)}</div>
+                        <div class="stat-label">Teams Involved</div>
+                    </div>
+                </div>
+                {self._generate_teams_list_html(data)}
+            </div>
+            
+            <div class="section">
+                <div class="section-title">🕸️ Task Dependency Graph</div>
+                {graph_html if graph_html else '<div class="no-data">No graph data available</div>'}
+            </div>
+            
+            <div class="section">
+                <div class="section-title">📋 Task Assignments</div>
+                """
+        
+        yield from STATE.master_agent.iter_assignments_html(data["assignments"])
+        
+        yield f"""
+            </div>
+            
+            <div class="section">
+                <button onclick="toggleInternals()" class="btn" style="width: 100%; background: linear-gradient(135deg, #10b981 0%, #059669 100%);">
+                    🔍 See Internals - How We Generated This Response
+                </button>
+                
+                <div id="internals" style="display: none; margin-top: 20px;">
+                    {self._generate_internals_html(data)}
+                </div>
+            </div>
+        </div>"""
+    
+    def address_string(self):
+        """Return the client IP for log lines, without any name lookup."""
+        return self.client_address[0]
+    
+    def log_request(self, code='-', size='-'):
+        """Log an accepted request, unless ACCESS_LOG is turned off; errors are always logged."""
+        if config.ACCESS_LOG:
+            super().log_request(code, size)
     
     def log_message(self, format, *args):
-        """Override to customize logging."""
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        """Queue a request log line for the log listener thread."""
+        _request_log.info("[%s] %s", self.log_date_time_string(), format % args)
 
 
 def start_server(team_info_directory: str, port: int = 8000):
@@ -896,7 +1769,10 @@ def start_server(team_info_directory: str, port: int = 8000):
     
     # Initialize master agent
     print("Initializing master agent...")
-    IncidentResponseHandler.master_agent = IncidentMasterAgent(team_info_directory)
+    STATE.master_agent = IncidentMasterAgent(team_info_directory)
+    
+    # Load the team agents in the background, so the first incident does not wait on them
+    threading.Thread(target=lambda: STATE.master_agent.slave_agents, name="agent-preload", daemon=True).start()
     
     print(f"\n{'='*80}")
     print(f"Server starting on http://localhost:{port}")
@@ -905,7 +1781,8 @@ def start_server(team_info_directory: str, port: int = 8000):
     print(f"  → http://localhost:{port}")
     print("\nPress Ctrl+C to stop the server\n")
     
-    server = HTTPServer(('localhost', port), IncidentResponseHandler)
+    # Connections are served from a thread pool, so a page load is not stuck behind an incident being planned
+    server = IncidentHTTPServer(('localhost', port), IncidentResponseHandler)
     
     try:
         server.serve_forever()
@@ -916,8 +1793,6 @@ def start_server(team_info_directory: str, port: int = 8000):
 
 
 if __name__ == "__main__":
-    import sys
-    
     team_info_dir = os.path.join(os.path.dirname(__file__), 'team_info')
     port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
     